@@ -0,0 +1 @@
+default_app_config = 'wald.dictionary.apps.dictionaryConfig'
@@ -12,7 +12,7 @@ from django.urls import reverse
 from django.template import RequestContext, loader
 from django.template.loader import render_to_string
 from django.db import connection
-from django.db.models import Q
+from django.db.models import Q, F
 from django.db.models.functions import Lower
 from django.http import JsonResponse
 from datetime import datetime
@@ -32,6 +32,9 @@ from wald.dictionary.forms import *
 from wald.mapview.views import MapView
 from wald.settings import APP_PREFIX, WSGI_FILE
 from wald.dictionary.conversion import rd_to_wgs, wgs_to_rd
+from wald.dictionary.search import adapt_search, search_q
+from wald.dictionary.grouping import get_item_list
+from wald.dictionary.paging import KeysetPaginator
 
 # Global variables
 paginateSize = 10
@@ -101,64 +104,6 @@ def order_queryset_by_sort_order(get, qs, sOrder = 'gloss'):
     # return the ordered list
     return ordered
 
-def get_item_list(lVar, lFun, qs):
-    """Turn the queryset [qs] into a list of Items that have first and last information"""
-
-    lItem = []
-    oErr = ErrHandle()
-    try:
-        # Initialize the variables whose changes are important
-        oVariable = {}
-        for i, key in enumerate(lVar):
-            oVariable[key] = "" # {'name': key, 'fun': lFun[i]}
-        iLast = len(qs)-1
-        # Iterate over the entries looking for first, last etc
-        for i, entry in enumerate(qs):
-            bIsLastEntry = (i==iLast)
-            oItem = {'entry': entry}
-            for k in lVar:
-                oItem[k] = {'first':False, 'last':False}
-            bIsDict = isinstance(entry, dict)
-            bVarIsLast = False
-            # Check for changes in all the variables
-            for j, k in enumerate(lVar):
-                fun = lFun[j]
-                if callable(fun):
-                    sValue = fun(entry)
-                else:
-                    for idx, val in enumerate(fun):
-                        if idx==0:
-                            if bIsDict:
-                                sValue = entry[val]
-                            else:
-                                sValue = getattr(entry, val)
-                        else:
-                            if bIsDict:
-                                sValue = sValue[val]
-                            else:
-                                sValue = getattr(sValue, val)
-                # Check for changes in the value of the variable 
-                # if sValue != oVariable[k]:
-                if sValue != oVariable[k] or bVarIsLast or (i>0 and lItem[i-1][k]['last']):
-                    # Check if the previous one's [last] must be changed
-                    if oVariable[k] != "": lItem[i-1][k]['last'] = True
-                    # Adapt the current one's [first] property
-                    oItem[k]['first']= True
-                    # Adapt the variable
-                    oVariable[k] = sValue      
-                    # Indicate that the next ones should be regarded as 'last'
-                    bVarIsLast = True      
-                # Check if this is the last
-                if bIsLastEntry: oItem[k]['last'] = True
-            # Add this object to the list of items
-            lItem.append(oItem)
-    except:
-        oErr.DoError("get_item_list error")
-        lItem = []
-
-    # Return the list we have made
-    return lItem
-
 def home(request, errortype=None):
     """Renders the home page."""
 
@@ -329,18 +274,6 @@ def do_repair(request):
         }
     )
 
-def adapt_search(val):
-    # First trim
-    val = val.strip()    
-    # Adapt for the use of '#'
-    if '#' in val:
-        # val = val.replace('#', '\\b.*')
-        #val = r'(^|\b)' + fnmatch.translate(val.replace('#', '')) + r'($|\b)'
-        val = r'(^|(.*\b))' + val.replace('#', r'((\b.*)|$)') # + r'((\b.*)|$)'
-    else:
-        val = '^' + fnmatch.translate(val) + '$'
-    return val
-
 def export_csv(qs, sFileName):
     # Create the HttpResponse object with the appropriate CSV header.
     response = HttpResponse(content_type='text/csv')
@@ -442,6 +375,9 @@ def do_repair_start(request):
         if not bResult:
             data['status'] = "error"
 
+    # Repairs change what the list views show
+    ListCache.clear()
+
     # Return this response
     return JsonResponse(data)
 
@@ -513,6 +449,9 @@ def import_csv_start(request):
         if oResult == None or oResult['result'] == False:
             data['status'] = 'error'
 
+        # Imports change what the list views show
+        ListCache.clear()
+
         # WSince we are done: explicitly set the status so
         oStatus.set_status("done")
     except Exception as ex:
@@ -609,6 +548,9 @@ def import_update_start(request, pk):
         if oResult == None or oResult['result'] == False:
             data['status'] = 'error'
 
+        # Imports change what the list views show
+        ListCache.clear()
+
         # WSince we are done: explicitly set the status so
         oStatus.set_status("done")
     except Exception as ex:
@@ -767,6 +709,7 @@ class TrefwoordListView(ListView):
     # paginate_by = paginateEntries
     paginate_by = paginateSize
     entrycount = 0
+    listcache = None    # The [ListCache] item of the current list
     bUseMijnen = False  # Limburg uses mijnen, Brabant not
     bWbdApproach = True # Filter using the WBD approach
     qEntry = None
@@ -782,7 +725,7 @@ class TrefwoordListView(ListView):
                 # Get the PKs of Entry related to Trefwoord
                 qs = self.get_queryset()
             # Get the Entry queryset related to this
-            qs = Entry.objects.filter(trefwoord__pk__in=qs).select_related()
+            qs = Entry.objects.filter(trefwoord__pk__in=qs.order_by().values('id')).select_related()
         else:
             qs = self.qEntry
         return qs
@@ -946,6 +889,11 @@ class TrefwoordListView(ListView):
         """
         return self.request.GET.get('paginate_by', self.paginate_by)
 
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        """Use the cached count and the page cursors of this list"""
+        return KeysetPaginator(queryset, per_page, self.listcache, orphans=orphans,
+                               allow_empty_first_page=allow_empty_first_page, **kwargs)
+
     def get_entryset(self, page_obj):
         lstQ = []
         bHasSearch = False
@@ -968,42 +916,38 @@ class TrefwoordListView(ListView):
 
         # Check for dialectwoord
         if 'dialectwoord' in get and get['dialectwoord'] != '':
-            val = adapt_search(get['dialectwoord'])
             # Adapt Entry filter
             if self.strict:
-                lstQ.append(Q(woord__iregex=val))
+                lstQ.append(search_q(Entry, 'woord', get['dialectwoord']))
             else:
-                lstQ.append(Q(entry__woord__iregex=val))
+                lstQ.append(search_q(Entry, 'entry__woord', get['dialectwoord']))
             bHasFilter = True
 
         # Check for lemma
         if 'lemma' in get and get['lemma'] != '':
-            val = adapt_search(get['lemma'])
             # Adapt Entry filter
             if self.strict:
-                lstQ.append(Q(lemma__gloss__iregex=val))
+                lstQ.append(search_q(Entry, 'lemma__gloss', get['lemma']))
             else:
-                lstQ.append(Q(entry__lemma__gloss__iregex=val))
+                lstQ.append(search_q(Entry, 'entry__lemma__gloss', get['lemma']))
             bHasFilter = True
 
         # Check for dialect city
         if 'dialectCity' in get and get['dialectCity'] != '':
-            val = adapt_search(get['dialectCity'])
             # Adapt Entry filter
             if self.strict:
-                lstQ.append(Q(dialect__stad__iregex=val))
+                lstQ.append(search_q(Entry, 'dialect__stad', get['dialectCity']))
             else:
-                lstQ.append(Q(entry__dialect__stad__iregex=val))
+                lstQ.append(search_q(Entry, 'entry__dialect__stad', get['dialectCity']))
             bHasFilter = True
 
         # Check for dialect code (Kloeke)
         if 'dialectCode' in get and get['dialectCode'] != '':
-            val = adapt_search(get['dialectCode'])
             # Adapt Entry filter
             if self.strict:
-                lstQ.append(Q(dialect__nieuw__iregex=val))
+                lstQ.append(search_q(Entry, 'dialect__nieuw', get['dialectCode']))
             else:
-                lstQ.append(Q(entry__dialect__nieuw__iregex=val))
+                lstQ.append(search_q(Entry, 'entry__dialect__nieuw', get['dialectCode']))
             bHasFilter = True
 
         # Check for aflevering
@@ -1034,7 +978,7 @@ class TrefwoordListView(ListView):
 
         # Order: "trefwoord_woord", "lemma_gloss", "dialectopgave", "dialect_stad"
         # Make sure we apply the filter
-        qse = Entry.objects.filter(*lstQ).distinct().select_related().order_by(
+        qse = Entry.objects.filter(*lstQ).distinct().select_related(*Entry.listing_related).prefetch_related(*Entry.listing_prefetch).order_by(
             Lower('trefwoord__woord'), 
             'lemma__gloss',  
             Lower('toelichting'),
@@ -1062,12 +1006,7 @@ class TrefwoordListView(ListView):
         # Fine-tuning: search string is the LEMMA
         if 'search' in get and get['search'] != '':
             val = get['search']
-            if '*' in val or '[' in val or '?' in val or '#' in val:
-                val = adapt_search(val)
-                lstQ.append(Q(woord__iregex=val) )
-            else:
-                # Strive for equality, but disregard case
-                lstQ.append(Q(woord__iexact=val))
+            lstQ.append(search_q(Trefwoord, 'woord', val))
             #val = adapt_search(get['search'])
             ## Use the 'woord' attribute of Trefwoord
             #lstQ.append(Q(woord__iregex=val) )
@@ -1079,37 +1018,32 @@ class TrefwoordListView(ListView):
 
         # Check for 'toelichting'
         if 'toelichting' in get and get['toelichting'] != '':
-            val = adapt_search(get['toelichting'])
             # Try to get to the 'toelichting'
-            lstQ.append(Q(toelichting__iregex=val))
+            lstQ.append(search_q(Trefwoord, 'toelichting', get['toelichting']))
             bHasSearch = True
 
         # Check for dialectwoord
         if 'dialectwoord' in get and get['dialectwoord'] != '':
-            val = adapt_search(get['dialectwoord'])
             # Adapt Entry filter
-            lstQ.append(Q(entry__woord__iregex=val))
+            lstQ.append(search_q(Trefwoord, 'entry__woord', get['dialectwoord']))
             bHasFilter = True
 
         # Check for lemma
         if 'lemma' in get and get['lemma'] != '':
-            val = adapt_search(get['lemma'])
             # Adapt Entry filter
-            lstQ.append(Q(entry__lemma__gloss__iregex=val))
+            lstQ.append(search_q(Trefwoord, 'entry__lemma__gloss', get['lemma']))
             bHasFilter = True
 
         # Check for dialect city
         if 'dialectCity' in get and get['dialectCity'] != '':
-            val = adapt_search(get['dialectCity'])
             # Adapt Entry filter
-            lstQ.append(Q(entry__dialect__stad__iregex=val))
+            lstQ.append(search_q(Trefwoord, 'entry__dialect__stad', get['dialectCity']))
             bHasFilter = True
 
         # Check for dialect code (Kloeke)
         if 'dialectCode' in get and get['dialectCode'] != '':
-            val = adapt_search(get['dialectCode'])
             # Adapt Entry filter
-            lstQ.append(Q(entry__dialect__nieuw__iregex=val))
+            lstQ.append(search_q(Trefwoord, 'entry__dialect__nieuw', get['dialectCode']))
             bHasFilter = True
 
         # Check for aflevering
@@ -1138,11 +1072,9 @@ class TrefwoordListView(ListView):
         # Debugging: mesaure time
         if self.bDoTime: iStart = get_now_time()
 
-        # Figure out which trefwoorden to exclude
-        trefwoord_exclude = Trefwoord.objects.filter(toonbaar=0)
-
-        # Create a QSE
-        qse = Trefwoord.objects.exclude(id__in=trefwoord_exclude).filter(*lstQ).select_related().order_by(Lower('woord')).distinct()
+        # Hidden trefwoorden are left out by their own [toonbaar] field, which needs no subquery
+        qse = Trefwoord.objects.exclude(toonbaar=0).filter(*lstQ).select_related().annotate(
+            sortkey=Lower('woord')).order_by('sortkey', 'id').distinct()
 
         # Debugging: time
         if self.bDoTime: 
@@ -1151,9 +1083,9 @@ class TrefwoordListView(ListView):
 
         # Note the number of ITEMS we have
         #   (The nature of these items depends on the approach taken)
-        # self.entrycount = qse.count()
-        # Using 'len' is faster since [qse] is being actually used again
-        self.entrycount = len(qse)
+        # The count is cached per filter, so that [qse] need not be loaded as a whole
+        self.listcache = ListCache.get_item("trefwoord", get, qse)
+        self.entrycount = self.listcache.count
 
         # Debugging: time
         if self.bDoTime: 
@@ -1172,6 +1104,7 @@ class LemmaListView(ListView):
     # paginate_by = paginateEntries
     paginate_by = paginateSize
     entrycount = 0
+    listcache = None    # The [ListCache] item of the current list
     bUseMijnen = False      # Limburg uses mijnen, Brabant not
     bWbdApproach = True     # Filter using the WBD approach
     bOrderWrdToel = False   # Use the word order 'dialectopgave-toelichting' if True
@@ -1190,7 +1123,7 @@ class LemmaListView(ListView):
                 # Get the Lemma PKs
                 qs = self.get_queryset()
             # Get the Entry queryset related to this
-            qs = Entry.objects.filter(lemma__pk__in=qs).select_related()
+            qs = Entry.objects.filter(lemma__pk__in=qs.order_by().values('id')).select_related()
         else:
             qs = self.qEntry
         return qs
@@ -1498,6 +1431,11 @@ class LemmaListView(ListView):
         Paginate by specified value in querystring, or use default class property value.
         """
         return self.request.GET.get('paginate_by', self.paginate_by)
+
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        """Use the cached count and the page cursors of this list"""
+        return KeysetPaginator(queryset, per_page, self.listcache, orphans=orphans,
+                               allow_empty_first_page=allow_empty_first_page, **kwargs)
         
     def get_entryset(self, page_obj):
         lstQ = []
@@ -1521,29 +1459,26 @@ class LemmaListView(ListView):
 
         # Check for dialect city
         if 'dialectCity' in get and get['dialectCity'] != '':
-            val = adapt_search(get['dialectCity'])
             if self.strict:
-                lstQ.append(Q(dialect__stad__iregex=val))
+                lstQ.append(search_q(Entry, 'dialect__stad', get['dialectCity']))
             else:
-                lstQ.append(Q(entry__dialect__stad__iregex=val))
+                lstQ.append(search_q(Entry, 'entry__dialect__stad', get['dialectCity']))
             bHasFilter = True
 
         # Check for dialect code (Kloeke)
         if 'dialectCode' in get and get['dialectCode'] != '':
-            val = adapt_search(get['dialectCode'])
             if self.strict:
-                lstQ.append(Q(dialect__nieuw__iregex=val))
+                lstQ.append(search_q(Entry, 'dialect__nieuw', get['dialectCode']))
             else:
-                lstQ.append(Q(entry__dialect__nieuw__iregex=val))
+                lstQ.append(search_q(Entry, 'entry__dialect__nieuw', get['dialectCode']))
             bHasFilter = True
 
         # Check for dialect word, which is a direct member of Entry
         if 'woord' in get and get['woord'] != '':
-            val = adapt_search(get['woord'])
             if self.strict:
-                lstQ.append(Q(woord__iregex=val))
+                lstQ.append(search_q(Entry, 'woord', get['woord']))
             else:
-                lstQ.append(Q(entry__woord__iregex=val))
+                lstQ.append(search_q(Entry, 'entry__woord', get['woord']))
             bHasFilter = True
 
         # Check for aflevering
@@ -1584,14 +1519,14 @@ class LemmaListView(ListView):
         # Order: "lemma_gloss", "trefwoord_woord", "dialectopgave", "dialect_stad"
         if self.bDoTime: iStart = get_now_time()
         if self.bOrderWrdToel:
-            qse = Entry.objects.filter(*lstQ).distinct().select_related().order_by(
+            qse = Entry.objects.filter(*lstQ).distinct().select_related(*Entry.listing_related).prefetch_related(*Entry.listing_prefetch).order_by(
                 Lower('lemma__gloss'),  
                 Lower('trefwoord__woord'), 
                 Lower('woord'), 
                 Lower('toelichting'), 
                 Lower('dialect__stad'))
         else:
-            qse = Entry.objects.filter(*lstQ).distinct().select_related().order_by(
+            qse = Entry.objects.filter(*lstQ).distinct().select_related(*Entry.listing_related).prefetch_related(*Entry.listing_prefetch).order_by(
                 Lower('lemma__gloss'),  
                 Lower('trefwoord__woord'), 
                 Lower('toelichting'), 
@@ -1622,12 +1557,7 @@ class LemmaListView(ListView):
         # Fine-tuning: search string is the LEMMA
         if 'search' in get and get['search'] != '':
             val = get['search']
-            if '*' in val or '[' in val or '?' in val or '#' in val:
-                val = adapt_search(val)
-                lstQ.append(Q(gloss__iregex=val) )
-            else:
-                # Strive for equality, but disregard case
-                lstQ.append(Q(gloss__iexact=val))
+            lstQ.append(search_q(Lemma, 'gloss', val))
             bHasSearch = True
 
             # check for possible exact numbers having been given
@@ -1637,30 +1567,18 @@ class LemmaListView(ListView):
         # Check for dialect city
         if 'dialectCity' in get and get['dialectCity'] != '':
             val = get['dialectCity']
-            if '*' in val or '[' in val or '?' in val or '#' in val:
-                # val = adapt_search(get['dialectCity'])
-                val = adapt_search(val)
-                lstQ.append(Q(entry__dialect__stad__iregex=val))
-            else:
-                # Strive for equality, but disregard case
-                lstQ.append(Q(entry__dialect__stad__iexact=val))
+            lstQ.append(search_q(Lemma, 'entry__dialect__stad', val))
             bHasFilter = True
 
         # Check for dialect code (Kloeke)
         if 'dialectCode' in get and get['dialectCode'] != '':
             val = get['dialectCode']
-            if '*' in val or '[' in val or '?' in val or '#' in val:
-                val = adapt_search(val)
-                lstQ.append(Q(entry__dialect__nieuw__iregex=val))
-            else:
-                # Strive for equality, but disregard case
-                lstQ.append(Q(entry__dialect__nieuw__iexact=val))
+            lstQ.append(search_q(Lemma, 'entry__dialect__nieuw', val))
             bHasFilter = True
 
         # Check for dialect word, which is a direct member of Entry
         if 'woord' in get and get['woord'] != '':
-            val = adapt_search(get['woord'])
-            lstQ.append(Q(entry__woord__iregex=val))
+            lstQ.append(search_q(Lemma, 'entry__woord', get['woord']))
             bHasFilter = True
 
         # Check for aflevering
@@ -1683,10 +1601,9 @@ class LemmaListView(ListView):
                     lstQ.append(Q(entry__mijnlijst__id=iVal))
                     bHasFilter = True
 
-        # Method #8 -- use the lemma.toonbaar property
-        lemma_hide = Lemma.objects.filter(toonbaar=0)
-
-        qse = Lemma.objects.exclude(id__in=lemma_hide).filter(*lstQ).select_related().order_by('gloss').distinct()
+        # Hidden lemma's are left out by their own [toonbaar] field, which needs no subquery
+        qse = Lemma.objects.exclude(toonbaar=0).filter(*lstQ).select_related().annotate(
+            sortkey=F('gloss')).order_by('sortkey', 'id').distinct()
 
         # Time measurement
         if self.bDoTime:
@@ -1695,9 +1612,9 @@ class LemmaListView(ListView):
 
         # Note the number of ITEMS we have
         #   (The nature of these items depends on the approach taken)
-        # self.entrycount = qse.count()
-        # Note: while taking more time here, it saves time later
-        self.entrycount = len(qse)
+        # The count is cached per filter, so that [qse] need not be loaded as a whole
+        self.listcache = ListCache.get_item("lemma", get, qse)
+        self.entrycount = self.listcache.count
 
         # Time measurement
         if self.bDoTime:
@@ -1713,6 +1630,10 @@ class LemmaMapView(MapView):
     frmSearch = LemmaSearchForm
     order_by = ["trefwoord"]
     labelfield = "gloss"
+    geo_fields = ["trefwoord", "woord", "kloeke", "stad"]
+    popup_type = "lemma"
+    bbox_lat = "dialect__coordinate__latitude"
+    bbox_lng = "dialect__coordinate__longitude"
 
     def initialize(self):
         super(LemmaMapView, self).initialize()
@@ -1746,6 +1667,7 @@ class LocationListView(ListView):
     # paginate_by = paginateEntries # paginateSize
     paginate_by = paginateLocations    # Default pagination number SPECIFICALLY for dialects (1)
     entrycount = 0      # Number of items in queryset (whether Entry or Dialect!!)
+    listcache = None    # The [ListCache] item of the current list
     bUseMijnen = False  # Limburg uses mijnen, Brabant not, Gelderland neither
     bWbdApproach = True # Filter using the WBD approach
     bNewOrder = True    # Use the new order (see issue #22 of the RU-wld)
@@ -1768,7 +1690,7 @@ class LocationListView(ListView):
             # Get the Entry elements that refer to the set of dialects
             if not self.strict:
                 # Convert the [Dialect] elements in qs to [Entry] elements
-                qs = Entry.objects.filter(dialect__pk__in=qs).select_related()
+                qs = Entry.objects.filter(dialect__pk__in=qs.order_by().values('id')).select_related()
         else:
             qs = self.qEntry
         return qs
@@ -1963,6 +1885,11 @@ class LocationListView(ListView):
         """
         return self.request.GET.get('paginate_by', self.paginate_by)
 
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        """Use the cached count and the page cursors of this list"""
+        return KeysetPaginator(queryset, per_page, self.listcache, orphans=orphans,
+                               allow_empty_first_page=allow_empty_first_page, **kwargs)
+
     def get_entryset(self, page_obj):
         lstQ = []
         bHasSearch = False
@@ -2008,14 +1935,14 @@ class LocationListView(ListView):
 
         bUseLower = True
         if bUseLower:
-            qse = Entry.objects.filter(*lstQ).distinct().select_related().order_by(
+            qse = Entry.objects.filter(*lstQ).distinct().select_related(*Entry.listing_related).prefetch_related(*Entry.listing_prefetch).order_by(
                 Lower('dialect__stad'),
                 'lemma__gloss',  
                 Lower('trefwoord__woord'), 
                 Lower('toelichting'), 
                 Lower('woord'))
         else:
-            qse = Entry.objects.filter(*lstQ).distinct().select_related().order_by(
+            qse = Entry.objects.filter(*lstQ).distinct().select_related(*Entry.listing_related).prefetch_related(*Entry.listing_prefetch).order_by(
                 'dialect__stad',
                 'lemma__gloss',  
                 'trefwoord__woord', 
@@ -2059,8 +1986,8 @@ class LocationListView(ListView):
 
         # Fine-tuning: search string is the STAD
         if 'search' in get and get['search'] != '':
+            lstQ.append(search_q(Dialect, 'stad', get['search']))
             val = adapt_search(get['search'])
-            lstQ.append(Q(stad__iregex=val) )
             bHasSearch = True
 
             # check for possible exact numbers having been given
@@ -2070,8 +1997,7 @@ class LocationListView(ListView):
 
         # Check for dialect code (Kloeke)
         if 'nieuw' in get and get['nieuw'] != '':
-            val = adapt_search(get['nieuw'])
-            lstQ.append(Q(nieuw__iregex=val) )
+            lstQ.append(search_q(Dialect, 'nieuw', get['nieuw']))
             bHasSearch = True
 
         # Check for aflevering
@@ -2099,20 +2025,18 @@ class LocationListView(ListView):
             print("LocationListView get_queryset point 'a': {:.1f}".format( get_now_time() - iStart))
             iStart = get_now_time()
 
-        # Get a list of Dialects that should be excluded
-        dialect_hide = Dialect.objects.filter(toonbaar=0)
-
-        # Use the E-WBD approach: be efficient here
-        qs = Dialect.objects.exclude(id__in=dialect_hide).filter(*lstQ).distinct().select_related().order_by(Lower('stad'))
+        # Hidden dialects are left out by their own [toonbaar] field, which needs no subquery
+        qs = Dialect.objects.exclude(toonbaar=0).filter(*lstQ).distinct().select_related().annotate(
+            sortkey=Lower('stad')).order_by('sortkey', 'id')
 
         # Time measurement
         if self.bDoTime:
             print("LocationListView get_queryset point 'c': {:.1f}".format( get_now_time() - iStart))
             iStart = get_now_time()
 
-        # self.entrycount = qs.count()
-        # Using 'len' is faster since [qse] is being actually used again
-        self.entrycount = len(qs)
+        # The count is cached per filter, so that [qs] need not be loaded as a whole
+        self.listcache = ListCache.get_item("location", get, qs)
+        self.entrycount = self.listcache.count
 
         # Time measurement
         if self.bDoTime:
@@ -2130,6 +2054,7 @@ class DialectListView(ListView):
     paginate_by = 10
     template_name = 'dictionary/dialect_list.html'
     entrycount = 0
+    listcache = None    # The [ListCache] item of the current list
     bDoTime = True
     bImportKloekeInfo = False
 
@@ -2176,6 +2101,11 @@ class DialectListView(ListView):
         """
         return self.request.GET.get('paginate_by', self.paginate_by)
 
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        """Use the cached count and the page cursors of this list"""
+        return KeysetPaginator(queryset, per_page, self.listcache, orphans=orphans,
+                               allow_empty_first_page=allow_empty_first_page, **kwargs)
+
     def initialize(self):
         # Check if "Rhede" has been processed
         if Information.get_kvalue("rhede") != "done":
@@ -2251,8 +2181,8 @@ class DialectListView(ListView):
 
         # Fine-tuning: search string is the LEMMA
         if 'search' in get and get['search'] != '':
+            query = search_q(Dialect, 'stad', get['search'])
             val = adapt_search(get['search'])
-            query = Q(stad__iregex=val) 
 
             # check for possible exact numbers having been given
             if re.match('^\d+$', val):
@@ -2263,14 +2193,13 @@ class DialectListView(ListView):
 
         # Check for dialect code (Kloeke)
         if 'nieuw' in get and get['nieuw'] != '':
-            val = adapt_search(get['nieuw'])
-            query = Q(nieuw__iregex=val)
+            query = search_q(Dialect, 'nieuw', get['nieuw'])
             
             # Apply the filter
             lstQ.append(query)
 
         # Calculate the final qs
-        qs = Dialect.objects.exclude(toonbaar=0).filter(*lstQ).order_by('stad').distinct()
+        qs = Dialect.objects.exclude(toonbaar=0).filter(*lstQ).annotate(sortkey=F('stad')).order_by('sortkey', 'id').distinct()
 
         # Time measurement
         if self.bDoTime:
@@ -2278,8 +2207,9 @@ class DialectListView(ListView):
             print("DialectListView query: {}".format(qs.query))
             iStart = get_now_time()
 
-        # Determine the length
-        self.entrycount = len(qs)
+        # Determine the length (cached per filter)
+        self.listcache = ListCache.get_item("dialect", get, qs)
+        self.entrycount = self.listcache.count
 
         # Time measurement
         if self.bDoTime:
@@ -2296,6 +2226,10 @@ class DialectMapView(MapView):
     order_by = ["streek", "stad"]
     use_object = False
     label = "Dialectplaatsen"
+    geo_fields = ["trefwoord", "stad", "kloeke", "count"]
+    popup_type = "dialect"
+    bbox_lat = "coordinate__latitude"
+    bbox_lng = "coordinate__longitude"
 
     def initialize(self):
         super(DialectMapView, self).initialize()
@@ -2527,9 +2461,9 @@ class MijnListView(ListView):
 
         # Fine-tuning: search string is the LEMMA
         if 'search' in get and get['search'] != '':
-            val = adapt_search(get['search'])
             # The main search is on the NAME of the mine
-            query = Q(naam__iregex=val) 
+            query = search_q(Mijn, 'naam', get['search'])
+            val = adapt_search(get['search'])
 
             # check for possible exact numbers having been given
             if re.match('^\d+$', val):
@@ -2540,16 +2474,14 @@ class MijnListView(ListView):
 
         # Check for toelichting
         if 'toelichting' in get and get['toelichting'] != '':
-            val = adapt_search(get['toelichting'])
             # query = Q(nieuw__istartswith=val)
-            query = Q(toelichting__iregex=val)
+            query = search_q(Mijn, 'toelichting', get['toelichting'])
             qs = qs.filter(query)
 
         # Check for locatie
         if 'locatie' in get and get['locatie'] != '':
-            val = adapt_search(get['locatie'])
             # query = Q(nieuw__istartswith=val)
-            query = Q(locatie__iregex=val)
+            query = search_q(Mijn, 'locatie', get['locatie'])
             qs = qs.filter(query)
 
         # Make sure we only have distinct values
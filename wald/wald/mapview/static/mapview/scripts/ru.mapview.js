@@ -37,7 +37,15 @@ var ru = (function ($, ru) {
         loc_overlayMarkers = {},
         loc_colorDict = {},
         loc_trefwoord = [],
-        loc_colors = '#0fba62,#5aa5c4,black,#345beb,#e04eed,#ed4c72,#1e662a,#c92f04,#e39817'.split(',');
+        loc_colors = '#0fba62,#5aa5c4,black,#345beb,#e04eed,#ed4c72,#1e662a,#c92f04,#e39817'.split(','),
+        loc_mapUrl = "",          // URL of the map data that is shown
+        loc_mapData = [],         // Serialized search form of the map that is shown
+        loc_request = 0,          // Number of the latest request: older responses are ignored
+        loc_timer = null,         // Timer that waits for the map to stop moving
+        loc_control = null,       // Layer control (legend) of the markers
+        loc_clusterLayer = null,  // Layer with the clusters
+        loc_maxMarkers = 1000,    // Show markers when the view contains no more than this number of entries
+        loc_detailZoom = 14;      // ... or when the map is zoomed in this far
     
     // Private methods specifiction
     var private_methods = {
@@ -129,6 +137,452 @@ var ru = (function ($, ru) {
         }
       },
 
+      /**
+       * escape_html
+       *
+       * @param {str}   value to be shown in html
+       * @returns {str}
+       */
+      escape_html: function (value) {
+        return $("<div>").text(value === null || value === undefined ? "" : value).html();
+      },
+
+      /**
+       * make_popup
+       *    Create the popup of one entry of the GeoJSON map data
+       *
+       * @param {str}     popup type: lemma, mine or dialect
+       * @param {entry}   entry object
+       * @returns {str}
+       */
+      make_popup: function (popup_type, entry) {
+        var esc = private_methods.escape_html,
+            sMijn = "",
+            sHtml = "";
+
+        try {
+          switch (popup_type) {
+            case "mine":
+              sMijn = (entry.place === null || entry.place === "") ? "" : "mijn " + esc(entry.place) + " - ";
+              sHtml = '<p class="h6">' + esc(entry.woord) + '</p>' +
+                      '<hr style="border: 1px solid green" />' +
+                      '<p style="font-size: smaller;"><span style="color: purple;"><b>' + esc(entry.count) +
+                      '</b>: </span> ' + sMijn + '</p>';
+              break;
+            case "dialect":
+              sHtml = '<p class="h6">' + esc(entry.stad) + '</p>' +
+                      '<hr style="border: 1px solid green" />' +
+                      '<p style="font-size: smaller;"><span style="color: purple;">' + esc(entry.kloeke) +
+                      '</span> ' + esc(entry.count) + '</p>';
+              break;
+            default:
+              sHtml = '<p class="h6">' + esc(entry.woord) + '</p>' +
+                      '<hr style="border: 1px solid green" />' +
+                      '<p style="font-size: smaller;"><span style="color: purple;">' + esc(entry.kloeke) +
+                      '</span> ' + esc(entry.stad) + '</p>';
+              break;
+          }
+        } catch (ex) {
+          private_methods.errMsg("make_popup", ex);
+        }
+        return sHtml;
+      },
+
+      /**
+       * get_params
+       *    Combine the serialized search form with the parameters in [extra]
+       *
+       * @param {array}     serialized search form
+       * @param {object}    extra parameters, e.g. format, zoom and bbox
+       * @returns {str}
+       */
+      get_params: function (data, extra) {
+        var params = [],
+            key;
+
+        // The CSRF token does not change the map data
+        params = data.filter(function (item) { return item.name !== "csrfmiddlewaretoken"; });
+        for (key in extra) {
+          params.push({ name: key, value: extra[key] });
+        }
+        return $.param(params);
+      },
+
+      /**
+       * get_map_data
+       *    Get the GeoJSON data of a map, and turn it into a list of entries
+       *    The browser may keep the GeoJSON: the server then only confirms it is still valid
+       *
+       * @param {str}       targeturl
+       * @param {array}     serialized search form
+       * @param {object}    extra parameters (e.g. the bbox of the part of the map that is shown)
+       * @param {function}  callback receiving an object with status, label and entries
+       * @returns {void}
+       */
+      get_map_data: function (targeturl, data, extra, callback) {
+        try {
+          $.ajax({ url: targeturl, data: private_methods.get_params(data, $.extend({ format: "geojson" }, extra)), dataType: "json" })
+            .done(function (geojson) {
+              var entries = [],
+                  feature = null,
+                  coords = null,
+                  row = null,
+                  entry = null,
+                  i, j, k;
+
+              for (i = 0; i < geojson.features.length; i++) {
+                feature = geojson.features[i];
+                coords = feature.geometry.coordinates;
+                for (j = 0; j < feature.properties.rows.length; j++) {
+                  row = feature.properties.rows[j];
+                  // GeoJSON has longitude first
+                  entry = { point: coords[1] + ", " + coords[0], place: feature.properties.place };
+                  for (k = 0; k < geojson.fields.length; k++) {
+                    entry[geojson.fields[k]] = row[k];
+                  }
+                  entry.pop_up = private_methods.make_popup(geojson.popup, entry);
+                  entries.push(entry);
+                }
+              }
+              callback({ status: "ok", label: geojson.label, entries: entries });
+            })
+            .fail(function (xhr) {
+              callback({ status: "error", msg: "Could not get the map data (" + xhr.status + ")" });
+            });
+        } catch (ex) {
+          private_methods.errMsg("get_map_data", ex);
+        }
+      },
+
+      /**
+       * get_map_clusters
+       *    Get the entries of a map counted per grid cell of the zoom level
+       *
+       * @param {str}       targeturl
+       * @param {array}     serialized search form
+       * @param {object}    extra parameters: zoom and bbox
+       * @param {function}  callback receiving an object with status, label and clusters
+       * @returns {void}
+       */
+      get_map_clusters: function (targeturl, data, extra, callback) {
+        try {
+          $.ajax({ url: targeturl, data: private_methods.get_params(data, $.extend({ format: "clusters" }, extra)), dataType: "json" })
+            .done(function (response) {
+              callback(response);
+            })
+            .fail(function (xhr) {
+              callback({ status: "error", msg: "Could not get the map data (" + xhr.status + ")" });
+            });
+        } catch (ex) {
+          private_methods.errMsg("get_map_clusters", ex);
+        }
+      },
+
+      /**
+       * clear_map
+       *    Remove the markers, their legend and the clusters from the map
+       *
+       * @returns {void}
+       */
+      clear_map: function () {
+        var key;
+
+        try {
+          for (key in loc_overlayMarkers) {
+            main_map_object.removeLayer(loc_overlayMarkers[key]);
+          }
+          loc_overlayMarkers = {};
+          loc_layerDict = {};
+          loc_layerList = [];
+          if (loc_control !== null) {
+            loc_control.remove();
+            loc_control = null;
+          }
+          if (loc_clusterLayer !== null) {
+            main_map_object.removeLayer(loc_clusterLayer);
+            loc_clusterLayer = null;
+          }
+          if (loc_oms !== null) { loc_oms.clearMarkers(); }
+        } catch (ex) {
+          private_methods.errMsg("clear_map", ex);
+        }
+      },
+
+      /**
+       * show_markers
+       *    Show the entries as markers, with one layer per trefwoord
+       *
+       * @param {array}   entries
+       * @returns {void}
+       */
+      show_markers: function (entries) {
+        var key, idx, layername, kvalue, i;
+
+        try {
+          private_methods.clear_map();
+          for (i = 0; i < entries.length; i++) {
+            if (entries[i].point !== null && entries[i].point !== "") {
+              private_methods.make_marker(entries[i]);
+            }
+          }
+
+          // Convert layerdict into layerlist
+          for (key in loc_layerDict) {
+            loc_layerList.push({ key: key, value: loc_layerDict[key], freq: loc_layerDict[key].length });
+          }
+          // sort the layerlist
+          loc_layerList.sort(function (a, b) {
+            return b.freq - a.freq;
+          });
+
+          // Make a layer of markers from the layerLIST
+          for (idx in loc_layerList) {
+            key = loc_layerList[idx].key;
+            layername = '<span style="color: ' + loc_colorDict[key] + ';">' + key + '</span>' + ' (' + loc_layerList[idx].freq + ')';
+            kvalue = loc_layerList[idx].value;
+            if (kvalue.length > 0) {
+              loc_overlayMarkers[layername] = L.layerGroup(kvalue).addTo(main_map_object);
+            }
+          }
+          loc_control = L.control
+            .layers({}, loc_overlayMarkers, { collapsed: false })
+            .addTo(main_map_object);
+
+          private_methods.leaflet_scrollbars();
+        } catch (ex) {
+          private_methods.errMsg("show_markers", ex);
+        }
+      },
+
+      /**
+       * show_clusters
+       *    Show the clusters: clicking one zooms in on the points it contains
+       *
+       * @param {array}   clusters
+       * @returns {void}
+       */
+      show_clusters: function (clusters) {
+        var markers = [],
+            cluster = null,
+            marker = null,
+            i;
+
+        try {
+          private_methods.clear_map();
+          for (i = 0; i < clusters.length; i++) {
+            cluster = clusters[i];
+            marker = L.marker([cluster.lat, cluster.lng], {
+              icon: L.divIcon({ html: '<span>' + cluster.count + '</span>', className: 'map-cluster', iconSize: [36, 36] }),
+              title: cluster.count + " (" + cluster.points + ")"
+            });
+            marker.on("click", private_methods.zoom_cluster.bind(null, cluster));
+            markers.push(marker);
+          }
+          loc_clusterLayer = L.layerGroup(markers).addTo(main_map_object);
+        } catch (ex) {
+          private_methods.errMsg("show_clusters", ex);
+        }
+      },
+
+      /**
+       * zoom_cluster
+       *    Zoom in on the box around the points of [cluster]
+       *
+       * @param {object}  cluster
+       * @returns {void}
+       */
+      zoom_cluster: function (cluster) {
+        var box = cluster.bbox;
+
+        if (cluster.points > 1) {
+          main_map_object.fitBounds([[box[1], box[0]], [box[3], box[2]]]);
+        } else {
+          // A single point: zoom in far enough to see its markers
+          main_map_object.setView([cluster.lat, cluster.lng], Math.max(main_map_object.getZoom() + 2, loc_detailZoom));
+        }
+      },
+
+      /**
+       * refresh_map
+       *    Get the data of the part of the map that is shown:
+       *    clusters when there are too many entries there, markers otherwise
+       *
+       * @returns {void}
+       */
+      refresh_map: function () {
+        var extra = {},
+            request = 0;
+
+        try {
+          loc_request += 1;
+          request = loc_request;
+          extra = {
+            zoom: Math.round(main_map_object.getZoom()),
+            bbox: main_map_object.getBounds().toBBoxString()
+          };
+          private_methods.get_map_clusters(loc_mapUrl, loc_mapData, extra, function (response) {
+            var total = 0,
+                i;
+
+            // Skip responses to requests that have been overtaken
+            if (request !== loc_request) { return; }
+            if (response.status !== "ok") {
+              private_methods.errMsg(response.msg);
+              return;
+            }
+            for (i = 0; i < response.clusters.length; i++) {
+              total += response.clusters[i].count;
+            }
+            if (total <= loc_maxMarkers || extra.zoom >= loc_detailZoom) {
+              private_methods.get_map_data(loc_mapUrl, loc_mapData, { bbox: extra.bbox }, function (response) {
+                if (request !== loc_request) { return; }
+                if (response.status === "ok") {
+                  private_methods.show_markers(response.entries);
+                } else {
+                  private_methods.errMsg(response.msg);
+                }
+              });
+            } else {
+              private_methods.show_clusters(response.clusters);
+            }
+          });
+        } catch (ex) {
+          private_methods.errMsg("refresh_map", ex);
+        }
+      },
+
+      /**
+       * schedule_refresh
+       *    Refresh the map once it has stopped moving (panning and zooming fire [moveend])
+       *
+       * @returns {void}
+       */
+      schedule_refresh: function () {
+        if (loc_timer !== null) { clearTimeout(loc_timer); }
+        loc_timer = setTimeout(function () {
+          loc_timer = null;
+          private_methods.refresh_map();
+        }, 250);
+      },
+
+      /**
+       * fit_bounds
+       *    Show the part of the map within [bounds]
+       *
+       * @param {L.LatLngBounds}  bounds
+       * @returns {void}
+       */
+      fit_bounds: function (bounds) {
+        if (bounds.getSouthWest().equals(bounds.getNorthEast())) {
+          main_map_object.setView(bounds.getCenter(), 12);
+        } else {
+          main_map_object.fitBounds(bounds);
+        }
+      },
+
+      /**
+       * show_map
+       *    Open the map of the list that [el] belongs to
+       *    The clusters of the whole map give its extent; after that the map
+       *    loads the data of the part that is shown whenever it is moved or zoomed
+       *
+       * @param {dom}   where this request starts from
+       * @param {str}   selector of the search form
+       * @returns {void}
+       */
+      show_map: function (el, frm) {
+        var map_title = "#map_view_title",
+            map_id = "map_lemma",
+            map_view = "#map_view",
+            data = null,
+            targeturl = "";
+
+        try {
+          // Get the form data
+          data = $(frm).serializeArray();
+          targeturl = $(el).attr("targeturl");
+
+          // Show the modal
+          $(map_view).modal("toggle");
+
+          // Possibly remove what is still there
+          if (main_map_object !== null) {
+            // Remove tile layer from active map
+            tiles.remove()
+            // Remove the actual map
+            try {
+              main_map_object.remove();
+            } catch (ex) {
+              // Nothing to remove
+            }
+            main_map_object = null;
+          }
+          if (loc_timer !== null) {
+            clearTimeout(loc_timer);
+            loc_timer = null;
+          }
+          // Indicate we are waiting
+          $("#" + map_id).html(loc_sWaiting);
+          // Other initializations
+          loc_layerDict = {};
+          loc_layerList = [];
+          loc_trefwoord = [];
+          loc_colorDict = {};
+          loc_overlayMarkers = {};
+          loc_control = null;
+          loc_clusterLayer = null;
+          loc_oms = null;
+          loc_mapUrl = targeturl;
+          loc_mapData = data;
+          // Any response still under way belongs to the previous map
+          loc_request += 1;
+
+          // The clusters of the whole map give its extent
+          private_methods.get_map_clusters(targeturl, data, {}, function (response) {
+            var bounds = null,
+                box = null,
+                i;
+
+            if (response.status !== "ok") {
+              private_methods.errMsg(response.msg);
+              return;
+            }
+            // Make sure the label shows
+            $(map_title).html("Begrip: [" + response.label + "]");
+            for (i = 0; i < response.clusters.length; i++) {
+              box = response.clusters[i].bbox;
+              if (bounds === null) {
+                bounds = L.latLngBounds([box[1], box[0]], [box[3], box[2]]);
+              } else {
+                bounds.extend(L.latLngBounds([box[1], box[0]], [box[3], box[2]]));
+              }
+            }
+            if (bounds === null) {
+              $("#" + map_id).html("");
+              return;
+            }
+
+            // Set the starting map
+            main_map_object = L.map(map_id).setView(bounds.getCenter(), 12);
+            // Add it to my tiles
+            tiles.addTo(main_map_object);
+            // https://github.com/jawj/OverlappingMarkerSpiderfier-Leaflet to handle overlapping markers
+            loc_oms = new OverlappingMarkerSpiderfier(main_map_object, { keepSpiderfied: true });
+            // Load the part that is shown, whenever it changes
+            main_map_object.on("moveend", private_methods.schedule_refresh);
+            private_methods.fit_bounds(bounds);
+
+            // Make sure it is redrawn once the modal is shown
+            setTimeout(function () {
+              main_map_object.invalidateSize();
+              private_methods.fit_bounds(bounds);
+            }, 200);
+          });
+        } catch (ex) {
+          private_methods.errMsg("show_map", ex);
+        }
+      },
+
       leaflet_scrollbars: function () {
         var layers_list = "section.leaflet-control-layers-list",
             layers_scrollbar = "leaflet-control-layers-scrollbar",
@@ -208,163 +662,7 @@ var ru = (function ($, ru) {
        * @returns {void}
        */
       lemma_map(el) {
-        var frm = "#lemmasearch",
-            map_title = "#map_view_title",
-            map_id = "map_lemma",
-            map_view = "#map_view",
-            data = null,
-            entries = null,
-            lemma = "",
-            label = "",
-            point = null,
-            points = [],
-            keywords = [],
-            polyline = null,
-            oOverlay = null,
-            i = 0,
-            idx = 0,
-            targeturl = "",
-            targetid = "";
-
-        try {
-          // Get the form data
-          //frm = $("form").first();
-          data = $(frm).serializeArray();
-          targeturl = $(el).attr("targeturl");
-          targetid = $(el).attr("targetid");
-
-          // Show the modal
-          $(map_view).modal("toggle");
-
-          // Possibly remove what is still there
-          if (main_map_object !== null) {
-            // Remove tile layer from active map
-            tiles.remove()
-            // Remove the actual map
-            try {
-              main_map_object.remove();
-            } catch (ex) {
-              i = 0;
-            }
-            main_map_object = null;
-            // Reset the 
-          }
-          // Indicate we are waiting
-          $("#" + map_id).html(loc_sWaiting);
-          if (points.length > 0) points.clear();
-          // Other initializations
-          loc_layerDict = {};
-          loc_layerList = [];
-          loc_trefwoord = [];
-          loc_colorDict = {};
-          loc_overlayMarkers = {};
-
-          // Post the data to the server
-          $.post(targeturl, data, function (response) {
-            var key, layername, kvalue;
-
-            // Sanity check
-            if (response !== undefined) {
-              if (response.status == "ok") {
-                if ('entries' in response) {
-                  entries = response['entries'];
-                  label = response['label'];
-                  // Make sure the label shows
-                  $(map_title).html("Begrip: [" + label + "]");
-
-                  if (main_map_object == null) {
-                    // now get the first point
-                    for (i = 0; i < entries.length; i++) {
-                      if (entries[i].point !== null && entries[i].point !== "") {
-                        // Add point to the array of points to find out the bounds
-                        points.push(entries[i].point.split(",").map(Number));
-                        // Create a marker for this point
-                        private_methods.make_marker(entries[i]);
-                      }
-                    }
-                    if (points.length > 0) {
-                      // Get the first point
-                      point = points[0];
-                      // CLear the map section from the waiting symbol
-                      $("#" + map_id).html();
-                      // Set the starting map
-                      main_map_object = L.map(map_id).setView([point[0], point[1]], 12);
-                      // Add it to my tiles
-                      tiles.addTo(main_map_object);
-                      // https://github.com/jawj/OverlappingMarkerSpiderfier-Leaflet to handle overlapping markers
-                      loc_oms = new OverlappingMarkerSpiderfier(main_map_object, { keepSpiderfied: true });
-
-                      // Convert layerdict into layerlist
-                      for (key in loc_layerDict) {
-                        loc_layerList.push({ key: key, value: loc_layerDict[key], freq: loc_layerDict[key].length });
-                      }
-                      // sort the layerlist
-                      loc_layerList.sort(function (a, b) {
-                        return b.freq - a.freq;
-                      });
-
-                      // Make a layer of markers from the layerLIST
-                      for (idx in loc_layerList) {
-                        key = loc_layerList[idx].key;
-                        layername = '<span style="color: ' + loc_colorDict[key] + ';">' + key + '</span>' + ' (' + loc_layerList[idx].freq + ')';
-                        kvalue = loc_layerList[idx].value;
-                        if (kvalue.length > 0) {
-                          try {
-                            loc_overlayMarkers[layername] = L.layerGroup(kvalue).addTo(main_map_object);
-                          } catch (ex) {
-                            i = 100;
-                          }
-                        }
-                      }
-                      L.control
-                        .layers({}, loc_overlayMarkers, { collapsed: false })
-                        .addTo(main_map_object)
-
-                      // Set map to fit the markers
-                      polyline = L.polyline(points);
-                      if (points.length > 1) {
-                        main_map_object.fitBounds(polyline.getBounds());
-                      } else {
-                        main_map_object.setView(points[0], 12);
-                      }
-
-                      private_methods.leaflet_scrollbars();
-
-                    }
-                  }
-
-                  // Make sure it is redrawn
-                  // main_map_object.invalidateSize();
-                  setTimeout(function () {
-                    main_map_object.invalidateSize();
-                    if (points.length > 1) {
-                      main_map_object.fitBounds(polyline.getBounds());
-                    } else {
-                      main_map_object.setView(points[0], 12);
-                    }
-
-                    private_methods.leaflet_scrollbars();
-
-                  }, 200);
-                  // Debug  break point
-                  i = 100;
-                } else {
-                  errMsg("Response is okay, but [html] is missing");
-                }
-                // Knoppen weer inschakelen
-
-              } else {
-                if ("msg" in response) {
-                  errMsg(response.msg);
-                } else {
-                  errMsg("Could not interpret response " + response.status);
-                }
-              }
-            }
-          });
-        } catch (ex) {
-          private_methods.errMsg("lemma_map", ex);
-        }
+        private_methods.show_map(el, "#lemmasearch");
       },
 
       /**
@@ -376,163 +674,8 @@ var ru = (function ($, ru) {
        * @returns {void}
        */
       dialect_map(el) {
-        var frm = "#dialectsearch",         // On dialect_list.html
-            map_title = "#map_view_title",  // Part of map_view.html
-            map_id = "map_lemma",           // Part of map_view.html
-            map_view = "#map_view",         // Part of map_view.html
-            data = null,
-            entries = null,
-            lemma = "",
-            label = "",
-            point = null,
-            points = [],
-            keywords = [],
-            polyline = null,
-            oOverlay = null,
-            i = 0,
-            idx = 0,
-            targeturl = "",
-            targetid = "";
-
-        try {
-          // Get the form data
-          //frm = $("form").first();
-          data = $(frm).serializeArray();
-          targeturl = $(el).attr("targeturl");
-          targetid = $(el).attr("targetid");
-
-          // Show the modal
-          $(map_view).modal("toggle");
-
-          // Possibly remove what is still there
-          if (main_map_object !== null) {
-            // Remove tile layer from active map
-            tiles.remove()
-            // Remove the actual map
-            try {
-              main_map_object.remove();
-            } catch (ex) {
-              i = 0;
-            }
-            main_map_object = null;
-            // Reset the 
-          }
-          // Indicate we are waiting
-          $("#" + map_id).html(loc_sWaiting);
-          if (points.length > 0) points.clear();
-          // Other initializations
-          loc_layerDict = {};
-          loc_layerList = [];
-          loc_trefwoord = [];           // THis now contains the first letter of the Kloeke Codes
-          loc_colorDict = {};
-          loc_overlayMarkers = {};
-
-          // Post the data to the server
-          $.post(targeturl, data, function (response) {
-            var key, layername, kvalue;
-
-            // Sanity check
-            if (response !== undefined) {
-              if (response.status == "ok") {
-                if ('entries' in response) {
-                  entries = response['entries'];
-                  label = response['label'];
-                  // Make sure the label shows
-                  $(map_title).html("Begrip: [" + label + "]");
-
-                  if (main_map_object == null) {
-                    // now get the first point
-                    for (i = 0; i < entries.length; i++) {
-                      if (entries[i].point !== null && entries[i].point !== "") {
-                        // Add point to the array of points to find out the bounds
-                        points.push(entries[i].point.split(",").map(Number));
-                        // Create a marker for this point
-                        private_methods.make_marker(entries[i]);
-                      }
-                    }
-                    if (points.length > 0) {
-                      // Get the first point
-                      point = points[0];
-                      // CLear the map section from the waiting symbol
-                      $("#" + map_id).html();
-                      // Set the starting map
-                      main_map_object = L.map(map_id).setView([point[0], point[1]], 12);
-                      // Add it to my tiles
-                      tiles.addTo(main_map_object);
-                      // https://github.com/jawj/OverlappingMarkerSpiderfier-Leaflet to handle overlapping markers
-                      loc_oms = new OverlappingMarkerSpiderfier(main_map_object, { keepSpiderfied: true });
-
-                      // Convert layerdict into layerlist
-                      for (key in loc_layerDict) {
-                        loc_layerList.push({ key: key, value: loc_layerDict[key], freq: loc_layerDict[key].length });
-                      }
-                      // sort the layerlist
-                      loc_layerList.sort(function (a, b) {
-                        return b.freq - a.freq;
-                      });
-
-                      // Make a layer of markers from the layerLIST
-                      for (idx in loc_layerList) {
-                        key = loc_layerList[idx].key;
-                        layername = '<span style="color: ' + loc_colorDict[key] + ';">' + key + '</span>' + ' (' + loc_layerList[idx].freq + ')';
-                        kvalue = loc_layerList[idx].value;
-                        if (kvalue.length > 0) {
-                          try {
-                            loc_overlayMarkers[layername] = L.layerGroup(kvalue).addTo(main_map_object);
-                          } catch (ex) {
-                            i = 100;
-                          }
-                        }
-                      }
-                      L.control
-                        .layers({}, loc_overlayMarkers, { collapsed: false })
-                        .addTo(main_map_object)
-
-                      // Set map to fit the markers
-                      polyline = L.polyline(points);
-                      if (points.length > 1) {
-                        main_map_object.fitBounds(polyline.getBounds());
-                      } else {
-                        main_map_object.setView(points[0], 12);
-                      }
-
-                      private_methods.leaflet_scrollbars();
-
-                    }
-                  }
-
-                  // Make sure it is redrawn
-                  // main_map_object.invalidateSize();
-                  setTimeout(function () {
-                    main_map_object.invalidateSize();
-                    if (points.length > 1) {
-                      main_map_object.fitBounds(polyline.getBounds());
-                    } else {
-                      main_map_object.setView(points[0], 12);
-                    }
-
-                    private_methods.leaflet_scrollbars();
-
-                  }, 200);
-                  // Debug  break point
-                  i = 100;
-                } else {
-                  errMsg("Response is okay, but [html] is missing");
-                }
-                // Knoppen weer inschakelen
-
-              } else {
-                if ("msg" in response) {
-                  errMsg(response.msg);
-                } else {
-                  errMsg("Could not interpret response " + response.status);
-                }
-              }
-            }
-          });
-        } catch (ex) {
-          private_methods.errMsg("dialect_map", ex);
-        }
+        // The form is on dialect_list.html
+        private_methods.show_map(el, "#dialectsearch");
       }
 
 
@@ -11,10 +11,15 @@ from django.http import HttpRequest, HttpResponse
 from django.template import RequestContext, loader
 from django.template.loader import render_to_string
 from django.db import connection
-from django.db.models import Q
+from django.db.models import Q, F, Count
 from django.db.models.functions import Lower
 from django.http import JsonResponse
+from django.utils.cache import patch_cache_control
 import fnmatch
+import json
+import math
+
+from wald.dictionary.search import search_q
 
 
 import sys
@@ -70,16 +75,6 @@ class ErrHandle:
         else:
             return ""
 
-def adapt_search(val):
-    # First trim
-    val = val.strip()    
-    # Adapt for the use of '#'
-    if '#' in val:
-        val = r'(^|(.*\b))' + val.replace('#', r'((\b.*)|$)')
-    else:
-        val = '^' + fnmatch.translate(val) + '$'
-    return val
-
 
 
 # Create your views here.
@@ -94,8 +89,26 @@ class MapView(DetailView):
     labelfield = ""
     use_object = True
     label = ""
+    # Keys of [entry_list] that make up one marker: if given, the entries are counted per marker in the query
+    group_by = []
+    # Expressions to group on instead of the query of a key in [group_by]
+    group_expr = {}
+    # Keys of [entry_list] sent to the client in the GeoJSON rows, and the client function that makes their popup
+    geo_fields = []
+    popup_type = ""
+    # Paths to the latitude and longitude of an entry, used for the [bbox] parameter
+    bbox_lat = ""
+    bbox_lng = ""
+    # Grid cells per map tile, and the zoom level if none is given, for the clusters
+    cluster_cells = 4
+    cluster_zoom = 8
 
     def get(self, request, *args, **kwargs):
+        sFormat = request.GET.get('format', '')
+        if sFormat == "geojson":
+            return self.get_data(request, "application/geo+json", self.get_geojson)
+        elif sFormat == "clusters":
+            return self.get_data(request, "application/json", self.get_clusters)
         # No errors, just return to the homepage
         return redirect(reverse('home'))
 
@@ -115,75 +128,146 @@ class MapView(DetailView):
 
     def get_popup(self, entry):
         return "(no popup specified)"
+
+    def get_count(self, entry, qs):
+        return None
+
+    def get_bbox(self, qd):
+        """Get the [west, south, east, north] of the 'bbox' parameter in [qd], or None"""
+
+        lPart = qd.get('bbox', '').split(",")
+        if len(lPart) != 4:
+            return None
+        try:
+            lBox = [float(x) for x in lPart]
+        except ValueError:
+            return None
+        return lBox
+
+    def get_bbox_q(self, lBox):
+        """Get the condition for entries inside the box [west, south, east, north]"""
+
+        west, south, east, north = lBox
+        return Q(**{"{}__range".format(self.bbox_lat): (south, north),
+                    "{}__range".format(self.bbox_lng): (west, east)})
     
-    def post(self, request, *args, **kwargs):
-        # Formulate a response
-        data = {'status': 'error', 'msg': 'unknown'}
+    def get_filtered(self, qd):
+        """Get the queryset of entries that satisfy the search parameters in [qd]
+
+        The optional parameter 'bbox' (west,south,east,north, as in Leaflet's
+        toBBoxString) limits the entries to those inside that box.
+        Returns None if the search parameters are not valid.
+        """
 
         def query_add(lstQ, val, path, type):
             if type == "str" and val != "" and val != None:
-                comparison = "iexact"
-                if '*' in val or '[' in val or '?' in val or '#' in val:
-                    val = adapt_search(val)
-                    comparison = "iregex"
-                lstQ.append(Q(**{"{}__{}".format(path, comparison): val}))
+                lstQ.append(search_q(self.modEntry, path, val))
             elif type == "int" and val != "" and val != None:
                 if val.isdigit():
                     iVal = int(val)
                     if iVal>0:
                         lstQ.append(Q(**{"{}".format(path): iVal}))
 
+        # Get the search parameters, if any
+        search_form = self.frmSearch(qd)
+        # It should always be valid, but this gives [cleaned_data]
+        if not search_form.is_valid():
+            return None
+        # Get the data
+        cleaned_data = search_form.cleaned_data
+
+        # Build a filter to get all entries, based on the cleaned data
+        lstQ = []
+        # Start with the main object's id
+        if self.use_object:
+            lstQ.append(Q(**{"{}__id".format(self.model._meta.model_name.lower()): self.object.id}))
+
+        # Derive the variables from the cleaned_data according to entry_list
+        for oItem in self.entry_list:
+            if oItem['form'] != "":
+                form_value = cleaned_data.get(oItem['form'], "")
+                # Add to the query
+                query_add(lstQ, form_value, oItem['query'], oItem['type'])
+
+        # Only get the entries inside the part of the map that is shown
+        lBox = self.get_bbox(qd)
+        if lBox != None and self.bbox_lat != "":
+            lstQ.append(self.get_bbox_q(lBox))
+
+        return self.modEntry.objects.filter(*lstQ)
+
+    def get_entries(self, qd):
+        """Get the entries that satisfy the search parameters in [qd]
+
+        Returns the list of entries, each a dictionary with the keys of [entry_list],
+        or None if the search parameters are not valid.
+        """
+
+        qs = self.get_filtered(qd)
+        if qs == None:
+            return None
+        # ALl items: get their values into [value_list]
+        value_list = [oItem['query'] for oItem in self.entry_list]
+        bGroup = (len(self.group_by) > 0)
+        if bGroup:
+            # One marker per group: count the entries of each group in the same query
+            if len(self.group_expr) > 0:
+                qs = qs.annotate(**{"group_{}".format(k): v for k, v in self.group_expr.items()})
+            dicValue = {}
+            for oItem in self.entry_list:
+                if oItem['key'] in self.group_expr:
+                    dicValue[oItem['key']] = "group_{}".format(oItem['key'])
+                elif oItem['key'] in self.group_by:
+                    dicValue[oItem['key']] = oItem['query']
+            # NOTE: Django adds the [order_by] columns to the GROUP BY, so they must be among the grouped values
+            lst_entry = qs.values(*dicValue.values()).annotate(count=Count('id')).order_by(*self.order_by)
+        else:
+            # Retrieve all the necessary entries
+            dicValue = {oItem['key']: oItem['query'] for oItem in self.entry_list}
+            lst_entry = qs.order_by(*self.order_by).values(*value_list)
+
+        # Create a new list that uses the 'key's from entry_list
+        lst_back = []
+        for item in lst_entry:
+            oEntry = {}
+            for oItem in self.entry_list:
+                sValue = dicValue.get(oItem['key'])
+                oEntry[oItem['key']] = None if sValue == None else item[sValue]
+            if bGroup:
+                oEntry['count'] = item['count']
+            else:
+                iCount = self.get_count(oEntry, lst_entry)
+                # Keep a count that is part of [entry_list] itself
+                if iCount != None or 'count' not in oEntry:
+                    oEntry['count'] = iCount
+            lst_back.append(oEntry)
+        return lst_back
+
+    def get_label(self):
+        if self.use_object:
+            return getattr(self.object, self.labelfield)    # lemma.gloss
+        return self.label
+
+    def post(self, request, *args, **kwargs):
+        # Formulate a response
+        data = {'status': 'error', 'msg': 'unknown'}
+
         oErr = ErrHandle()
         try:
             # First initialize
             self.initialize()
 
             # Get the object from what we receive
-            obj = self.get_object()
-
-            # Get the search parameters, if any
-            search_form = self.frmSearch(request.POST)
-            # It should always be valid, but this gives [cleaned_data]
-            if search_form.is_valid():
-                # Get the data
-                cleaned_data = search_form.cleaned_data
-
-                # Build a filter to get all entries, based on the cleaned data
-                lstQ = []
-                # Start with the main object's id
-                if self.use_object:
-                    lstQ.append(Q(**{"{}__id".format(self.model._meta.model_name.lower()): obj.id}))
-
-                # Derive the variables from the cleaned_data according to entry_list
-                value_list = []
-                for oItem in self.entry_list:
-                    if oItem['form'] != "":
-                        form_value = cleaned_data.get(oItem['form'], "")
-                        # Add to the query
-                        query_add(lstQ, form_value, oItem['query'], oItem['type'])
-                    # ALl items: get their values into [value_list]
-                    value_list.append(oItem['query'])
-
-                # Get features of all the ENtry elements satisfying the condition
-                total = self.modEntry.objects.filter(*lstQ).count()
-                # Retrieve all the necessary entries
-                lst_entry = self.modEntry.objects.filter(*lstQ).order_by(*self.order_by).values(*value_list)
-
-                # Create a new list that uses the 'key's from entry_list
-                lst_back = []
-                for item in lst_entry:
-                    oEntry = {}
-                    for oItem in self.entry_list:
-                        oEntry[oItem['key']] = item[oItem['query']]
+            self.object = self.get_object()
+
+            lst_back = self.get_entries(request.POST)
+            if lst_back != None:
+                for oEntry in lst_back:
                     oEntry['pop_up'] = self.get_popup(oEntry)
-                    lst_back.append(oEntry)
 
                 # Add the data
                 data['entries'] = lst_back
-                if self.use_object:
-                    data['label'] = getattr(obj, self.labelfield)    # lemma.gloss
-                else:
-                    data['label'] = self.label
+                data['label'] = self.get_label()
 
                 # Set the status to okay
                 data['status'] = 'ok'
@@ -194,4 +278,112 @@ class MapView(DetailView):
 
         return JsonResponse(data)
 
+    def get_data(self, request, sContentType, make_data):
+        """Return the JSON made by [make_data(qd)] for [request]"""
+
+        self.initialize()
+        self.object = self.get_object()
+        oData = make_data(request.GET)
+        if oData == None:
+            return JsonResponse({'status': 'error', 'msg': 'invalid search'}, status=400)
+        response = HttpResponse(json.dumps(oData, separators=(',', ':')), content_type=sContentType)
+        # The data changes with every import: browsers must not keep it
+        patch_cache_control(response, no_cache=True)
+        return response
+
+    def get_geojson(self, qd):
+        """Get the entries as GeoJSON, one feature per coordinate
+
+        Each feature has the [geo_fields] of its entries as rows, from which
+        the client builds the popups (see [popup_type]).
+        """
+
+        lst_entry = self.get_entries(qd)
+        if lst_entry == None:
+            return None
+        return self.make_geojson(lst_entry)
+
+    def get_latlng_expr(self):
+        """Get the expressions for the latitude and longitude at which an entry is shown"""
+
+        return F(self.bbox_lat), F(self.bbox_lng)
+
+    def get_clusters(self, qd):
+        """Get the entries as clusters on a grid that depends on the 'zoom' parameter
+
+        The entries are counted per point in the query, and the points are
+        then joined per grid cell. A cell is 1/[cluster_cells] of a map tile
+        at that zoom level. Each cluster has the average position of its
+        entries, their number, the number of points and the box around the
+        points: a client shows a cluster of more than one point by asking
+        for that box at a higher zoom level, or for its GeoJSON.
+        """
+
+        qs = self.get_filtered(qd)
+        if qs == None or self.bbox_lat == "":
+            return None
+        sZoom = qd.get('zoom', '')
+        iZoom = int(sZoom) if sZoom.isdigit() else self.cluster_zoom
+        iZoom = min(iZoom, 20)
+        fSize = 360.0 / (2 ** iZoom) / self.cluster_cells
+
+        # Count the entries per point
+        lat_expr, lng_expr = self.get_latlng_expr()
+        qs = qs.annotate(map_lat=lat_expr, map_lng=lng_expr).filter(map_lat__isnull=False, map_lng__isnull=False)
+        qs = qs.values('map_lat', 'map_lng').annotate(count=Count('id')).order_by()
+
+        # Join the points per grid cell
+        dicCell = {}
+        for oPoint in qs:
+            lat = oPoint['map_lat']
+            lng = oPoint['map_lng']
+            iCount = oPoint['count']
+            tCell = (math.floor(lat / fSize), math.floor(lng / fSize))
+            oCell = dicCell.get(tCell)
+            if oCell == None:
+                oCell = {'count': 0, 'points': 0, 'lat': 0.0, 'lng': 0.0, 'bbox': [lng, lat, lng, lat]}
+                dicCell[tCell] = oCell
+            oCell['count'] += iCount
+            oCell['points'] += 1
+            oCell['lat'] += lat * iCount
+            oCell['lng'] += lng * iCount
+            lBox = oCell['bbox']
+            lBox[0] = min(lBox[0], lng)
+            lBox[1] = min(lBox[1], lat)
+            lBox[2] = max(lBox[2], lng)
+            lBox[3] = max(lBox[3], lat)
+
+        lCluster = []
+        for oCell in dicCell.values():
+            oCell['lat'] = oCell['lat'] / oCell['count']
+            oCell['lng'] = oCell['lng'] / oCell['count']
+            lCluster.append(oCell)
+        lCluster.sort(key=lambda x: -x['count'])
+        return {'status': 'ok', 'label': self.get_label(), 'zoom': iZoom, 'clusters': lCluster}
+
+    def make_geojson(self, lst_entry):
+        """Group the entries per point into a GeoJSON feature collection"""
+
+        lField = self.geo_fields
+        dicFeature = {}
+        lFeature = []
+        for oEntry in lst_entry:
+            sPoint = oEntry.get('point')
+            if sPoint == None or sPoint == "":
+                continue
+            oFeature = dicFeature.get(sPoint)
+            if oFeature == None:
+                try:
+                    lat, lng = [float(x) for x in sPoint.split(",")]
+                except ValueError:
+                    continue
+                oFeature = {'type': 'Feature',
+                            'geometry': {'type': 'Point', 'coordinates': [lng, lat]},
+                            'properties': {'place': oEntry.get('place'), 'rows': []}}
+                dicFeature[sPoint] = oFeature
+                lFeature.append(oFeature)
+            oFeature['properties']['rows'].append([oEntry.get(x) for x in lField])
+        return {'type': 'FeatureCollection', 'label': self.get_label(), 'popup': self.popup_type,
+                'fields': lField, 'features': lFeature}
+
 
@@ -0,0 +1 @@
+default_app_config = 'wbd.dictionary.apps.dictionaryConfig'
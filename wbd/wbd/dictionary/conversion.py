@@ -4,6 +4,12 @@ Convert Rijksdriehoek to WGS84
 See: https://github.com/djvanderlaan/rijksdriehoek
 """
 
+try:
+    import numpy
+except ImportError:
+    # The batch conversions then use plain Python
+    numpy = None
+
 X0      = 155000
 Y0      = 463000
 PHI0    = 52.15517440
@@ -97,3 +103,60 @@ def wgs_to_rd(phi, lam):
         Y += s * dphi**p * dlam**q
 
     return [X,Y]
+
+
+def series_batch(lTerm, lA, lB):
+    """
+    Evaluate the series sum(c * a**p * b**q) of the terms (p, q, c) in [lTerm] for each pair in [lA] and [lB].
+    """
+
+    if numpy != None:
+        aA = numpy.asarray(lA, dtype=float)
+        aB = numpy.asarray(lB, dtype=float)
+        aSum = numpy.zeros(aA.shape)
+        for p, q, c in lTerm:
+            aSum += c * aA**p * aB**q
+        return aSum.tolist()
+
+    # Plain Python: calculate the powers of each value once
+    iMaxP = max(x[0] for x in lTerm)
+    iMaxQ = max(x[1] for x in lTerm)
+    lSum = []
+    for a, b in zip(lA, lB):
+        lPowA = [1.0]
+        for i in range(iMaxP):
+            lPowA.append(lPowA[-1] * a)
+        lPowB = [1.0]
+        for i in range(iMaxQ):
+            lPowB.append(lPowB[-1] * b)
+        fSum = 0.0
+        for p, q, c in lTerm:
+            fSum += c * lPowA[p] * lPowB[q]
+        lSum.append(fSum)
+    return lSum
+
+def rd_to_wgs_batch(lX, lY):
+    """
+    Convert lists of rijksdriehoekcoordinates into a list of latitudes and a list of longitudes.
+    """
+
+    lDx = [1E-5 * ( float(x) - X0 ) for x in lX]
+    lDy = [1E-5 * ( float(y) - Y0 ) for y in lY]
+
+    lPhi = [PHI0 + v / 3600 for v in series_batch(pqk, lDx, lDy)]
+    lLam = [LAM0 + v / 3600 for v in series_batch(pql, lDx, lDy)]
+
+    return [lPhi, lLam]
+
+def wgs_to_rd_batch(lPhi, lLam):
+    """
+    Convert lists of WGS84 cooridnates into a list of X and a list of Y rijksdriehoekcoordinates.
+    """
+
+    lDphi = [0.36 * ( float(phi) - PHI0 ) for phi in lPhi]
+    lDlam = [0.36 * ( float(lam) - LAM0 ) for lam in lLam]
+
+    lX = [X0 + v for v in series_batch(pqr, lDphi, lDlam)]
+    lY = [Y0 + v for v in series_batch(pqs, lDphi, lDlam)]
+
+    return [lX, lY]
@@ -0,0 +1,186 @@
+"""Grouping of the sorted entries of a list view page.
+
+A list view shows a sorted page of entries as nested groups: a trefwoord
+with its lemma's, each lemma with its dialect words, and so on. For each
+entry and each grouping variable the template needs to know whether the
+entry is the first and/or the last one of its group, e.g.:
+
+    {% if item.lemma_gloss.first %} ... {% endif %}
+
+A [Grouping] compiles the variables once: attribute paths such as
+["lemma", "gloss"] become one attrgetter('lemma.gloss'). Its [get_rows]
+walks the entries in a single pass and returns one [GroupRow] per entry.
+A row keeps the first/last information of all variables as bits of one
+integer, and hands out one of four shared [GroupFlag] objects when a
+template (or view) asks for a variable.
+"""
+
+import operator
+
+from django.db.models.query import QuerySet
+
+from wbd.utils import ErrHandle
+
+# The bits of one variable within [GroupRow.flags]
+FIRST = 1
+LAST = 2
+
+
+class GroupFlag(object):
+    """The (read-only) first/last information of one variable of one row"""
+
+    __slots__ = ('first', 'last')
+
+    def __init__(self, bFirst, bLast):
+        self.first = bFirst
+        self.last = bLast
+
+    def __getitem__(self, sName):
+        # Allow item['lemma_gloss']['first'] as well
+        return getattr(self, sName)
+
+
+# All rows share these: the index is (first | last) of one variable
+FLAGS = (GroupFlag(False, False), GroupFlag(True, False), GroupFlag(False, True), GroupFlag(True, True))
+
+
+class GroupRow(object):
+    """One entry of a grouped list, with the first/last bits of all its variables"""
+
+    __slots__ = ('entry', 'flags', 'shift', 'alist', 'dlist')
+
+    def __init__(self, entry, iFlags, dicShift):
+        self.entry = entry
+        self.flags = iFlags
+        # Variable name to the position of its bits (shared by all rows of a list)
+        self.shift = dicShift
+        # Sub-lists the views may add
+        self.alist = None
+        self.dlist = None
+
+    def __getitem__(self, sName):
+        iShift = self.shift.get(sName)
+        if iShift == None:
+            try:
+                return getattr(self, sName)
+            except AttributeError:
+                raise KeyError(sName)
+        return FLAGS[(self.flags >> iShift) & 3]
+
+    def __setitem__(self, sName, value):
+        # Only the sub-lists can be set this way
+        setattr(self, sName, value)
+
+    def is_first(self, sName):
+        return (self.flags >> self.shift[sName]) & FIRST != 0
+
+    def is_last(self, sName):
+        return (self.flags >> self.shift[sName]) & LAST != 0
+
+    def set_last(self, sName, bLast = True):
+        iBit = LAST << self.shift[sName]
+        if bLast:
+            self.flags |= iBit
+        else:
+            self.flags &= ~iBit
+
+
+class Grouping(object):
+    """The compiled getters of a list of grouping variables"""
+
+    # Compiled groupings: (variables, functions) to [Grouping]
+    dicCompiled = {}
+
+    def __init__(self, lVar, lFun):
+        self.lVar = list(lVar)
+        self.shift = {k: 2 * j for j, k in enumerate(self.lVar)}
+        self.lGetter = []
+        self.lDictGetter = []
+        self.lRelated = []
+        for fun in lFun:
+            if callable(fun):
+                self.lGetter.append(fun)
+                self.lDictGetter.append(fun)
+            else:
+                self.lGetter.append(operator.attrgetter(".".join(fun)))
+                self.lDictGetter.append(Grouping.get_dict_getter(fun))
+                if len(fun) > 1:
+                    self.lRelated.append("__".join(fun[:-1]))
+        # The last bits of all variables
+        self.iAllLast = 0
+        for iShift in self.shift.values():
+            self.iAllLast |= LAST << iShift
+
+    def get(lVar, lFun):
+        """Get the compiled grouping of [lVar] with the values of [lFun]"""
+
+        oKey = (tuple(lVar), tuple(x if callable(x) else tuple(x) for x in lFun))
+        oGrouping = Grouping.dicCompiled.get(oKey)
+        if oGrouping == None:
+            oGrouping = Grouping(lVar, lFun)
+            Grouping.dicCompiled[oKey] = oGrouping
+        return oGrouping
+
+    def get_dict_getter(lPath):
+        lItemGetter = [operator.itemgetter(x) for x in lPath]
+        if len(lItemGetter) == 1:
+            return lItemGetter[0]
+
+        def get_value(entry):
+            for getter in lItemGetter:
+                entry = getter(entry)
+            return entry
+        return get_value
+
+    def prepare(self, qs):
+        """Make sure the objects on the attribute paths come with the query of [qs] itself"""
+
+        if isinstance(qs, QuerySet) and qs._result_cache == None and len(self.lRelated) > 0 and \
+           qs.query.select_related == False:
+            qs = qs.select_related(*self.lRelated)
+        return qs
+
+    def get_rows(self, qs):
+        """Turn the sorted entries [qs] into a list of [GroupRow] objects
+
+        A variable is 'first' when its value differs from that of the previous
+        entry, or when a variable before it is 'first'. The previous entry
+        then is its 'last', unless that value was empty.
+        """
+
+        lRow = []
+        lPrev = [""] * len(self.lVar)
+        lShift = [2 * j for j in range(len(self.lVar))]
+        oPrev = None
+        for entry in self.prepare(qs):
+            lGetter = self.lDictGetter if isinstance(entry, dict) else self.lGetter
+            iFlags = 0
+            bChanged = False
+            for j, getter in enumerate(lGetter):
+                value = getter(entry)
+                if bChanged or value != lPrev[j]:
+                    iFlags |= FIRST << lShift[j]
+                    if oPrev != None and lPrev[j] != "":
+                        oPrev.flags |= LAST << lShift[j]
+                    lPrev[j] = value
+                    bChanged = True
+            oPrev = GroupRow(entry, iFlags, self.shift)
+            lRow.append(oPrev)
+        # The last entry closes all groups
+        if oPrev != None:
+            oPrev.flags |= self.iAllLast
+        return lRow
+
+
+def get_item_list(lVar, lFun, qs):
+    """Turn the queryset [qs] into a list of Items that have first and last information"""
+
+    oErr = ErrHandle()
+    try:
+        lItem = Grouping.get(lVar, lFun).get_rows(qs)
+    except:
+        oErr.DoError("get_item_list error")
+        lItem = []
+
+    # Return the list we have made
+    return lItem
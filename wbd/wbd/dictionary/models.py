@@ -8,6 +8,7 @@ The dialects are identified by locations, and the locations are indicated by a '
 from django.contrib.auth.models import User
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
+from django.db import DatabaseError
 from django.db import models
 from django.db.models import Q
 from datetime import datetime
@@ -20,6 +21,7 @@ import io
 import codecs
 import html
 import json
+import hashlib
 
 
 MAX_IDENTIFIER_LEN = 10
@@ -288,6 +290,27 @@ class HelpChoice(models.Model):
         return help_text
 
 
+def parse_point(sPoint):
+    """Get the latitude and longitude of a 'lat, lng' string, or (None, None) if it has none"""
+
+    if sPoint == None:
+        return None, None
+    lPart = sPoint.split(",")
+    if len(lPart) != 2:
+        return None, None
+    try:
+        return float(lPart[0]), float(lPart[1])
+    except ValueError:
+        return None, None
+
+def set_latlng(sender, instance, raw=False, **kwargs):
+    """Keep the [latitude] and [longitude] of a Coordinate in line with its [point]
+
+    Connected to pre_save (see apps.py), which also covers [loaddata] (raw=True).
+    """
+
+    instance.latitude, instance.longitude = parse_point(instance.point)
+
 def get_help(field):
     """Create the 'help_text' for this element"""
 
@@ -606,11 +629,32 @@ class Coordinate(models.Model):
     dictionary = models.CharField("Dictionary", db_index=True, blank=True, max_length=MAX_LEMMA_LEN)
     # [0-1] The point coordinates
     point = models.CharField("Coordinates", db_index=True, blank=True, max_length=MAX_LEMMA_LEN)
+    # [0-1] The same point as numbers (calculated from [point] when saving)
+    latitude = models.FloatField("Latitude", null=True, blank=True)
+    longitude = models.FloatField("Longitude", null=True, blank=True)
+
+    class Meta:
+        index_together = ['latitude', 'longitude']
 
     def __str__(self):
         sBack = "{}: {}".format(self.kloeke, self.place)
         return sBack
 
+    def install(sender=None, using="default", **kwargs):
+        """Calculate the latitude and longitude of the points that do not have them yet"""
+
+        try:
+            lChanged = []
+            for obj in Coordinate.objects.using(using).filter(latitude__isnull=True).exclude(point="").only('id', 'point'):
+                obj.latitude, obj.longitude = parse_point(obj.point)
+                if obj.latitude != None:
+                    lChanged.append(obj)
+        except DatabaseError:
+            # E.g. when the columns do not exist yet
+            return
+        with transaction.atomic(using=using):
+            Coordinate.objects.using(using).bulk_update(lChanged, ['latitude', 'longitude'], batch_size=500)
+
 
 class Dialect(models.Model):
     """Dialect"""
@@ -878,6 +922,72 @@ class Repair(models.Model):
         self.save()
 
 
+class ListCache(models.Model):
+    """Number of items and page cursors of one filtered list view
+
+    The lists only change through imports, repairs and changes of [toonbaar],
+    and each of these clears the whole cache.
+    """
+
+    # Hash of the view and its normalized filter parameters
+    key = models.CharField("Sleutel", blank=False, max_length=MAX_LEMMA_LEN, unique=True)
+    # Number of items in the list
+    count = models.IntegerField("Aantal", blank=False, default=0)
+    # Per item offset: the sort key and id of the item before it (JSON)
+    cursors = models.TextField("Cursors", blank=False, default="{}")
+    created = models.DateTimeField("Aangemaakt", auto_now_add=True)
+
+    # GET parameters that do not change the contents of a list
+    skip_params = ['page', 'paginate_by', 'submit_type', 'csrfmiddlewaretoken']
+    # Do not remember more than this number of cursors per list
+    max_cursors = 1000
+
+    def __str__(self):
+        return "{}: {}".format(self.key, self.count)
+
+    def get_key(sView, get):
+        """Turn the view name and the filter parameters in [get] into a key"""
+
+        lParam = []
+        for sName in sorted(get.keys()):
+            if sName not in ListCache.skip_params:
+                lValue = get.getlist(sName) if hasattr(get, 'getlist') else [get[sName]]
+                lValue = [str(x).strip() for x in lValue if str(x).strip() != ""]
+                if len(lValue) > 0:
+                    lParam.append([sName, lValue])
+        sParams = json.dumps([sView, lParam])
+        return hashlib.md5(sParams.encode("utf-8")).hexdigest()
+
+    def get_item(sView, get, qs):
+        """Get the cache item of this list, counting [qs] only if it is not there yet"""
+
+        sKey = ListCache.get_key(sView, get)
+        oItem = ListCache.objects.filter(key=sKey).first()
+        if oItem == None:
+            oItem, bCreated = ListCache.objects.get_or_create(key=sKey, defaults={'count': qs.count()})
+        return oItem
+
+    def get_cursor(self, iOffset):
+        return json.loads(self.cursors).get(str(iOffset))
+
+    def set_cursor(self, iOffset, lCursor):
+        """Remember [lCursor] as the position before the item at [iOffset]
+
+        The cursors are kept per item offset, not per page number, so that
+        lists shown with a different [paginate_by] can share them.
+        """
+
+        dCursor = json.loads(self.cursors)
+        sOffset = str(iOffset)
+        if dCursor.get(sOffset) != lCursor and (sOffset in dCursor or len(dCursor) < ListCache.max_cursors):
+            dCursor[sOffset] = lCursor
+            self.cursors = json.dumps(dCursor)
+            ListCache.objects.filter(id=self.id).update(cursors=self.cursors)
+
+    def clear():
+        ListCache.objects.all().delete()
+
+
 class Aflevering(models.Model):
     """Aflevering van een woordenboek"""
 
@@ -910,6 +1020,12 @@ class Aflevering(models.Model):
         verbose_name_plural = "Afleveringen"
         index_together = ['deel', 'sectie', 'aflnum']
 
+    # Process-wide map of aflevering id to its summary information (see [get_info])
+    info_map = {}
+    info_version = None
+    info_changes = 0    # Number of changes made within this process
+    info_ttl = 60       # Reload at least every [info_ttl] seconds, to see changes of other processes
+
     def __str__(self):
         return self.naam
 
@@ -924,6 +1040,9 @@ class Aflevering(models.Model):
             Lemma.change_toonbaar()
             Trefwoord.change_toonbaar()
             Dialect.change_toonbaar()
+            ListCache.clear()
+        # Make sure the map of [get_info] gets reloaded
+        Aflevering.info_changes += 1
         return result
 
     def get_number(self):
@@ -933,14 +1052,50 @@ class Aflevering(models.Model):
             iNumber = self.sectie * 10 + self.aflnum
         return iNumber
 
+    def get_info_version():
+        return (Aflevering.info_changes, int(time.time() // Aflevering.info_ttl))
+
+    def get_info(iId):
+        """Get the summary, sort key, pdf and deel number of aflevering [iId]
+
+        These come from a process-wide map, which is loaded with one query
+        (there are not that many afleveringen), and again when its version changes.
+        """
+
+        iVersion = Aflevering.get_info_version()
+        if Aflevering.info_version != iVersion:
+            dicInfo = {}
+            for afl in Aflevering.objects.select_related('deel'):
+                dicInfo[afl.id] = {'summary': afl.calc_summary(), 'key': afl.calc_key(), 'pdf': afl.calc_pdf(),
+                                   'deel': afl.deel.nummer}
+            Aflevering.info_map = dicInfo
+            Aflevering.info_version = iVersion
+        return Aflevering.info_map.get(iId)
+
     def get_summary(self):
+        oInfo = Aflevering.get_info(self.id)
+        return self.calc_summary() if oInfo == None else oInfo['summary']
+
+    def get_pdf(self):
+        oInfo = Aflevering.get_info(self.id)
+        return self.calc_pdf() if oInfo == None else oInfo['pdf']
+
+    def calc_key(self):
+        """The sort key of this aflevering, e.g. 'd3-s2-a1'"""
+        sAfl = "d" + str(self.deel.nummer) + "-"
+        if self.sectie != None:
+            sAfl += "s" + str(self.sectie) + "-"
+        sAfl += "a" + str(self.aflnum)
+        return sAfl
+
+    def calc_summary(self):
         sSum = int_to_roman(self.deel.nummer) + "-"
         if self.sectie != None:
             sSum += str(self.sectie) + "-"
         sSum += str(self.aflnum)
         return sSum
 
-    def get_pdf(self):
+    def calc_pdf(self):
         # sPdf =  "{}/static/dictionary/content/pdf{}/{}".format(APP_PREFIX, self.deel.nummer,self.naam)
         sPdf =  "wbd-{}/{}".format(self.deel.nummer,self.naam)
         return sPdf
@@ -1054,6 +1209,10 @@ class Entry(models.Model):
             ["lemma", "aflevering"],
           ]
 
+    # What a listing page needs with each entry (the afleveringen come from [Aflevering.get_info])
+    listing_related = ['lemma', 'descr', 'dialect', 'trefwoord', 'aflevering']
+    listing_prefetch = ['mijnlijst']
+
     def __str__(self):
         return self.woord + '_' + self.dialect.nieuw
 
@@ -1086,7 +1245,7 @@ class Entry(models.Model):
 
     def dialectopgave(self):
         sWoord = "*"
-        # Are we allowed to show it?
+        # Are we allowed to show it? (not from [Aflevering.get_info], which may lag behind other processes)
         if self.aflevering.toonbaar:
             sWoord = self.woord
         return sWoord
@@ -1095,12 +1254,8 @@ class Entry(models.Model):
         return self.toelichting
 
     def get_aflevering(self):
-        afl = self.aflevering
-        sAfl = "d" + str(afl.deel.nummer) + "-"
-        if afl.sectie != None:
-            sAfl += "s" + str(afl.sectie) + "-"
-        sAfl += "a" + str(afl.aflnum)
-        return sAfl
+        oInfo = Aflevering.get_info(self.aflevering_id)
+        return self.aflevering.calc_key() if oInfo == None else oInfo['key']
 
     def get_lemma_gloss(self):
         return self.lemma.gloss + '_' + self.woord
@@ -1301,18 +1456,7 @@ class FixOut:
             # Make sure numeric values are 
             # Check all the items given: do it reversed, because then we have the best chance of getting something
             for it in reversed(arItem):
-                # Assume we are okay
-                bFound = True
-                # Look through all the (k,v) pairs of [oFields]
-                for (k,v) in oFields.items():
-                    try:
-                        if k in oFields and getattr(it, k) != v:
-                            bFound = False
-                            break
-                    except:
-                        # No need to stop here
-                        a = 1
-                if bFound:
+                if fElement.matches(it, oFields):
                     return getattr(it, 'pk')
     
             # getting here means we haven't found it
@@ -1327,7 +1471,8 @@ class FixOut:
             iPkItem = -1
             # Look for this item in the list that we have
             if bSearch:
-                iPkItem = self.findItem(oCls.lstItem, **oFields)
+                # Use the index of the registry instead of walking [lstItem]
+                iPkItem = oCls.find_pk(**oFields)
             if iPkItem < 0:
                 # it is not in the list: add it
                 if 'pk' in oFields:
@@ -1338,7 +1483,7 @@ class FixOut:
 
                 iPkItem += 1
                 newItem = fElement(iPkItem, **oFields)
-                oCls.lstItem.append(newItem)
+                oCls.add_item(newItem)
                 # Add the item to the output
                 self.append(sModel, iPkItem, **oFields)
 
@@ -1355,114 +1500,220 @@ class fElement:
             setattr(self, k, v)
         self.pk = iPk
 
+    def matches(it, oFields):
+        """Check if element [it] has the values in [oFields]
+
+        Note: a field that [it] does not have, does not count as a mismatch
+        """
+
+        # Look through all the (k,v) pairs of [oFields]
+        for (k,v) in oFields.items():
+            try:
+                if getattr(it, k) != v:
+                    return False
+            except:
+                # No need to stop here
+                pass
+        return True
+
+
+class fRegistry:
+    """Registry of items that are (or will be) part of a fixture
+
+    Next to the list [lstItem] of known items, a dictionary [dicItem] is kept.
+    It is keyed on the values of the [keyfields], and it points to the positions
+    of the items with that key in [lstItem]. Looking for an item then only needs
+    to consider the (very few) items in one bucket instead of the whole list.
+
+    Note: each derived class must define its own [lstItem], [dicItem] and [lstLoose]
+    """
+
+    keyfields = []  # Names of the fields that make up the natural key
+    pk = 0          # Initialise PK
+    lstItem = []    # Array of known items
+    dicItem = {}    # Index: key values -> list of positions in [lstItem]
+    lstLoose = []   # Positions of items that lack one or more of the [keyfields]
+
+    def get_key(self, oFields):
+        """Get the key for [oFields], or None if it cannot be made"""
+
+        try:
+            key = tuple(oFields[k] for k in self.keyfields)
+            # Make sure the key can be used in the dictionary
+            hash(key)
+        except:
+            key = None
+        return key
+
+    def add_item(self, item):
+        """Add [item] to the list of known items and to the index"""
+
+        idx = len(self.lstItem)
+        self.lstItem.append(item)
+        key = self.get_key(item.__dict__)
+        if key == None:
+            self.lstLoose.append(idx)
+        else:
+            self.dicItem.setdefault(key, []).append(idx)
+
+    def find_pk(self, **oFields):
+        """Find the PK of the last added item matching [oFields], or return -1"""
+
+        try:
+            # Sanity check
+            if len(self.lstItem) == 0:
+                return -1
+            key = self.get_key(oFields)
+            if key == None:
+                # Cannot use the index: consider all items
+                lstIdx = range(len(self.lstItem))
+            elif len(self.lstLoose) == 0:
+                lstIdx = self.dicItem.get(key, [])
+            else:
+                lstIdx = sorted(self.dicItem.get(key, []) + self.lstLoose)
+            # Check the candidates reversed, just like [FixOut.findItem] does
+            for idx in reversed(lstIdx):
+                it = self.lstItem[idx]
+                if fElement.matches(it, oFields):
+                    return it.pk
+
+            # getting here means we haven't found it
+            return -1
+        except:
+            errHandle.DoError("fRegistry/find_pk", True)
+
 
-class fLemma:
+class fLemma(fRegistry):
     """Lemma information to fixture"""
 
+    keyfields = ['gloss']
     pk = 0         # Initialise PK
     lstItem = []   # Array of known lemma's
+    dicItem = {}
+    lstLoose = []
 
     def load(self, qs):
         if qs:
             for item in qs:
                 # Add this item to the list we have
-                self.lstItem.append(fElement(item.pk, gloss=item.gloss))
+                self.add_item(fElement(item.pk, gloss=item.gloss))
                 self.pk = item.pk
 
 
-class fDescr:
+class fDescr(fRegistry):
     """Description information to fixture"""
 
+    keyfields = ['bronnenlijst', 'toelichting', 'boek']
     pk = 0         # Initialise PK
     lstItem = []   # Array of known lemma's
+    dicItem = {}
+    lstLoose = []
 
     def load(self, qs):
         if qs:
             for item in qs:
                 # Add this item to the list we have
-                self.lstItem.append(fElement(item.pk, 
+                self.add_item(fElement(item.pk, 
                                              bronnenlijst=item.bronnenlijst, 
                                              toelichting=item.toelichting, 
                                              boek=item.boek))
                 self.pk = item.pk
 
 
-class fLemmaDescr:
+class fLemmaDescr(fRegistry):
     """Connection between lemma and description information to fixture"""
 
+    keyfields = ['lemma', 'description']
     pk = 0         # Initialise PK
     lstItem = []   # Array of known lemma's
+    dicItem = {}
+    lstLoose = []
 
     def load(self, qs):
         if qs:
             for item in qs:
                 # Add this item to the list we have
-                self.lstItem.append(fElement(item.pk, lemma=item.lemma, description=item.description))
+                self.add_item(fElement(item.pk, lemma=item.lemma, description=item.description))
                 self.pk = item.pk
 
 
-class fEntryMijn:
+class fEntryMijn(fRegistry):
     """Connection between entry and mijn information to fixture"""
 
+    keyfields = ['entry', 'mijn']
     pk = 0         # Initialise PK
     lstItem = []   # Array of known items
+    dicItem = {}
+    lstLoose = []
 
     def load(self, qs):
         if qs:
             for item in qs:
                 # Add this item to the list we have
-                self.lstItem.append(fElement(item.pk, entry=item.entry, mijn=item.mijn))
+                self.add_item(fElement(item.pk, entry=item.entry, mijn=item.mijn))
                 self.pk = item.pk
 
 
-class fDialect:
+class fDialect(fRegistry):
     """Dialect information to fixture"""
 
+    keyfields = ['stad', 'nieuw']
     pk = 0         # Initialise PK
     lstItem = []   # Array of known dialects
+    dicItem = {}
+    lstLoose = []
 
     def load(self, qs):
         if qs:
             for item in qs:
                 # Add this item to the list we have
                 added = fElement(item.pk, stad=item.stad, nieuw=item.nieuw)
-                self.lstItem.append(added)
+                self.add_item(added)
                 self.pk = item.pk
 
 
-class fTrefwoord:
+class fTrefwoord(fRegistry):
     """Trefwoord information to fixture"""
 
+    keyfields = ['woord']
     pk = 0         # Initialise PK
     lstItem = []   # Array of known items
+    dicItem = {}
+    lstLoose = []
 
     def load(self, qs):
         if qs:
             for item in qs:
                 # Add this item to the list we have
-                self.lstItem.append(fElement(item.pk, woord=item.woord))
+                self.add_item(fElement(item.pk, woord=item.woord))
                 self.pk = item.pk
 
 
-class fMijn:
+class fMijn(fRegistry):
     """Mijn information to fixture"""
 
+    keyfields = ['naam']
     pk = 0         # Initialise PK
     lstItem = []   # Array of known items
+    dicItem = {}
+    lstLoose = []
 
     def load(self, qs):
         if qs:
             for item in qs:
                 # Add this item to the list we have
-                self.lstItem.append(fElement(item.pk, naam=item.naam))
+                self.add_item(fElement(item.pk, naam=item.naam))
                 self.pk = item.pk
 
 
-class fAflevering:
+class fAflevering(fRegistry):
     """Aflevering information to fixture"""
 
+    keyfields = ['deel', 'aflnum']
     pk = 0         # Initialise PK
     lstItem = []   # Array of known dialects
+    dicItem = {}
+    lstLoose = []
 
     def load(self, qs):
         try:
@@ -1479,23 +1730,26 @@ class fAflevering:
                             added = fElement(item.pk, deel=item.deel, aflnum=item.aflnum)
                         except:
                             a = 1
-                    self.lstItem.append(added)
+                    self.add_item(added)
                     self.pk = item.pk
         except:
             errHandle.DoError("fAflevering", True)
 
 
-class fEntry:
+class fEntry(fRegistry):
     """Entry information to fixture"""
 
+    keyfields = ['woord']
     pk = 0         # Initialise PK
     lstItem = []   # Array of known dialects
+    dicItem = {}
+    lstLoose = []
 
     def load(self, qs):
         if qs:
             for item in qs:
                 # Add this item to the list we have
-                self.lstItem.append(fElement(item.pk, woord=item.woord, 
+                self.add_item(fElement(item.pk, woord=item.woord, 
                                       toelichting=item.toelichting, 
                                       kloeketoelichting=item.kloeketoelichting, 
                                       lemma=item.lemma, 
@@ -0,0 +1 @@
+default_app_config = 'wgd.dictionary.apps.dictionaryConfig'
@@ -1,5 +1,15 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate, pre_save
 
 
 class dictionaryConfig(AppConfig):
-    name = 'dictionary'
+    name = 'wgd.dictionary'
+
+    def ready(self):
+        # Keep the search indexes in place after migrating
+        from wgd.dictionary.search import search_install
+        post_migrate.connect(search_install, sender=self)
+        # Keep the coordinates as numbers next to their points
+        from wgd.dictionary.models import Coordinate, set_latlng
+        pre_save.connect(set_latlng, sender=Coordinate)
+        post_migrate.connect(Coordinate.install, sender=self)
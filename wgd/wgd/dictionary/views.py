@@ -11,7 +11,7 @@ from django.urls import reverse
 from django.template import RequestContext, loader
 from django.template.loader import render_to_string
 from django.db import connection
-from django.db.models import Q
+from django.db.models import Q, F
 from django.db.models.functions import Lower
 from django.http import JsonResponse
 from datetime import datetime
@@ -35,7 +35,10 @@ from wgd.dictionary.forms import *
 from wgd.mapview.views import MapView
 #from wgd.dictionary.adminviews import order_queryset_by_sort_order
 from wgd.settings import APP_PREFIX, WSGI_FILE
-from wgd.dictionary.conversion import rd_to_wgs, wgs_to_rd
+from wgd.dictionary.conversion import rd_to_wgs, wgs_to_rd, rd_to_wgs_batch
+from wgd.dictionary.search import adapt_search, strip_garbage, search_q
+from wgd.dictionary.grouping import get_item_list
+from wgd.dictionary.paging import KeysetPaginator
 
 # Global variables
 paginateSize = 10
@@ -45,7 +48,6 @@ paginateEntries = 100
 paginateValues = (100, 50, 20, 10, 5, 2, 1, )
 paginateMax = 100
 outputColumns = ['begrip', 'trefwoord', 'dialectopgave', 'Kloekecode', 'aflevering', 'bronnenlijst']
-rGarbage = re.compile(r'[^a-zA-Z0-9 -\#\[\]\?\*]')
 
 THIS_DICTIONARY = "e-WGD"
 
@@ -102,64 +104,6 @@ def order_queryset_by_sort_order(get, qs, sOrder = 'gloss'):
     # return the ordered list
     return ordered
 
-def get_item_list(lVar, lFun, qs):
-    """Turn the queryset [qs] into a list of Items that have first and last information"""
-
-    lItem = []
-    oErr = ErrHandle()
-    try:
-        # Initialize the variables whose changes are important
-        oVariable = {}
-        for i, key in enumerate(lVar):
-            oVariable[key] = "" # {'name': key, 'fun': lFun[i]}
-        iLast = len(qs)-1
-        # Iterate over the entries looking for first, last etc
-        for i, entry in enumerate(qs):
-            bIsLastEntry = (i==iLast)
-            oItem = {'entry': entry}
-            for k in lVar:
-                oItem[k] = {'first':False, 'last':False}
-            bIsDict = isinstance(entry, dict)
-            bVarIsLast = False
-            # Check for changes in all the variables
-            for j, k in enumerate(lVar):
-                fun = lFun[j]
-                if callable(fun):
-                    sValue = fun(entry)
-                else:
-                    for idx, val in enumerate(fun):
-                        if idx==0:
-                            if bIsDict:
-                                sValue = entry[val]
-                            else:
-                                sValue = getattr(entry, val)
-                        else:
-                            if bIsDict:
-                                sValue = sValue[val]
-                            else:
-                                sValue = getattr(sValue, val)
-                # Check for changes in the value of the variable 
-                # if sValue != oVariable[k]:
-                if sValue != oVariable[k] or bVarIsLast or (i>0 and lItem[i-1][k]['last']):
-                    # Check if the previous one's [last] must be changed
-                    if oVariable[k] != "": lItem[i-1][k]['last'] = True
-                    # Adapt the current one's [first] property
-                    oItem[k]['first']= True
-                    # Adapt the variable
-                    oVariable[k] = sValue      
-                    # Indicate that the next ones should be regarded as 'last'
-                    bVarIsLast = True      
-                # Check if this is the last
-                if bIsLastEntry: oItem[k]['last'] = True
-            # Add this object to the list of items
-            lItem.append(oItem)
-    except:
-        oErr.DoError("get_item_list error")
-        lItem = []
-
-    # Return the list we have made
-    return lItem
-
 def recude_dialect_stad(lEntry):
 
     lReduced = []
@@ -169,21 +113,21 @@ def recude_dialect_stad(lEntry):
         bStadReduction = False
         for oItem in lEntry:
             # Check if we are inside a reduction
-            if bStadReduction and oItem['dialect_stad']['last']:
+            if bStadReduction and oItem.is_last('dialect_stad'):
                 # We can now turn off reduction
                 bStadReduction = False
                 # Make sure we keep 'dialectopgave' up to date 
                 if len(lReduced) > 0:
-                    lReduced[-1]['dialectopgave']['last'] = oItem['dialectopgave']['last']
+                    lReduced[-1].set_last('dialectopgave', oItem.is_last('dialectopgave'))
             else:
                 # Check if we need to start reducing
-                if oItem['dialect_stad']['first']:
-                    if oItem['dialect_stad']['last']:
+                if oItem.is_first('dialect_stad'):
+                    if oItem.is_last('dialect_stad'):
                         # Simply copy
                         lReduced.append(oItem)
                     else:
                         # Indicate this is the last one anyway
-                        oItem['dialect_stad']['last'] = True
+                        oItem.set_last('dialect_stad')
                         # Indicate we are starting to reduce
                         bStadReduction = True
                         # This one should be added
@@ -320,24 +264,6 @@ def do_compare(request):
     )
 
 
-def adapt_search(val):
-    # First trim
-    val = strip_garbage(val).strip()    
-    # Adapt for the use of '#'
-    if '#' in val:
-        # val = val.replace('#', '\\b.*')
-        #val = r'(^|\b)' + fnmatch.translate(val.replace('#', '')) + r'($|\b)'
-        val = r'(^|(.*\b))' + val.replace('#', r'((\b.*)|$)') # + r'((\b.*)|$)'
-    else:
-        val = '^' + fnmatch.translate(val) + '$'
-    return val
-
-def strip_garbage(val):
-    """Remove any garbage characters from the value"""
-
-    val = rGarbage.sub('', val)
-    return val
-
 def export_csv(qs, sFileName):
     # Create the HttpResponse object with the appropriate CSV header.
     response = HttpResponse(content_type='text/csv')
@@ -447,6 +373,9 @@ def do_repair_start(request):
         if not bResult:
             data['status'] = "error"
 
+    # Repairs change what the list views show
+    ListCache.clear()
+
     # Return this response
     return JsonResponse(data)
 
@@ -489,6 +418,9 @@ def import_csv_start(request):
             else:
                 bUseDbase = False
 
+        # Keep the rows of the Excel file in a cache (unless told otherwise)
+        bUseCache = (request.GET.get('usecache', "true") != "false")
+
         # Get the id of the Info object
         if iSectie==None or iSectie == "":
             info = Info.objects.filter(deel=iDeel, aflnum=iAflnum).first()
@@ -512,10 +444,14 @@ def import_csv_start(request):
 
         # Call the process
         # WGD: use EXCEL_to_fixture instead of CSV_to_fixture
-        oResult = excel_to_fixture(sFile, iDeel, iSectie, iAflnum, iStatus, bUseDbase = bUseDbase, bUseOld = True)
+        oResult = excel_to_fixture(sFile, iDeel, iSectie, iAflnum, iStatus, bUseDbase = bUseDbase, bUseOld = True,
+                                   bUseCache = bUseCache)
         if oResult == None or oResult['result'] == False:
             data['status'] = 'error'
 
+        # Imports change what the list views show
+        ListCache.clear()
+
         # WSince we are done: explicitly set the status so
         oStatus.set_status("done")
     except Exception as ex:
@@ -616,20 +552,36 @@ def import_kloeke_info():
         with open(file, "r", encoding="utf-8") as fd:
             lKloekeInfo = json.load(fd)
 
+        # The existing coordinates and dialects per kloeke code, folded the way [__iexact] does
+        #   (the first one is the one that [filter().first()] would give)
+        dicCoordinate = {}
+        for obj in Coordinate.objects.order_by('id'):
+            dicCoordinate.setdefault(fold_ascii(obj.kloeke), obj)
+        dicDialect = {}
+        for dialect in Dialect.objects.order_by('id'):
+            dicDialect.setdefault(fold_ascii(dialect.nieuw), dialect)
+
+        # Convert the coordinates of all new kloeke codes at once
+        lNew = [oInfo for oInfo in lKloekeInfo if fold_ascii(oInfo[1]) not in dicCoordinate]
+        lPhi, lLam = rd_to_wgs_batch([x[3] for x in lNew], [x[4] for x in lNew])
+        dicPoint = {}
+        for idx, oInfo in enumerate(lNew):
+            dicPoint.setdefault(fold_ascii(oInfo[1]), '{}, {}'.format(lPhi[idx], lLam[idx]))
+
         with transaction.atomic():
             for oInfo in lKloekeInfo:
                 # Each item contains 5 elements: id, kloeke, place, x, y
                 kloeke = oInfo[1]
-                obj = Coordinate.objects.filter(kloeke__iexact=kloeke).first()
+                sKey = fold_ascii(kloeke)
+                obj = dicCoordinate.get(sKey)
                 if obj == None:
                     place = oInfo[2]
-                    point_lst = rd_to_wgs(oInfo[3], oInfo[4])
-                    point = '{}, {}'.format(point_lst[0], point_lst[1])
-                    obj = Coordinate.objects.create(kloeke=kloeke, place=place, point=point)
+                    obj = Coordinate.objects.create(kloeke=kloeke, place=place, point=dicPoint[sKey])
+                    dicCoordinate[sKey] = obj
                 # Check if the link from [Dialect] has already been made
-                dialect = Dialect.objects.filter(nieuw__iexact=kloeke).first()
+                dialect = dicDialect.get(sKey)
                 if dialect != None:
-                    if dialect.coordinate == None:
+                    if dialect.coordinate_id == None:
                         dialect.coordinate = obj
                         dialect.save()
 
@@ -822,6 +774,7 @@ class TrefwoordListView(ListView):
     # paginate_by = paginateEntries
     paginate_by = paginateSize
     entrycount = 0
+    listcache = None    # The [ListCache] item of the current list
     bUseMijnen = False  # Limburg uses mijnen, Brabant not
     bWbdApproach = True # Filter using the WGD approach
     qEntry = None
@@ -837,7 +790,7 @@ class TrefwoordListView(ListView):
                 # Get the PKs of Entry related to Trefwoord
                 qs = self.get_queryset()
             # Get the Entry queryset related to this
-            qs = Entry.objects.filter(trefwoord__pk__in=qs).select_related()
+            qs = Entry.objects.filter(trefwoord__pk__in=qs.order_by().values('id')).select_related()
         else:
             qs = self.qEntry
         return qs
@@ -1003,6 +956,11 @@ class TrefwoordListView(ListView):
         """
         return self.request.GET.get('paginate_by', self.paginate_by)
 
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        """Use the cached count and the page cursors of this list"""
+        return KeysetPaginator(queryset, per_page, self.listcache, orphans=orphans,
+                               allow_empty_first_page=allow_empty_first_page, **kwargs)
+
     def get_entryset(self, page_obj):
         lstQ = []
         bHasSearch = False
@@ -1032,42 +990,38 @@ class TrefwoordListView(ListView):
 
                 # Check for dialectwoord
                 if 'dialectwoord' in get and get['dialectwoord'] != '':
-                    val = adapt_search(get['dialectwoord'])
                     # Adapt Entry filter
                     if self.strict:
-                        lstQ.append(Q(woord__iregex=val))
+                        lstQ.append(search_q(Entry, 'woord', get['dialectwoord']))
                     else:
-                        lstQ.append(Q(entry__woord__iregex=val))
+                        lstQ.append(search_q(Entry, 'entry__woord', get['dialectwoord']))
                     bHasFilter = True
 
                 # Check for lemma
                 if 'lemma' in get and get['lemma'] != '':
-                    val = adapt_search(get['lemma'])
                     # Adapt Entry filter
                     if self.strict:
-                        lstQ.append(Q(lemma__gloss__iregex=val))
+                        lstQ.append(search_q(Entry, 'lemma__gloss', get['lemma']))
                     else:
-                        lstQ.append(Q(entry__lemma__gloss__iregex=val))
+                        lstQ.append(search_q(Entry, 'entry__lemma__gloss', get['lemma']))
                     bHasFilter = True
 
                 # Check for dialect city
                 if 'dialectCity' in get and get['dialectCity'] != '':
-                    val = adapt_search(get['dialectCity'])
                     # Adapt Entry filter
                     if self.strict:
-                        lstQ.append(Q(dialect__stad__iregex=val))
+                        lstQ.append(search_q(Entry, 'dialect__stad', get['dialectCity']))
                     else:
-                        lstQ.append(Q(entry__dialect__stad__iregex=val))
+                        lstQ.append(search_q(Entry, 'entry__dialect__stad', get['dialectCity']))
                     bHasFilter = True
 
                 # Check for dialect code (Kloeke)
                 if 'dialectCode' in get and get['dialectCode'] != '':
-                    val = adapt_search(get['dialectCode'])
                     # Adapt Entry filter
                     if self.strict:
-                        lstQ.append(Q(dialect__nieuw__iregex=val))
+                        lstQ.append(search_q(Entry, 'dialect__nieuw', get['dialectCode']))
                     else:
-                        lstQ.append(Q(entry__dialect__nieuw__iregex=val))
+                        lstQ.append(search_q(Entry, 'entry__dialect__nieuw', get['dialectCode']))
                     bHasFilter = True
 
                 # Check for aflevering
@@ -1098,7 +1052,7 @@ class TrefwoordListView(ListView):
 
                 # Order: "trefwoord_woord", "lemma_gloss", "dialectopgave", "dialect_stad"
                 # Make sure we apply the filter
-                qse = Entry.objects.filter(*lstQ).distinct().select_related().order_by(
+                qse = Entry.objects.filter(*lstQ).distinct().select_related(*Entry.listing_related).prefetch_related(*Entry.listing_prefetch).order_by(
                     Lower('trefwoord__woord'), 
                     'lemma__gloss',  
                     Lower('toelichting'),
@@ -1133,12 +1087,7 @@ class TrefwoordListView(ListView):
             # Fine-tuning: search string is the LEMMA
             if 'search' in get and get['search'] != '':
                 val = strip_garbage(get['search'])
-                if '*' in val or '[' in val or '?' in val or '#' in val:
-                    val = adapt_search(val)
-                    lstQ.append(Q(woord__iregex=val) )
-                else:
-                    # Strive for equality, but disregard case
-                    lstQ.append(Q(woord__iexact=val))
+                lstQ.append(search_q(Trefwoord, 'woord', val))
                 #val = adapt_search(get['search'])
                 ## Use the 'woord' attribute of Trefwoord
                 #lstQ.append(Q(woord__iregex=val) )
@@ -1150,37 +1099,32 @@ class TrefwoordListView(ListView):
 
             # Check for 'toelichting'
             if 'toelichting' in get and get['toelichting'] != '':
-                val = adapt_search(get['toelichting'])
                 # Try to get to the 'toelichting'
-                lstQ.append(Q(toelichting__iregex=val))
+                lstQ.append(search_q(Trefwoord, 'toelichting', get['toelichting']))
                 bHasSearch = True
 
             # Check for dialectwoord
             if 'dialectwoord' in get and get['dialectwoord'] != '':
-                val = adapt_search(get['dialectwoord'])
                 # Adapt Entry filter
-                lstQ.append(Q(trefwoord_entries__woord__iregex=val))
+                lstQ.append(search_q(Trefwoord, 'trefwoord_entries__woord', get['dialectwoord']))
                 bHasFilter = True
 
             # Check for lemma
             if 'lemma' in get and get['lemma'] != '':
-                val = adapt_search(get['lemma'])
                 # Adapt Entry filter
-                lstQ.append(Q(trefwoord_entries__lemma__gloss__iregex=val))
+                lstQ.append(search_q(Trefwoord, 'trefwoord_entries__lemma__gloss', get['lemma']))
                 bHasFilter = True
 
             # Check for dialect city
             if 'dialectCity' in get and get['dialectCity'] != '':
-                val = adapt_search(get['dialectCity'])
                 # Adapt Entry filter
-                lstQ.append(Q(trefwoord_entries__dialect__stad__iregex=val))
+                lstQ.append(search_q(Trefwoord, 'trefwoord_entries__dialect__stad', get['dialectCity']))
                 bHasFilter = True
 
             # Check for dialect code (Kloeke)
             if 'dialectCode' in get and get['dialectCode'] != '':
-                val = adapt_search(get['dialectCode'])
                 # Adapt Entry filter
-                lstQ.append(Q(trefwoord_entries__dialect__nieuw__iregex=val))
+                lstQ.append(search_q(Trefwoord, 'trefwoord_entries__dialect__nieuw', get['dialectCode']))
                 bHasFilter = True
 
             # Check for aflevering
@@ -1209,11 +1153,9 @@ class TrefwoordListView(ListView):
             # Debugging: mesaure time
             if self.bDoTime: iStart = get_now_time()
 
-            # Figure out which trefwoorden to exclude
-            trefwoord_exclude = Trefwoord.objects.filter(toonbaar=0)
-
-            # Create a QSE
-            qse = Trefwoord.objects.exclude(id__in=trefwoord_exclude).filter(*lstQ).select_related().order_by(Lower('woord')).distinct()
+            # Hidden trefwoorden are left out by their own [toonbaar] field, which needs no subquery
+            qse = Trefwoord.objects.exclude(toonbaar=0).filter(*lstQ).select_related().annotate(
+                sortkey=Lower('woord')).order_by('sortkey', 'id').distinct()
 
             # Debugging: time
             if self.bDoTime: 
@@ -1222,9 +1164,9 @@ class TrefwoordListView(ListView):
 
             # Note the number of ITEMS we have
             #   (The nature of these items depends on the approach taken)
-            # self.entrycount = qse.count()
-            # Using 'len' is faster since [qse] is being actually used again
-            self.entrycount = len(qse)
+            # The count is cached per filter, so that [qse] need not be loaded as a whole
+            self.listcache = ListCache.get_item("trefwoord", get, qse)
+            self.entrycount = self.listcache.count
 
             # Debugging: time
             if self.bDoTime: 
@@ -1246,6 +1188,7 @@ class LemmaListView(ListView):
     # paginate_by = paginateEntries
     paginate_by = paginateSize
     entrycount = 0
+    listcache = None    # The [ListCache] item of the current list
     bUseMijnen = False      # Limburg uses mijnen, Brabant not
     bWbdApproach = True     # Filter using the WGD approach
     bOrderWrdToel = False   # Use the word order 'dialectopgave-toelichting' if True
@@ -1264,7 +1207,7 @@ class LemmaListView(ListView):
                 # Get the Lemma PKs
                 qs = self.get_queryset()
             # Get the Entry queryset related to this
-            qs = Entry.objects.filter(lemma__pk__in=qs).select_related()
+            qs = Entry.objects.filter(lemma__pk__in=qs.order_by().values('id')).select_related()
         else:
             qs = self.qEntry
         return qs
@@ -1569,6 +1512,11 @@ class LemmaListView(ListView):
         Paginate by specified value in querystring, or use default class property value.
         """
         return self.request.GET.get('paginate_by', self.paginate_by)
+
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        """Use the cached count and the page cursors of this list"""
+        return KeysetPaginator(queryset, per_page, self.listcache, orphans=orphans,
+                               allow_empty_first_page=allow_empty_first_page, **kwargs)
         
     def get_entryset(self, page_obj):
         lstQ = []
@@ -1595,29 +1543,26 @@ class LemmaListView(ListView):
 
             # Check for dialect city
             if 'dialectCity' in get and get['dialectCity'] != '':
-                val = adapt_search(get['dialectCity'])
                 if self.strict:
-                    lstQ.append(Q(dialect__stad__iregex=val))
+                    lstQ.append(search_q(Entry, 'dialect__stad', get['dialectCity']))
                 else:
-                    lstQ.append(Q(entry__dialect__stad__iregex=val))
+                    lstQ.append(search_q(Entry, 'entry__dialect__stad', get['dialectCity']))
                 bHasFilter = True
 
             # Check for dialect code (Kloeke)
             if 'dialectCode' in get and get['dialectCode'] != '':
-                val = adapt_search(get['dialectCode'])
                 if self.strict:
-                    lstQ.append(Q(dialect__nieuw__iregex=val))
+                    lstQ.append(search_q(Entry, 'dialect__nieuw', get['dialectCode']))
                 else:
-                    lstQ.append(Q(entry__dialect__nieuw__iregex=val))
+                    lstQ.append(search_q(Entry, 'entry__dialect__nieuw', get['dialectCode']))
                 bHasFilter = True
 
             # Check for dialect word, which is a direct member of Entry
             if 'woord' in get and get['woord'] != '':
-                val = adapt_search(get['woord'])
                 if self.strict:
-                    lstQ.append(Q(woord__iregex=val))
+                    lstQ.append(search_q(Entry, 'woord', get['woord']))
                 else:
-                    lstQ.append(Q(entry__woord__iregex=val))
+                    lstQ.append(search_q(Entry, 'entry__woord', get['woord']))
                 bHasFilter = True
 
             # Check for aflevering
@@ -1658,14 +1603,14 @@ class LemmaListView(ListView):
             # Order: "lemma_gloss", "trefwoord_woord", "dialectopgave", "dialect_stad"
             if self.bDoTime: iStart = get_now_time()
             if self.bOrderWrdToel:
-                qse = Entry.objects.filter(*lstQ).distinct().select_related().order_by(
+                qse = Entry.objects.filter(*lstQ).distinct().select_related(*Entry.listing_related).prefetch_related(*Entry.listing_prefetch).order_by(
                     Lower('lemma__gloss'),  
                     Lower('trefwoord__woord'), 
                     Lower('woord'), 
                     Lower('toelichting'), 
                     Lower('dialect__stad'))
             else:
-                qse = Entry.objects.filter(*lstQ).distinct().select_related().order_by(
+                qse = Entry.objects.filter(*lstQ).distinct().select_related(*Entry.listing_related).prefetch_related(*Entry.listing_prefetch).order_by(
                     Lower('lemma__gloss'),  
                     Lower('trefwoord__woord'), 
                     Lower('toelichting'), 
@@ -1703,12 +1648,7 @@ class LemmaListView(ListView):
             # Fine-tuning: search string is the LEMMA
             if 'search' in get and get['search'] != '':
                 val = strip_garbage(get['search'])
-                if '*' in val or '[' in val or '?' in val or '#' in val:
-                    val = adapt_search(val)
-                    lstQ.append(Q(gloss__iregex=val) )
-                else:
-                    # Strive for equality, but disregard case
-                    lstQ.append(Q(gloss__iexact=val))
+                lstQ.append(search_q(Lemma, 'gloss', val))
                 bHasSearch = True
 
                 ## check for possible exact numbers having been given
@@ -1718,30 +1658,18 @@ class LemmaListView(ListView):
             # Check for dialect city
             if 'dialectCity' in get and get['dialectCity'] != '':
                 val = get['dialectCity']
-                if '*' in val or '[' in val or '?' in val or '#' in val:
-                    # val = adapt_search(get['dialectCity'])
-                    val = adapt_search(val)
-                    lstQ.append(Q(entry__dialect__stad__iregex=val))
-                else:
-                    # Strive for equality, but disregard case
-                    lstQ.append(Q(entry__dialect__stad__iexact=val))
+                lstQ.append(search_q(Lemma, 'entry__dialect__stad', val))
                 bHasFilter = True
 
             # Check for dialect code (Kloeke)
             if 'dialectCode' in get and get['dialectCode'] != '':
                 val = get['dialectCode']
-                if '*' in val or '[' in val or '?' in val or '#' in val:
-                    val = adapt_search(val)
-                    lstQ.append(Q(entry__dialect__nieuw__iregex=val))
-                else:
-                    # Strive for equality, but disregard case
-                    lstQ.append(Q(entry__dialect__nieuw__iexact=val))
+                lstQ.append(search_q(Lemma, 'entry__dialect__nieuw', val))
                 bHasFilter = True
 
             # Check for dialect word, which is a direct member of Entry
             if 'woord' in get and get['woord'] != '':
-                val = adapt_search(get['woord'])
-                lstQ.append(Q(entry__woord__iregex=val))
+                lstQ.append(search_q(Lemma, 'entry__woord', get['woord']))
                 bHasFilter = True
 
             # Check for aflevering
@@ -1764,10 +1692,9 @@ class LemmaListView(ListView):
                         lstQ.append(Q(entry__mijnlijst__id=iVal))
                         bHasFilter = True
 
-            # Method #8 -- use the lemma.toonbaar property
-            lemma_hide = Lemma.objects.filter(toonbaar=0)
-
-            qse = Lemma.objects.exclude(id__in=lemma_hide).filter(*lstQ).select_related().order_by('gloss').distinct()
+            # Hidden lemma's are left out by their own [toonbaar] field, which needs no subquery
+            qse = Lemma.objects.exclude(toonbaar=0).filter(*lstQ).select_related().annotate(
+                sortkey=F('gloss')).order_by('sortkey', 'id').distinct()
 
             # Time measurement
             if self.bDoTime:
@@ -1776,9 +1703,9 @@ class LemmaListView(ListView):
 
             # Note the number of ITEMS we have
             #   (The nature of these items depends on the approach taken)
-            # self.entrycount = qse.count()
-            # Note: while taking more time here, it saves time later
-            self.entrycount = len(qse)
+            # The count is cached per filter, so that [qse] need not be loaded as a whole
+            self.listcache = ListCache.get_item("lemma", get, qse)
+            self.entrycount = self.listcache.count
 
             # Time measurement
             if self.bDoTime:
@@ -1798,6 +1725,10 @@ class LemmaMapView(MapView):
     frmSearch = LemmaSearchForm
     order_by = ["trefwoord"]
     labelfield = "gloss"
+    geo_fields = ["trefwoord", "woord", "kloeke", "stad"]
+    popup_type = "lemma"
+    bbox_lat = "dialect__coordinate__latitude"
+    bbox_lng = "dialect__coordinate__longitude"
 
     def initialize(self):
         super(LemmaMapView, self).initialize()
@@ -1831,6 +1762,7 @@ class LocationListView(ListView):
     # paginate_by = paginateEntries # paginateSize
     paginate_by = paginateLocations    # Default pagination number SPECIFICALLY for dialects (1)
     entrycount = 0      # Number of items in queryset (whether Entry or Dialect!!)
+    listcache = None    # The [ListCache] item of the current list
     bUseMijnen = False  # Limburg uses mijnen, Brabant not, Gelderland neither
     bWbdApproach = True # Filter using the WGD approach
     bNewOrder = True    # Use the new order (see issue #22 of the RU-wld)
@@ -1853,7 +1785,7 @@ class LocationListView(ListView):
             # Get the Entry elements that refer to the set of dialects
             if not self.strict:
                 # Convert the [Dialect] elements in qs to [Entry] elements
-                qs = Entry.objects.filter(dialect__pk__in=qs).select_related()
+                qs = Entry.objects.filter(dialect__pk__in=qs.order_by().values('id')).select_related()
         else:
             qs = self.qEntry
         return qs
@@ -2049,6 +1981,11 @@ class LocationListView(ListView):
         """
         return self.request.GET.get('paginate_by', self.paginate_by)
 
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        """Use the cached count and the page cursors of this list"""
+        return KeysetPaginator(queryset, per_page, self.listcache, orphans=orphans,
+                               allow_empty_first_page=allow_empty_first_page, **kwargs)
+
     def get_entryset(self, page_obj):
         lstQ = []
         bHasSearch = False
@@ -2098,14 +2035,14 @@ class LocationListView(ListView):
 
             bUseLower = True
             if bUseLower:
-                qse = Entry.objects.filter(*lstQ).distinct().select_related().order_by(
+                qse = Entry.objects.filter(*lstQ).distinct().select_related(*Entry.listing_related).prefetch_related(*Entry.listing_prefetch).order_by(
                     Lower('dialect__stad'),
                     'lemma__gloss',  
                     Lower('trefwoord__woord'), 
                     Lower('toelichting'), 
                     Lower('woord'))
             else:
-                qse = Entry.objects.filter(*lstQ).distinct().select_related().order_by(
+                qse = Entry.objects.filter(*lstQ).distinct().select_related(*Entry.listing_related).prefetch_related(*Entry.listing_prefetch).order_by(
                     'dialect__stad',
                     'lemma__gloss',  
                     'trefwoord__woord', 
@@ -2156,8 +2093,8 @@ class LocationListView(ListView):
 
             # Fine-tuning: search string is the STAD
             if 'search' in get and get['search'] != '':
+                lstQ.append(search_q(Dialect, 'stad', get['search']))
                 val = adapt_search(get['search'])
-                lstQ.append(Q(stad__iregex=val) )
                 bHasSearch = True
 
                 # check for possible exact numbers having been given
@@ -2167,8 +2104,7 @@ class LocationListView(ListView):
 
             # Check for dialect code (Kloeke)
             if 'nieuw' in get and get['nieuw'] != '':
-                val = adapt_search(get['nieuw'])
-                lstQ.append(Q(nieuw__iregex=val) )
+                lstQ.append(search_q(Dialect, 'nieuw', get['nieuw']))
                 bHasSearch = True
 
             # Check for aflevering
@@ -2196,20 +2132,18 @@ class LocationListView(ListView):
                 print("LocationListView get_queryset point 'a': {:.1f}".format( get_now_time() - iStart))
                 iStart = get_now_time()
 
-            # Get a list of Dialects that should be excluded
-            dialect_hide = Dialect.objects.filter(toonbaar=0)
-
-            # Use the E-WGD approach: be efficient here
-            qs = Dialect.objects.exclude(id__in=dialect_hide).filter(*lstQ).distinct().select_related().order_by(Lower('stad'))
+            # Hidden dialects are left out by their own [toonbaar] field, which needs no subquery
+            qs = Dialect.objects.exclude(toonbaar=0).filter(*lstQ).distinct().select_related().annotate(
+                sortkey=Lower('stad')).order_by('sortkey', 'id')
 
             # Time measurement
             if self.bDoTime:
                 print("LocationListView get_queryset point 'c': {:.1f}".format( get_now_time() - iStart))
                 iStart = get_now_time()
 
-            # self.entrycount = qs.count()
-            # Using 'len' is faster since [qse] is being actually used again
-            self.entrycount = len(qs)
+            # The count is cached per filter, so that [qs] need not be loaded as a whole
+            self.listcache = ListCache.get_item("location", get, qs)
+            self.entrycount = self.listcache.count
 
             # Time measurement
             if self.bDoTime:
@@ -2338,16 +2272,14 @@ class KloekeListView(ListView):
 
             # Fine-tuning: search string is the LEMMA
             if 'stad' in get and get['stad'] != '':
-                val = adapt_search(get['stad'])
-                query = Q(stad__iregex=val) 
+                query = search_q(Kloeke, 'stad', get['stad'])
 
                 # Apply the filter
                 lstQ.append(query)
 
             # Check for dialect code (Kloeke)
             if 'code' in get and get['code'] != '':
-                val = adapt_search(get['code'])
-                query = Q(code__iregex=val)
+                query = search_q(Kloeke, 'code', get['code'])
             
                 # Apply the filter
                 lstQ.append(query)
@@ -2410,6 +2342,7 @@ class DialectListView(ListView):
     paginate_by = 10
     template_name = 'dictionary/dialect_list.html'
     entrycount = 0
+    listcache = None    # The [ListCache] item of the current list
     bDoTime = False
     bImportKloekeInfo = False
 
@@ -2594,6 +2527,11 @@ class DialectListView(ListView):
         Paginate by specified value in querystring, or use default class property value.
         """
         return self.request.GET.get('paginate_by', self.paginate_by)
+
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        """Use the cached count and the page cursors of this list"""
+        return KeysetPaginator(queryset, per_page, self.listcache, orphans=orphans,
+                               allow_empty_first_page=allow_empty_first_page, **kwargs)
         
     def get_queryset(self):
         oErr = ErrHandle()
@@ -2617,8 +2555,8 @@ class DialectListView(ListView):
 
             # Fine-tuning: search string is the LEMMA
             if 'search' in get and get['search'] != '':
+                query = search_q(Dialect, 'stad', get['search'])
                 val = adapt_search(get['search'])
-                query = Q(stad__iregex=val) 
 
                 # check for possible exact numbers having been given
                 if re.match('^\d+$', val):
@@ -2629,14 +2567,13 @@ class DialectListView(ListView):
 
             # Check for dialect code (Kloeke)
             if 'nieuw' in get and get['nieuw'] != '':
-                val = adapt_search(get['nieuw'])
-                query = Q(nieuw__iregex=val)
+                query = search_q(Dialect, 'nieuw', get['nieuw'])
             
                 # Apply the filter
                 lstQ.append(query)
 
             # Calculate the final qs
-            qs = Dialect.objects.exclude(toonbaar=0).filter(*lstQ).order_by('stad').distinct()
+            qs = Dialect.objects.exclude(toonbaar=0).filter(*lstQ).annotate(sortkey=F('stad')).order_by('sortkey', 'id').distinct()
 
             # Time measurement
             if self.bDoTime:
@@ -2644,8 +2581,9 @@ class DialectListView(ListView):
                 print("DialectListView query: {}".format(qs.query))
                 iStart = get_now_time()
 
-            # Determine the length
-            self.entrycount = len(qs)
+            # Determine the length (cached per filter)
+            self.listcache = ListCache.get_item("dialect", get, qs)
+            self.entrycount = self.listcache.count
 
             # Time measurement
             if self.bDoTime:
@@ -2667,6 +2605,10 @@ class DialectMapView(MapView):
     order_by = ["coordinate__province", "stad"]
     use_object = False
     label = "Dialectplaatsen"
+    geo_fields = ["trefwoord", "stad", "kloeke", "count"]
+    popup_type = "dialect"
+    bbox_lat = "coordinate__latitude"
+    bbox_lng = "coordinate__longitude"
 
     def initialize(self):
         super(DialectMapView, self).initialize()
@@ -2920,9 +2862,9 @@ class MijnListView(ListView):
 
             # Fine-tuning: search string is the LEMMA
             if 'search' in get and get['search'] != '':
-                val = adapt_search(get['search'])
                 # The main search is on the NAME of the mine
-                query = Q(naam__iregex=val) 
+                query = search_q(Mijn, 'naam', get['search'])
+                val = adapt_search(get['search'])
 
                 # check for possible exact numbers having been given
                 if re.match('^\d+$', val):
@@ -2933,16 +2875,14 @@ class MijnListView(ListView):
 
             # Check for toelichting
             if 'toelichting' in get and get['toelichting'] != '':
-                val = adapt_search(get['toelichting'])
                 # query = Q(nieuw__istartswith=val)
-                query = Q(toelichting__iregex=val)
+                query = search_q(Mijn, 'toelichting', get['toelichting'])
                 qs = qs.filter(query)
 
             # Check for locatie
             if 'locatie' in get and get['locatie'] != '':
-                val = adapt_search(get['locatie'])
                 # query = Q(nieuw__istartswith=val)
-                query = Q(locatie__iregex=val)
+                query = search_q(Mijn, 'locatie', get['locatie'])
                 qs = qs.filter(query)
 
             # Make sure we only have distinct values
@@ -113,6 +113,11 @@ class InfoAdmin(admin.ModelAdmin):
     list_filter = ['deel', 'sectie']
 
 
+class JobAdmin(admin.ModelAdmin):
+    list_display = ['id', 'jobtype', 'status', 'created', 'started', 'finished']
+    list_filter = ['jobtype', 'status']
+
+
 # -- Components of an entry
 admin.site.register(Lemma, LemmaAdmin)
 admin.site.register(Dialect, DialectAdmin)
@@ -127,4 +132,7 @@ admin.site.register(Description, DescriptionAdmin)
 admin.site.register(Deel)
 
 # -- dictionary as a whole
-admin.site.register(Entry, EntryAdmin)
\ No newline at end of file
+admin.site.register(Entry, EntryAdmin)
+
+# -- background processing
+admin.site.register(Job, JobAdmin)
\ No newline at end of file
@@ -1,5 +1,19 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate, pre_save
 
 
 class dictionaryConfig(AppConfig):
-    name = 'dictionary'
+    name = 'wld.dictionary'
+
+    def ready(self):
+        # Keep the search indexes in place after migrating
+        from wld.dictionary.search import search_install
+        post_migrate.connect(search_install, sender=self)
+        # Fill the entry listing if it is new
+        from wld.dictionary.models import EntryView, Lemma
+        post_migrate.connect(EntryView.install, sender=self)
+        post_migrate.connect(Lemma.install, sender=self)
+        # Keep the coordinates as numbers next to their points
+        from wld.dictionary.models import Coordinate, Mijn, set_latlng
+        pre_save.connect(set_latlng, sender=Coordinate)
+        pre_save.connect(set_latlng, sender=Mijn)
@@ -0,0 +1,126 @@
+"""JSON search API of the lemma, trefwoord and location lists.
+
+The list views render a complete HTML page for every change of a filter,
+and they need the number of items in the list before they show anything.
+The API returns one page of a list as compact rows instead, and leaves
+counting to a separate request:
+
+    api/search/lemma/?search=kat                the first page
+    api/search/lemma/?search=kat&cursor=...     the page after it
+    api/count/lemma/?search=kat                 the number of lemma's
+
+The filter parameters are those of the list views. A page contains the
+items of the list (lemma's, trefwoorden or locations), the entries that
+belong to them, and the cursor token of the next page. The names of the
+columns are given once, in [columns]. The page also contains the count,
+provided the list has been counted before; otherwise [count] is None and
+the client asks [count_url] for it.
+"""
+
+from django.core.paginator import Page
+from django.http import JsonResponse
+from django.urls import reverse
+
+from wld.utils import ErrHandle
+from wld.dictionary.paging import seek, encode_cursor, decode_cursor
+from wld.dictionary.views import TrefwoordListView, LemmaListView, LocationListView, paginateMax
+
+# The list views the API serves, with the columns of their items
+LISTS = {
+    'lemma':     {'view': LemmaListView,     'items': ['id', 'gloss']},
+    'trefwoord': {'view': TrefwoordListView, 'items': ['id', 'woord']},
+    'location':  {'view': LocationListView,  'items': ['id', 'stad', 'nieuw']},
+    }
+# The columns of the entries of a page (fields of [EntryView])
+ENTRY_COLUMNS = ['id', 'lemma_id', 'lemma_gloss', 'trefwoord_id', 'trefwoord_woord', 'woord', 'toelichting',
+                 'dialect_id', 'dialect_stad', 'dialect_nieuw', 'aflevering_id', 'aflevering_summary']
+# Parameters that do not belong to the filter
+SKIP_PARAMS = ['cursor', 'strict', 'paginate_by']
+
+
+def get_list_view(request, sKind, bCount):
+    """Set up the list view of [sKind] for [request]
+
+    The API always uses the strict approach, since its entries come from [EntryView].
+    """
+
+    get = request.GET.copy()
+    if 'strict' in get:
+        del get['strict']
+    request.GET = get
+    oView = LISTS[sKind]['view']()
+    oView.setup(request)
+    oView.bCount = bCount
+    return oView
+
+def get_count_url(request, sKind):
+    """The URL that gives the count of the list [request] asks for"""
+
+    get = request.GET.copy()
+    for sName in SKIP_PARAMS:
+        if sName in get:
+            del get[sName]
+    sUrl = reverse('api_count', kwargs={'kind': sKind})
+    sQuery = get.urlencode()
+    return sUrl if sQuery == "" else "{}?{}".format(sUrl, sQuery)
+
+def get_page_size(request, iDefault):
+    sSize = request.GET.get('paginate_by', '')
+    if sSize.isdigit() and int(sSize) > 0:
+        return min(paginateMax, int(sSize))
+    return iDefault
+
+def search_api(request, kind):
+    """Return one page of the list [kind] as JSON"""
+
+    oData = {'status': 'error', 'msg': ''}
+    oErr = ErrHandle()
+    try:
+        oView = get_list_view(request, kind, False)
+        qs = oView.get_queryset()
+        iSize = get_page_size(request, oView.paginate_by)
+
+        # Continue after the cursor, if there is one
+        lCursor = decode_cursor(request.GET.get('cursor', ''))
+        if lCursor != None:
+            qs = seek(qs, lCursor)
+        # Getting one item more shows whether there is a next page
+        lObject = list(qs[:iSize + 1])
+        sNext = None
+        if len(lObject) > iSize:
+            lObject = lObject[:iSize]
+            sNext = encode_cursor([lObject[-1].sortkey, lObject[-1].id])
+
+        # The entries that belong to the items of this page
+        lEntry = []
+        if len(lObject) > 0:
+            lEntry = oView.get_entryset(Page(lObject, 1, None))
+
+        lItemColumns = LISTS[kind]['items']
+        oData['columns'] = {'items': lItemColumns, 'entries': ENTRY_COLUMNS}
+        oData['items'] = [[getattr(x, sName) for sName in lItemColumns] for x in lObject]
+        oData['entries'] = [[getattr(x, sName) for sName in ENTRY_COLUMNS] for x in lEntry]
+        oData['next'] = sNext
+        # Only give the count if it is known already
+        oData['count'] = None if oView.listcache == None else oView.listcache.count
+        oData['count_url'] = get_count_url(request, kind)
+        oData['status'] = "ok"
+    except:
+        oData['msg'] = oErr.get_error_message()
+        oErr.DoError("search_api")
+    return JsonResponse(oData)
+
+def count_api(request, kind):
+    """Return the number of items in the list [kind] as JSON, counting them if needed"""
+
+    oData = {'status': 'error', 'msg': ''}
+    oErr = ErrHandle()
+    try:
+        oView = get_list_view(request, kind, True)
+        oView.get_queryset()
+        oData['count'] = oView.entrycount
+        oData['status'] = "ok"
+    except:
+        oData['msg'] = oErr.get_error_message()
+        oErr.DoError("count_api")
+    return JsonResponse(oData)
@@ -0,0 +1,40 @@
+"""Worker that performs the queued import and repair jobs
+
+Start it next to the web server, e.g.: python manage.py runjobs
+"""
+
+import time
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from wld.dictionary.models import Job
+
+class Command(BaseCommand):
+
+    help = 'perform the queued import and repair jobs'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='stop when there are no more jobs waiting')
+        parser.add_argument('--sleep', type=float, default=2.0, help='seconds to wait before looking for new jobs')
+        parser.add_argument('--stale', type=float, default=Job.stale_hours,
+                            help='hours after which a running job is taken to have been interrupted (0: all of them)')
+
+    def handle(self, *args, **options):
+        bOnce = options['once']
+        fSleep = options['sleep']
+
+        # Jobs left 'running' by a worker that was killed would block their Info or Repair for good
+        iReset = Job.reset_stale(options['stale'])
+        if iReset > 0:
+            self.stdout.write("Marked {} interrupted job(s) as failed".format(iReset))
+
+        while True:
+            close_old_connections()
+            oJob = Job.claim()
+            if oJob == None:
+                if bOnce:
+                    break
+                time.sleep(fSleep)
+            else:
+                self.stdout.write("Starting {}".format(oJob))
+                oJob.execute()
+                self.stdout.write("Finished {}".format(oJob))
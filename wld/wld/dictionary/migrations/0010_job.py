@@ -0,0 +1,26 @@
+# Generated by Django 2.2 on 2026-10-18 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0009_mijn_point'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('jobtype', models.CharField(default='(unknown)', max_length=100, verbose_name='Soort taak')),
+                ('params', models.TextField(default='{}', verbose_name='Parameters')),
+                ('status', models.CharField(default='queued', max_length=100, verbose_name='Status')),
+                ('msg', models.TextField(blank=True, default='', verbose_name='Bericht')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Aangemaakt')),
+                ('started', models.DateTimeField(blank=True, null=True, verbose_name='Gestart')),
+                ('finished', models.DateTimeField(blank=True, null=True, verbose_name='Klaar')),
+            ],
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 2.2 on 2026-10-18 14:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0010_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='repair',
+            name='progress',
+            field=models.TextField(blank=True, default='', verbose_name='Voortgang'),
+        ),
+        migrations.AddField(
+            model_name='status',
+            name='progress',
+            field=models.TextField(blank=True, default='', verbose_name='Voortgang'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 2.2 on 2026-10-18 16:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0011_progress'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ListCache',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=100, unique=True, verbose_name='Sleutel')),
+                ('count', models.IntegerField(default=0, verbose_name='Aantal')),
+                ('cursors', models.TextField(default='{}', verbose_name='Cursors')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Aangemaakt')),
+            ],
+        ),
+    ]
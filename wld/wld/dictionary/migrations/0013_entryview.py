@@ -0,0 +1,49 @@
+# Generated by Django 2.2 on 2026-10-18 17:20
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0012_listcache'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EntryView',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('woord', models.CharField(default='(unknown)', max_length=100, verbose_name='Dialectopgave')),
+                ('toelichting', models.TextField(blank=True, verbose_name='Toelichting')),
+                ('kloeketoelichting', models.TextField(blank=True, verbose_name='Toelichting bij dialectopgave')),
+                ('lemma_gloss', models.CharField(default='', max_length=100, verbose_name='Lemma')),
+                ('trefwoord_woord', models.CharField(default='', max_length=100, verbose_name='Trefwoord')),
+                ('dialect_stad', models.CharField(default='', max_length=100, verbose_name='Dialectlocatie')),
+                ('dialect_nieuw', models.CharField(default='', max_length=6, verbose_name='Plaatscode (Nieuwe Kloeke)')),
+                ('bronnenlijst', models.TextField(blank=True, verbose_name='Bronnenlijst')),
+                ('mijnen', models.TextField(default='[]', verbose_name='Mijnen')),
+                ('aflevering_key', models.CharField(default='', max_length=100, verbose_name='Aflevering sortering')),
+                ('aflevering_summary', models.CharField(default='', max_length=100, verbose_name='Aflevering')),
+                ('aflevering_pdf', models.CharField(default='', max_length=100, verbose_name='Aflevering PDF')),
+                ('aflevering_naam', models.CharField(default='', max_length=100, verbose_name='PDF naam')),
+                ('toonbaar', models.BooleanField(default=True, verbose_name='Mag getoond worden')),
+                ('point', models.CharField(blank=True, default='', max_length=100, verbose_name='Coordinates')),
+                ('lemma_key', models.CharField(default='', max_length=100, verbose_name='Lemma sortering')),
+                ('trefwoord_key', models.CharField(default='', max_length=100, verbose_name='Trefwoord sortering')),
+                ('woord_key', models.CharField(default='', max_length=100, verbose_name='Dialectopgave sortering')),
+                ('toelichting_key', models.TextField(blank=True, verbose_name='Toelichting sortering')),
+                ('stad_key', models.CharField(default='', max_length=100, verbose_name='Dialectlocatie sortering')),
+                ('aflevering', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='dictionary.Aflevering')),
+                ('descr', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='dictionary.Description')),
+                ('dialect', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='dictionary.Dialect')),
+                ('entry', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='entryview', to='dictionary.Entry')),
+                ('lemma', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='dictionary.Lemma')),
+                ('trefwoord', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='dictionary.Trefwoord')),
+            ],
+            options={
+                'index_together': {('trefwoord', 'toonbaar'), ('lemma', 'toonbaar'), ('dialect', 'toonbaar')},
+            },
+        ),
+    ]
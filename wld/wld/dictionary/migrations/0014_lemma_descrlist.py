@@ -0,0 +1,18 @@
+# Generated by Django 2.2 on 2026-10-18 19:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0013_entryview'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lemma',
+            name='descrlist',
+            field=models.TextField(blank=True, default='', verbose_name='Beschrijvingen van de ingangen'),
+        ),
+    ]
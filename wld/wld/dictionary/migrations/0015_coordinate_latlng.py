@@ -0,0 +1,65 @@
+# Generated by Django 2.2 on 2026-10-18 20:10
+
+from django.db import migrations, models, transaction
+
+
+def parse_point(sPoint):
+    # Same as [parse_point] in models.py
+    lPart = (sPoint or "").split(",")
+    if len(lPart) != 2:
+        return None, None
+    try:
+        return float(lPart[0]), float(lPart[1])
+    except ValueError:
+        return None, None
+
+def fill_latlng(apps, schema_editor):
+    # Calculate the latitude and longitude of the existing points
+    for sModel in ['Coordinate', 'Mijn']:
+        model = apps.get_model("dictionary", sModel)
+        lChanged = []
+        for obj in model.objects.exclude(point="").only('id', 'point'):
+            obj.latitude, obj.longitude = parse_point(obj.point)
+            if obj.latitude != None:
+                lChanged.append(obj)
+        with transaction.atomic():
+            model.objects.bulk_update(lChanged, ['latitude', 'longitude'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0014_lemma_descrlist'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='coordinate',
+            name='latitude',
+            field=models.FloatField(blank=True, null=True, verbose_name='Latitude'),
+        ),
+        migrations.AddField(
+            model_name='coordinate',
+            name='longitude',
+            field=models.FloatField(blank=True, null=True, verbose_name='Longitude'),
+        ),
+        migrations.AddField(
+            model_name='mijn',
+            name='latitude',
+            field=models.FloatField(blank=True, null=True, verbose_name='Latitude'),
+        ),
+        migrations.AddField(
+            model_name='mijn',
+            name='longitude',
+            field=models.FloatField(blank=True, null=True, verbose_name='Longitude'),
+        ),
+        migrations.AlterIndexTogether(
+            name='coordinate',
+            index_together={('latitude', 'longitude')},
+        ),
+        migrations.AlterIndexTogether(
+            name='mijn',
+            index_together={('latitude', 'longitude')},
+        ),
+        migrations.RunPython(fill_latlng, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 2.2 on 2026-10-18 21:30
+
+from django.db import migrations
+
+
+def clear_listcache(apps, schema_editor):
+    # The cursors used to be stored per page number: they are now stored per item offset
+    apps.get_model("dictionary", "ListCache").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0015_coordinate_latlng'),
+    ]
+
+    operations = [
+        migrations.RunPython(clear_listcache, migrations.RunPython.noop),
+    ]
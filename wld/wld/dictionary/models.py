@@ -8,18 +8,24 @@ The dialects are identified by locations, and the locations are indicated by a '
 from django.contrib.auth.models import User
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
+from django.db import DatabaseError
 from django.db import models
 from django.db.models import Q
-from datetime import datetime
+from django.db.models.functions import Lower
+from django.utils import timezone
+from datetime import datetime, timedelta
 import time
 from wld.settings import APP_PREFIX, MEDIA_ROOT
 from wld.utils import *
+from wld.dictionary.pagecache import bump_data_version, get_data_version
 import os, os.path
 import sys
 import io
 import codecs
 import html
 import json
+import gzip
+import hashlib
 import copy         
 
 
@@ -263,6 +269,231 @@ def partToLine(sVersie, arPart, bDoMijnen):
         errHandle.DoError("partToLine", True)
         return None
 
+
+# The columns of the two CSV versions: (key, index in arPart) in the order used by [partToLine]
+#    An index of None means the value is always the empty string (or None for 'dialect_kloeke')
+CSV_COLUMNS = {
+    'Lemmanummer': [('lemma_name', 2), ('lemma_bronnenlijst', 7), ('lemma_toelichting', 3), ('lemma_boek', 8),
+                    ('dialect_stad', 11), ('dialect_nieuw', 16), ('dialect_kloeke', None), ('trefwoord_name', 4),
+                    ('trefwoord_toelichting', None), ('dialectopgave_name', 6), ('dialectopgave_toelichting', 15),
+                    ('dialectopgave_kloeketoelichting', None)],
+    'lemma.name':  [('lemma_name', 1), ('lemma_bronnenlijst', 3), ('lemma_toelichting', 2), ('lemma_boek', None),
+                    ('dialect_stad', 10), ('dialect_nieuw', 9), ('dialect_kloeke', 8), ('trefwoord_name', 4),
+                    ('trefwoord_toelichting', 5), ('dialectopgave_name', 6), ('dialectopgave_toelichting', 7),
+                    ('dialectopgave_kloeketoelichting', 11)]
+    }
+# The minimal number of parts a line needs, so that [CSV_COLUMNS] can be used
+#    (the Lemmanummer 'dialect_nieuw' column may be missing)
+CSV_WIDTH = {'Lemmanummer': 16, 'lemma.name': 12}
+# The keys checked by [isLineOkay] and the (1-based) position it reports for them
+CSV_CHECKS = ['lemma_name', 'dialect_stad', 'dialect_nieuw', 'trefwoord_name', 'dialectopgave_name']
+CSV_UNESCAPE = ['dialectopgave_name', 'trefwoord_name']
+
+
+def csv_clean_value(v):
+    """Normalize one value in the same way as [partToLine] does"""
+
+    # Remove leading and trailing quotation marks and spaces
+    v = v.strip('"').strip()
+    # Remove leading and trailing ['] if it is there (on both sides)
+    if v.startswith("'") and v.endswith("'"):
+        v = v.strip("'")
+    # Change NULL into space
+    if v == "NULL":
+        v = ""
+    # Change double "" into single "
+    return v.replace('""', '"')
+
+
+def csv_is_bad(v):
+    """Is [v] a value that [isLineOkay] does not accept?"""
+    return v=="" or v=="NULL" or v.startswith('#') or v=="?" or v=="-" or v.isnumeric()
+
+
+def csv_mijn_list(sKloekeToel):
+    """Get the list of mines from the kloeke-toelichting, like [partToLine] does"""
+
+    sMijnen = sKloekeToel.replace('(', '').replace(')', '').strip()
+    # Sanity check
+    if sMijnen == "":
+        return []
+    # Adaptations for Oranje nassau mijnen
+    sMijnen = sMijnen.replace('Oranje-Nassau I-IV', 'Oranje-Nassau I / Oranje-Nassau II / Oranje-Nassau III / Oranje-Nassau IV')
+    lMijnen = []
+    for s in sMijnen.split('/'):
+        s = s.strip()
+        if s in ["I", "II", "III", "IV"]:
+            s = "Oranje-Nassau " + s
+        lMijnen.append(s)
+    return lMijnen
+
+
+def csv_convert_batch(sVersie, lPart, bDoMijnen):
+    """Convert the (long enough) split lines in [lPart] into [oLine] structures and [iValid] codes
+
+    The work is done per column: each distinct value of a column is normalized and checked only once.
+    The result is the same as calling [partToLine] and [isLineOkay] for each line.
+    """
+
+    iSize = len(lPart)
+    lKey = []
+    lCol = []
+    for (sKey, idx) in CSV_COLUMNS[sVersie]:
+        if idx == None:
+            # A column that is always empty
+            col = [None if sKey == 'dialect_kloeke' else ""] * iSize
+        else:
+            if idx < CSV_WIDTH[sVersie]:
+                col = [arPart[idx] for arPart in lPart]
+            else:
+                col = [arPart[idx] if len(arPart) > idx else "" for arPart in lPart]
+            # Normalize each distinct value once
+            dicClean = {}
+            bUnescape = (sKey in CSV_UNESCAPE)
+            for i, v in enumerate(col):
+                sClean = dicClean.get(v)
+                if sClean == None:
+                    sClean = csv_clean_value(html.unescape(v) if bUnescape else v)
+                    dicClean[v] = sClean
+                col[i] = sClean
+            if bDoMijnen and sKey == 'dialect_stad':
+                col = ["Zie mijnen" if v.lower() == "onbekend" else v for v in col]
+        lKey.append(sKey)
+        lCol.append(col)
+
+    # Check the columns: the first key (in the order of the structure) that is wrong determines [iValid]
+    lValid = [0] * iSize
+    for sKey in reversed([k for k in lKey if k in CSV_CHECKS]):
+        idx = lKey.index(sKey)
+        iCode = idx + 1
+        dicBad = {}
+        for i, v in enumerate(lCol[idx]):
+            bBad = dicBad.get(v)
+            if bBad == None:
+                bBad = csv_is_bad(v)
+                dicBad[v] = bBad
+            if bBad:
+                lValid[i] = iCode
+
+    # Combine the columns into structures
+    lLine = [dict(zip(lKey, lValues)) for lValues in zip(*lCol)]
+    if bDoMijnen:
+        dicMijn = {}
+        for oLine in lLine:
+            sToel = oLine['dialectopgave_kloeketoelichting']
+            if not sToel in dicMijn:
+                dicMijn[sToel] = csv_mijn_list(sToel)
+            # Each line gets its own list
+            oLine['mijn_list'] = list(dicMijn[sToel])
+    return lLine, lValid
+
+
+# ----------------------------------------------------------------------------------
+# Name :    csv_to_batches
+# Goal :    Read the lines of a CSV file and convert them into structures in batches
+# Note :    column-wise alternative for partToLine/isLineOkay
+# ----------------------------------------------------------------------------------
+def csv_to_batches(fl_in, bDoMijnen, iBatch = 20000):
+    """Convert the lines read from [fl_in] into lists of (strLine, sVersie, iValid, oLine) items
+
+    Each list contains (at most) [iBatch] items. The very first item is the header line: 
+    its [iValid] is None and [sVersie] is the version found. When that version cannot be 
+    processed, nothing more is read. Empty lines are not passed on.
+    """
+
+    sVersie = ""
+    oLine = None
+    bFirst = True
+    lStr = []       # The lines of this batch
+    lPart = []      # The same lines, split into parts
+
+    def get_batch():
+        nonlocal oLine
+        lBack = []
+        # Only the lines that are long enough can be treated column-wise
+        lFull = [arPart for arPart in lPart if len(arPart) >= CSV_WIDTH[sVersie]]
+        lLine, lValid = csv_convert_batch(sVersie, lFull, bDoMijnen)
+        iFull = 0
+        for strLine, arPart in zip(lStr, lPart):
+            if len(arPart) < 7:
+                # Line is too short, so cannot be taken into consideration
+                iValid = 0
+            elif len(arPart) < CSV_WIDTH[sVersie]:
+                # Leave this (faulty) line to the original conversion
+                oLine = partToLine(sVersie, arPart, bDoMijnen)
+                iValid = isLineOkay(oLine)
+            else:
+                oLine = lLine[iFull]
+                iValid = lValid[iFull]
+                iFull += 1
+            lBack.append((strLine, sVersie, iValid, oLine))
+        return lBack
+
+    for strLine in fl_in:
+        strLine = str(strLine).strip(" \n\r")
+        # Only process substantial lines
+        if strLine == "":
+            continue
+        # Split the line into parts
+        arPart = strLine.split('\t')
+        if bFirst:
+            # Get the version from cell 0, line 0
+            sVersie = arPart[1]     # Assuming that the first field is [recordId]
+            yield [(strLine, sVersie, None, None)]
+            if sVersie != 'Lemmanummer' and sVersie != "lemma.name":
+                # There is no use in reading further
+                return
+            bFirst = False
+        else:
+            lStr.append(strLine)
+            lPart.append(arPart)
+            if len(lStr) >= iBatch:
+                yield get_batch()
+                lStr = []
+                lPart = []
+    if len(lStr) > 0:
+        yield get_batch()
+
+
+def csv_to_lines(fl_in, bDoMijnen):
+    """Convert the lines read from [fl_in] into (strLine, sVersie, iValid, oLine) items (see [csv_to_batches])"""
+
+    for lBatch in csv_to_batches(fl_in, bDoMijnen):
+        for oItem in lBatch:
+            yield oItem
+
+
+def csv_parse_file(csv_file, bDoMijnen):
+    """Read and convert all lines of [csv_file] at once: this is what an import worker does"""
+
+    with codecs.open(csv_file, "r", encoding='utf-8-sig') as f:
+        return list(csv_to_lines(f, bDoMijnen))
+
+
+def csv_parse_parallel(lstJob, iWorkers=None):
+    """Let a pool of processes parse the CSV files in [lstJob] and yield the results in order
+
+    Each job is a tuple (csv_file, bDoMijnen). Only a limited number of files is
+    handed out ahead of the one that is being yielded, so that memory stays within bounds.
+    """
+
+    from concurrent.futures import ProcessPoolExecutor
+    from wld.dictionary.workers import init_worker, parse_csv_file
+
+    if iWorkers == None or iWorkers <= 0:
+        iWorkers = os.cpu_count() or 1
+    iAhead = 2 * iWorkers
+    with ProcessPoolExecutor(max_workers=iWorkers, initializer=init_worker) as executor:
+        lFuture = []
+        for idx in range(len(lstJob)):
+            # Make sure the next few jobs have been handed out
+            while len(lFuture) < len(lstJob) and len(lFuture) <= idx + iAhead:
+                lFuture.append(executor.submit(parse_csv_file, *lstJob[len(lFuture)]))
+            lResult = lFuture[idx].result()
+            lFuture[idx] = None
+            yield lResult
+
+
 class HelpChoice(models.Model):
     """Define the URL to link to for the help-text"""
     
@@ -288,6 +519,27 @@ class HelpChoice(models.Model):
         return help_text
 
 
+def parse_point(sPoint):
+    """Get the latitude and longitude of a 'lat, lng' string, or (None, None) if it has none"""
+
+    if sPoint == None:
+        return None, None
+    lPart = sPoint.split(",")
+    if len(lPart) != 2:
+        return None, None
+    try:
+        return float(lPart[0]), float(lPart[1])
+    except ValueError:
+        return None, None
+
+def set_latlng(sender, instance, raw=False, **kwargs):
+    """Keep the [latitude] and [longitude] of a Coordinate or Mijn in line with its [point]
+
+    Connected to pre_save (see apps.py), which also covers [loaddata] (raw=True).
+    """
+
+    instance.latitude, instance.longitude = parse_point(instance.point)
+
 def get_help(field):
     """Create the 'help_text' for this element"""
 
@@ -429,6 +681,9 @@ class Lemma(models.Model):
     lmdescr = models.ManyToManyField(Description, through='LemmaDescr')
     # A field that indicates this item may be showed
     toonbaar = models.BooleanField("Mag getoond worden", blank=False, default=True)
+    # The sorted descriptions of the entries of this lemma as JSON: a list of [id, toelichting, bronnenlijst]
+    #   (An empty string means that the list has not been calculated yet)
+    descrlist = models.TextField("Beschrijvingen van de ingangen", blank=True, default="")
 
     class Meta:
         # Note: no index is possible, since lmdescr is many-to-many
@@ -505,6 +760,72 @@ class Lemma(models.Model):
         bResult = Entry.objects.filter(lemma=self, mijnlijst__isnull=False).exists()
         return bResult
 
+    def get_descrlists(lemma_ids):
+        """Get the [descrlist] of each of the lemma's in [lemma_ids] with one query
+
+        Returns a dictionary from lemma id to a list of [id, toelichting, bronnenlijst],
+        or to None for a lemma whose list has not been calculated yet.
+        """
+
+        dicDescr = {}
+        for iId, sList in Lemma.objects.filter(id__in=lemma_ids).values_list('id', 'descrlist'):
+            dicDescr[iId] = None if sList == "" else json.loads(sList)
+        return dicDescr
+
+    def refresh_descr(aflevering = None):
+        """Re-calculate the [descrlist] of the lemma's with entries in [aflevering], or of all lemma's
+
+        Returns the number of lemma's that have been updated, or -1 on error.
+        """
+
+        oErr = ErrHandle()
+        iCount = 0
+        try:
+            qsEntry = Entry.objects.all()
+            if aflevering == None:
+                lemma_ids = list(Lemma.objects.values_list('id', flat=True))
+            else:
+                # All entries of the lemma's that occur in this aflevering
+                lemma_ids = list(Entry.objects.filter(aflevering=aflevering).values_list('lemma_id', flat=True).distinct())
+                qsEntry = qsEntry.filter(lemma_id__in=Entry.objects.filter(aflevering=aflevering).values('lemma_id'))
+
+            # The descriptions in the order the lemma list shows them
+            dicOrder = {}
+            qsDescr = Description.objects.filter(id__in=qsEntry.values('descr_id')).order_by(
+                Lower('toelichting'), Lower('bronnenlijst'), 'id')
+            for iOrder, oDescr in enumerate(qsDescr.values_list('id', 'toelichting', 'bronnenlijst')):
+                dicOrder[oDescr[0]] = (iOrder, list(oDescr))
+
+            # The descriptions used by each lemma
+            dicLemma = {}
+            for iLemma, iDescr in qsEntry.order_by().values_list('lemma_id', 'descr_id').distinct():
+                if iDescr in dicOrder:
+                    dicLemma.setdefault(iLemma, []).append(dicOrder[iDescr])
+
+            lLemma = []
+            for iLemma in lemma_ids:
+                lDescr = [x[1] for x in sorted(dicLemma.get(iLemma, []))]
+                lLemma.append(Lemma(id=iLemma, descrlist=json.dumps(lDescr)))
+            with transaction.atomic():
+                Lemma.objects.bulk_update(lLemma, ['descrlist'], batch_size=500)
+            iCount = len(lLemma)
+        except:
+            msg = oErr.get_error_message()
+            oErr.DoError("Lemma/refresh_descr")
+            iCount = -1
+        return iCount
+
+    def install(sender=None, using="default", **kwargs):
+        """Calculate the description lists once, when there are lemma's with entries that have none"""
+
+        try:
+            bMissing = Lemma.objects.using(using).filter(descrlist="", entry__isnull=False).exists()
+        except DatabaseError:
+            # E.g. after migrating back to before [descrlist] existed
+            return
+        if bMissing:
+            Lemma.refresh_descr()
+
     def change_toonbaar():
         # Set all lemma's to 'toonbaar
         with transaction.atomic():
@@ -611,12 +932,19 @@ class Coordinate(models.Model):
     dictionary = models.CharField("Dictionary", db_index=True, blank=True, max_length=MAX_LEMMA_LEN)
     # [0-1] The point coordinates
     point = models.CharField("Coordinates", db_index=True, blank=True, max_length=MAX_LEMMA_LEN)
+    # [0-1] The same point as numbers (calculated from [point] when saving)
+    latitude = models.FloatField("Latitude", null=True, blank=True)
+    longitude = models.FloatField("Longitude", null=True, blank=True)
+
+    class Meta:
+        index_together = ['latitude', 'longitude']
 
     def __str__(self):
         sBack = "{}: {}".format(self.kloeke, self.place)
         return sBack
 
 
+
 class Dialect(models.Model):
     """Dialect"""
 
@@ -860,6 +1188,8 @@ class Status(models.Model):
     method = models.CharField("Reading method", blank=False, max_length=MAX_LEMMA_LEN, default="(unknown)")
     # Link to the Info
     info = models.ForeignKey(Info, blank=False, on_delete=models.CASCADE, related_name="info_statuses")
+    # Latest snapshot of the progress (JSON, see [Progress])
+    progress = models.TextField("Voortgang", blank=True, default="")
 
     def set_status(self, sStatus, sMsg = None):
         self.status = sStatus
@@ -873,12 +1203,345 @@ class Repair(models.Model):
     repairtype = models.CharField("Soort reparatie", blank=False, max_length=MAX_LEMMA_LEN, default="(unknown)")
     # Status of this repair action
     status = models.TextField("Status", blank=False, default="idle")
+    # Latest snapshot of the progress (JSON, see [Progress])
+    progress = models.TextField("Voortgang", blank=True, default="")
 
     def set_status(self, sStatus):
         self.status = sStatus
         self.save()
 
 
+class Progress:
+    """Keep track of the progress of an import or repair, stored in a [Status] or [Repair] object
+
+    The object is only saved when [interval] seconds or [rows] rows have passed since the last save,
+    or when the phase changes. The latest snapshot (rows/sec, ETA, time per phase) is available
+    within this process through get_snapshot(), and it is saved in the [progress] field of the object.
+    """
+
+    interval = 1.0      # Minimal number of seconds between two saves
+    rows = 5000         # Save anyway after this many rows
+    dicSnapshot = {}    # In-process snapshots: (model name, id) to snapshot
+
+    def __init__(self, oItem, iTotal = 0):
+        self.oItem = oItem          # The Status or Repair object
+        self.iTotal = iTotal        # Expected number of rows (0 = unknown)
+        self.iRead = 0
+        self.iSkipped = 0
+        self.sStatus = oItem.status
+        self.oTime = None           # Optional dictionary with detailed timing
+        self.fStart = time.time()
+        self.fLastSave = 0
+        self.iLastRows = 0
+        self.sPhase = ""
+        self.fPhaseStart = self.fStart
+        self.iPhaseRows = 0
+        self.oPhase = {}            # Seconds spent per phase
+
+    def get_key(oItem):
+        return (oItem.__class__.__name__.lower(), oItem.id)
+
+    def get_snapshot(oItem):
+        """Get the latest snapshot for [oItem]: from this process or else from the database"""
+
+        oBack = Progress.dicSnapshot.get(Progress.get_key(oItem))
+        if oBack == None and oItem.progress != "":
+            oBack = json.loads(oItem.progress)
+        return oBack
+
+    def phase(self, sPhase, iTotal = None, bReset = False):
+        """Start a new phase, which is also the new status; [bReset] starts counting rows from zero"""
+
+        fNow = time.time()
+        if self.sPhase != "":
+            self.oPhase[self.sPhase] = self.oPhase.get(self.sPhase, 0) + fNow - self.fPhaseStart
+        self.sPhase = sPhase
+        self.fPhaseStart = fNow
+        if bReset:
+            self.iRead = 0
+            self.iSkipped = 0
+            self.iTotal = 0
+            self.iLastRows = 0
+            self.oTime = None
+        self.iPhaseRows = self.iRead + self.iSkipped
+        if iTotal != None:
+            self.iTotal = iTotal
+        self.sStatus = sPhase
+        self.save(True)
+
+    def update(self, iRead = None, iSkipped = None, sStatus = None):
+        """Note the current numbers, and possibly save them"""
+
+        if iRead != None: self.iRead = iRead
+        if iSkipped != None: self.iSkipped = iSkipped
+        if sStatus != None: self.sStatus = sStatus
+        self.save()
+
+    def add(self, iRead = 1, iSkipped = 0, sStatus = None):
+        """Count rows that have been done, and possibly save the numbers"""
+
+        self.update(self.iRead + iRead, self.iSkipped + iSkipped, sStatus)
+
+    def snapshot(self):
+        """Calculate where we are"""
+
+        fNow = time.time()
+        iRows = self.iRead + self.iSkipped
+        fPhase = fNow - self.fPhaseStart
+        fRate = 0.0 if fPhase <= 0 else (iRows - self.iPhaseRows) / fPhase
+        oPhase = dict(self.oPhase)
+        if self.sPhase != "":
+            oPhase[self.sPhase] = oPhase.get(self.sPhase, 0) + fPhase
+        oBack = {'read': self.iRead, 'skipped': self.iSkipped, 'total': self.iTotal,
+                 'status': self.sStatus, 'phase': self.sPhase,
+                 'elapsed': round(fNow - self.fStart, 1), 'rate': round(fRate, 1), 'eta': None,
+                 'phases': {k: round(v, 1) for k, v in oPhase.items()}}
+        if self.iTotal > 0 and fRate > 0:
+            oBack['eta'] = round(max(0, self.iTotal - iRows) / fRate, 1)
+        if self.oTime != None:
+            oBack['time'] = {k: round(v, 1) for k, v in self.oTime.items()}
+        return oBack
+
+    def get_status(self):
+        """The status text, including the detailed timing (if any)"""
+
+        if self.oTime == None or len(self.oTime) == 0:
+            return self.sStatus
+        return "{} ({})".format(self.sStatus, ", ".join(["{}={:.1f}".format(k, v) for k, v in self.oTime.items()]))
+
+    def save(self, bForce = False):
+        """Write the progress to the database, provided enough time or rows have passed"""
+
+        iRows = self.iRead + self.iSkipped
+        fNow = time.time()
+        if bForce or fNow - self.fLastSave >= self.interval or iRows - self.iLastRows >= self.rows:
+            oSnapshot = self.snapshot()
+            Progress.dicSnapshot[Progress.get_key(self.oItem)] = oSnapshot
+            self.oItem.status = self.get_status()
+            self.oItem.progress = json.dumps(oSnapshot)
+            if hasattr(self.oItem, "read"):
+                self.oItem.read = self.iRead
+                self.oItem.skipped = self.iSkipped
+            self.oItem.save()
+            self.fLastSave = fNow
+            self.iLastRows = iRows
+
+    def finish(self, sStatus):
+        """Close the last phase and save the final numbers"""
+
+        self.phase("")
+        self.sStatus = sStatus
+        self.save(True)
+        Progress.dicSnapshot.pop(Progress.get_key(self.oItem), None)
+
+
+class Job(models.Model):
+    """An import or repair action that is waiting to be done by the [runjobs] worker"""
+
+    # Type of job: 'import' or 'repair'
+    jobtype = models.CharField("Soort taak", blank=False, max_length=MAX_LEMMA_LEN, default="(unknown)")
+    # The parameters of the job (JSON)
+    params = models.TextField("Parameters", blank=False, default="{}")
+    # Status of this job: queued, running, done, error
+    status = models.CharField("Status", blank=False, max_length=MAX_LEMMA_LEN, default="queued")
+    # Any message for the user (e.g. the error)
+    msg = models.TextField("Bericht", blank=True, default="")
+    # Timing
+    created = models.DateTimeField("Aangemaakt", auto_now_add=True)
+    started = models.DateTimeField("Gestart", blank=True, null=True)
+    finished = models.DateTimeField("Klaar", blank=True, null=True)
+
+    # A job that has been running longer than this is taken to have been interrupted
+    stale_hours = 12
+
+    def __str__(self):
+        return "{} {}: {}".format(self.jobtype, self.id, self.status)
+
+    def enqueue(sJobType, oParams):
+        """Add a job to the queue and return it"""
+
+        oJob = Job(jobtype=sJobType, params=json.dumps(oParams))
+        oJob.save()
+        return oJob
+
+    def get_params(self):
+        return json.loads(self.params)
+
+    def get_aflevering(self):
+        """Get the [Aflevering] this import job is about, or None if it is about all of them"""
+
+        oParams = self.get_params()
+        lstQ = []
+        for sParam, sField in [('deel', 'deel__nummer'), ('sectie', 'sectie'), ('aflnum', 'aflnum')]:
+            if str(oParams.get(sParam)).isnumeric():
+                lstQ.append(Q(**{sField: int(oParams[sParam])}))
+            elif sParam != 'sectie':
+                return None
+        if str(oParams.get('deel')) == "0" and str(oParams.get('aflnum')) == "0":
+            return None
+        return Aflevering.objects.filter(*lstQ).first()
+
+    def is_pending(sJobType, sKey, value):
+        """Check if a job of this type with [sKey] set to [value] is waiting or running"""
+
+        dtStale = timezone.now() - timedelta(hours=Job.stale_hours)
+        lstQ = []
+        lstQ.append(Q(status="queued") | Q(status="running", started__gt=dtStale))
+        for oJob in Job.objects.filter(*lstQ, jobtype=sJobType):
+            if oJob.get_params().get(sKey) == value:
+                return True
+        return False
+
+    def reset_stale(iHours = None):
+        """Mark the jobs that are 'running' for more than [iHours] as failed
+
+        A worker that is killed leaves its job 'running'. Return the number of jobs reset.
+        """
+
+        if iHours == None:
+            iHours = Job.stale_hours
+        dtStale = timezone.now() - timedelta(hours=iHours)
+        return Job.objects.filter(status="running", started__lte=dtStale).update(
+            status="error", msg="Interrupted: the worker stopped while running this job", finished=timezone.now())
+
+    def claim():
+        """Take the oldest job that is waiting and mark it as running
+
+        Changing the status is a single UPDATE, so that two workers cannot claim the same job.
+        """
+
+        for oJob in Job.objects.filter(status="queued").order_by('id')[:10]:
+            iCount = Job.objects.filter(id=oJob.id, status="queued").update(status="running", started=timezone.now())
+            if iCount == 1:
+                oJob.refresh_from_db()
+                return oJob
+        return None
+
+    def execute(self):
+        """Do what this job asks for"""
+
+        oErr = ErrHandle()
+        bResult = False
+        try:
+            oParams = self.get_params()
+            if self.jobtype == "import":
+                oResult = csv_to_fixture(oParams['filename'], oParams['deel'], oParams['sectie'], oParams['aflnum'],
+                                         oParams['status'], bUseDbase = oParams['usedbase'], bUseOld = True,
+                                         bBulk = oParams['bulk'], sFixFormat = oParams['fixformat'],
+                                         bDelta = oParams.get('delta', False))
+                bResult = (oResult != None and oResult['result'])
+                # Since we are done: explicitly set the status so
+                oStatus = Status.objects.filter(id=oParams['status']).first()
+                if oStatus != None:
+                    oStatus.set_status("done" if bResult else "error")
+                # Bring the entry listing of this aflevering (or of everything) up to date
+                EntryView.refresh(self.get_aflevering())
+                Lemma.refresh_descr(self.get_aflevering())
+            elif self.jobtype == "repair":
+                oRepair = Repair.objects.filter(id=oParams['repair']).first()
+                if oRepair == None:
+                    self.msg = "Repair object has been removed"
+                elif oRepair.repairtype == "lemma":
+                    bResult = do_repair_lemma(oRepair)
+                elif oRepair.repairtype == "entrydescr":
+                    bResult = do_repair_entrydescr(oRepair)
+                elif oRepair.repairtype == "clean":
+                    bResult = do_repair_clean(oRepair)
+                elif oRepair.repairtype == "entryview":
+                    bResult = do_repair_entryview(oRepair)
+                else:
+                    self.msg = "Unknown repair type: {}".format(oRepair.repairtype)
+                # Repairs may touch entries of any aflevering
+                if oRepair != None and oRepair.repairtype != "entryview":
+                    EntryView.refresh()
+                    Lemma.refresh_descr()
+            else:
+                self.msg = "Unknown job type: {}".format(self.jobtype)
+        except:
+            self.msg = oErr.get_error_message()
+            oErr.DoError("Job/execute")
+            bResult = False
+
+        # Imports and repairs change what the list views show
+        ListCache.clear()
+        bump_data_version()
+
+        # Note the outcome
+        self.status = "done" if bResult else "error"
+        self.finished = timezone.now()
+        self.save()
+        return bResult
+
+
+class ListCache(models.Model):
+    """Number of items and page cursors of one filtered list view
+
+    The lists only change through imports, repairs and changes of [toonbaar],
+    and each of these clears the whole cache.
+    """
+
+    # Hash of the view and its normalized filter parameters
+    key = models.CharField("Sleutel", blank=False, max_length=MAX_LEMMA_LEN, unique=True)
+    # Number of items in the list
+    count = models.IntegerField("Aantal", blank=False, default=0)
+    # Per item offset: the sort key and id of the item before it (JSON)
+    cursors = models.TextField("Cursors", blank=False, default="{}")
+    created = models.DateTimeField("Aangemaakt", auto_now_add=True)
+
+    # GET parameters that do not change the contents of a list
+    skip_params = ['page', 'paginate_by', 'submit_type', 'csrfmiddlewaretoken', 'cursor']
+    # Do not remember more than this number of cursors per list
+    max_cursors = 1000
+
+    def __str__(self):
+        return "{}: {}".format(self.key, self.count)
+
+    def get_key(sView, get):
+        """Turn the view name and the filter parameters in [get] into a key"""
+
+        lParam = []
+        for sName in sorted(get.keys()):
+            if sName not in ListCache.skip_params:
+                lValue = get.getlist(sName) if hasattr(get, 'getlist') else [get[sName]]
+                lValue = [str(x).strip() for x in lValue if str(x).strip() != ""]
+                if len(lValue) > 0:
+                    lParam.append([sName, lValue])
+        sParams = json.dumps([sView, lParam])
+        return hashlib.md5(sParams.encode("utf-8")).hexdigest()
+
+    def get_item(sView, get, qs, bCount = True):
+        """Get the cache item of this list, counting [qs] only if it is not there yet
+
+        With [bCount] False a list that has not been counted yet gives None.
+        """
+
+        sKey = ListCache.get_key(sView, get)
+        oItem = ListCache.objects.filter(key=sKey).first()
+        if oItem == None and bCount:
+            oItem, bCreated = ListCache.objects.get_or_create(key=sKey, defaults={'count': qs.count()})
+        return oItem
+
+    def get_cursor(self, iOffset):
+        return json.loads(self.cursors).get(str(iOffset))
+
+    def set_cursor(self, iOffset, lCursor):
+        """Remember [lCursor] as the position before the item at [iOffset]
+
+        The cursors are kept per item offset, not per page number, so that
+        lists shown with a different [paginate_by] can share them.
+        """
+
+        dCursor = json.loads(self.cursors)
+        sOffset = str(iOffset)
+        if dCursor.get(sOffset) != lCursor and (sOffset in dCursor or len(dCursor) < ListCache.max_cursors):
+            dCursor[sOffset] = lCursor
+            self.cursors = json.dumps(dCursor)
+            ListCache.objects.filter(id=self.id).update(cursors=self.cursors)
+
+    def clear():
+        ListCache.objects.all().delete()
+
+
 class Aflevering(models.Model):
     """Aflevering van een woordenboek"""
 
@@ -911,6 +1574,13 @@ class Aflevering(models.Model):
         verbose_name_plural = "Afleveringen"
         index_together = ['deel', 'sectie', 'aflnum']
 
+    # Process-wide map of aflevering id to its summary information (see [get_info])
+    info_map = {}
+    info_version = None
+    info_checked = 0    # Time the data version was last looked up
+    info_ttl = 1        # Look up the data version at most every [info_ttl] seconds
+    info_data_version = None
+
     def __str__(self):
         return self.naam
 
@@ -925,6 +1595,11 @@ class Aflevering(models.Model):
             Lemma.change_toonbaar()
             Trefwoord.change_toonbaar()
             Dialect.change_toonbaar()
+            EntryView.objects.filter(aflevering=self).update(toonbaar=self.toonbaar)
+            ListCache.clear()
+        # The pages show the afleveringen, so any change makes them outdated
+        bump_data_version()
+        Aflevering.info_checked = 0
         return result
 
     def get_number(self):
@@ -934,14 +1609,55 @@ class Aflevering(models.Model):
             iNumber = self.sectie * 10 + self.aflnum
         return iNumber
 
+    def get_info_version():
+        # The data version changes with every import, repair and change of an aflevering
+        fNow = time.time()
+        if fNow - Aflevering.info_checked >= Aflevering.info_ttl:
+            Aflevering.info_data_version = get_data_version()
+            Aflevering.info_checked = fNow
+        return Aflevering.info_data_version
+
+    def get_info(iId):
+        """Get the summary, sort key, pdf, deel number and toonbaar of aflevering [iId]
+
+        These come from a process-wide map, which is loaded with one query
+        (there are not that many afleveringen), and again when its version changes.
+        """
+
+        iVersion = Aflevering.get_info_version()
+        if Aflevering.info_version != iVersion:
+            dicInfo = {}
+            for afl in Aflevering.objects.select_related('deel'):
+                dicInfo[afl.id] = {'summary': afl.calc_summary(), 'key': afl.calc_key(), 'pdf': afl.calc_pdf(),
+                                   'deel': afl.deel.nummer, 'toonbaar': afl.toonbaar}
+            Aflevering.info_map = dicInfo
+            Aflevering.info_version = iVersion
+        return Aflevering.info_map.get(iId)
+
     def get_summary(self):
+        oInfo = Aflevering.get_info(self.id)
+        return self.calc_summary() if oInfo == None else oInfo['summary']
+
+    def get_pdf(self):
+        oInfo = Aflevering.get_info(self.id)
+        return self.calc_pdf() if oInfo == None else oInfo['pdf']
+
+    def calc_key(self):
+        """The sort key of this aflevering, e.g. 'd3-s2-a1'"""
+        sAfl = "d" + str(self.deel.nummer) + "-"
+        if self.sectie != None:
+            sAfl += "s" + str(self.sectie) + "-"
+        sAfl += "a" + str(self.aflnum)
+        return sAfl
+
+    def calc_summary(self):
         sSum = int_to_roman(self.deel.nummer) + "-"
         if self.sectie != None:
             sSum += str(self.sectie) + "-"
         sSum += str(self.aflnum)
         return sSum
 
-    def get_pdf(self):
+    def calc_pdf(self):
         # sPdf =  "{}/static/dictionary/content/pdf{}/{}".format(APP_PREFIX, self.deel.nummer,self.naam)
         sPdf =  "wld-{}/{}".format(self.deel.nummer,self.naam)
         return sPdf
@@ -994,6 +1710,7 @@ class Mijn(models.Model):
 
     class Meta:
         verbose_name_plural = "Mijnen"
+        index_together = ['latitude', 'longitude']
 
     # [1] The name of the mine
     naam = models.CharField("Mijn", blank=False, max_length=MAX_LEMMA_LEN, default="(unknown)")
@@ -1003,6 +1720,9 @@ class Mijn(models.Model):
     toelichting = models.TextField("Toelichting bij mijn", blank=True)
     # [0-1] The point coordinates of this mine
     point = models.CharField("Coordinates", db_index=True, blank=True, max_length=MAX_LEMMA_LEN)
+    # [0-1] The same point as numbers (calculated from [point] when saving)
+    latitude = models.FloatField("Latitude", null=True, blank=True)
+    longitude = models.FloatField("Longitude", null=True, blank=True)
 
     def __str__(self):
         return self.naam
@@ -1107,7 +1827,9 @@ class Entry(models.Model):
     def dialectopgave(self):
         sWoord = "*"
         # Are we allowed to show it?
-        if self.aflevering.toonbaar:
+        oInfo = Aflevering.get_info(self.aflevering_id)
+        bToonbaar = self.aflevering.toonbaar if oInfo == None else oInfo['toonbaar']
+        if bToonbaar:
             sWoord = self.woord
         return sWoord
 
@@ -1115,12 +1837,8 @@ class Entry(models.Model):
         return self.toelichting
 
     def get_aflevering(self):
-        afl = self.aflevering
-        sAfl = "d" + str(afl.deel.nummer) + "-"
-        if afl.sectie != None:
-            sAfl += "s" + str(afl.sectie) + "-"
-        sAfl += "a" + str(afl.aflnum)
-        return sAfl
+        oInfo = Aflevering.get_info(self.aflevering_id)
+        return self.aflevering.calc_key() if oInfo == None else oInfo['key']
 
     def get_lemma_gloss(self):
         return self.lemma.gloss + '_' + self.woord
@@ -1254,9 +1972,191 @@ class EntryMijn(models.Model):
 
         # Return the result
         return iPk
-    
 
 
+class EntryView(models.Model):
+    """Denormalized copy of an [Entry], as it is shown in the entry listings
+
+    The listings of the trefwoord, lemma and location views (and their exports)
+    only filter and sort on the columns of this table, so that they need not
+    join six tables and sort on lower() expressions for every page.
+    The table is refreshed per aflevering after an import, and as a whole
+    after a repair (see [Job.execute]).
+    """
+
+    # The entry this is a copy of
+    entry = models.OneToOneField(Entry, blank=False, on_delete=models.CASCADE, related_name="entryview")
+    # The objects the entry points to (only their id's are needed for filtering)
+    lemma = models.ForeignKey(Lemma, db_index=True, blank=False, on_delete=models.CASCADE)
+    descr = models.ForeignKey(Description, db_index=True, blank=False, on_delete=models.CASCADE)
+    dialect = models.ForeignKey(Dialect, db_index=True, blank=False, on_delete=models.CASCADE)
+    trefwoord = models.ForeignKey(Trefwoord, db_index=True, blank=False, on_delete=models.CASCADE)
+    aflevering = models.ForeignKey(Aflevering, db_index=True, blank=False, on_delete=models.CASCADE)
+
+    # The values that are shown
+    woord = models.CharField("Dialectopgave", blank=False, max_length=MAX_LEMMA_LEN, default="(unknown)")
+    toelichting = models.TextField("Toelichting", blank=True)
+    kloeketoelichting = models.TextField("Toelichting bij dialectopgave", blank=True)
+    lemma_gloss = models.CharField("Lemma", blank=False, max_length=MAX_LEMMA_LEN, default="")
+    trefwoord_woord = models.CharField("Trefwoord", blank=False, max_length=MAX_LEMMA_LEN, default="")
+    dialect_stad = models.CharField("Dialectlocatie", blank=False, max_length=MAX_LEMMA_LEN, default="")
+    dialect_nieuw = models.CharField("Plaatscode (Nieuwe Kloeke)", blank=False, max_length=6, default="")
+    bronnenlijst = models.TextField("Bronnenlijst", blank=True)
+    # The names of the mijnen of this entry (JSON list)
+    mijnen = models.TextField("Mijnen", blank=False, default="[]")
+    # The aflevering: sort key (e.g. 'd2-a5'), summary (e.g. 'II-5'), PDF and name
+    aflevering_key = models.CharField("Aflevering sortering", blank=False, max_length=MAX_LEMMA_LEN, default="")
+    aflevering_summary = models.CharField("Aflevering", blank=False, max_length=MAX_LEMMA_LEN, default="")
+    aflevering_pdf = models.CharField("Aflevering PDF", blank=False, max_length=MAX_LEMMA_LEN, default="")
+    aflevering_naam = models.CharField("PDF naam", blank=False, max_length=MAX_LEMMA_LEN, default="")
+    # Copy of aflevering.toonbaar
+    toonbaar = models.BooleanField("Mag getoond worden", blank=False, default=True)
+    # Coordinates of the dialect (if known)
+    point = models.CharField("Coordinates", blank=True, max_length=MAX_LEMMA_LEN, default="")
+
+    # The lowercased sort keys
+    lemma_key = models.CharField("Lemma sortering", blank=False, max_length=MAX_LEMMA_LEN, default="")
+    trefwoord_key = models.CharField("Trefwoord sortering", blank=False, max_length=MAX_LEMMA_LEN, default="")
+    woord_key = models.CharField("Dialectopgave sortering", blank=False, max_length=MAX_LEMMA_LEN, default="")
+    toelichting_key = models.TextField("Toelichting sortering", blank=True)
+    stad_key = models.CharField("Dialectlocatie sortering", blank=False, max_length=MAX_LEMMA_LEN, default="")
+
+    # Number of objects per bulk_create call
+    batch_size = 500
+
+    class Meta:
+        index_together = [
+            ["trefwoord", "toonbaar"],
+            ["lemma", "toonbaar"],
+            ["dialect", "toonbaar"],
+          ]
+
+    def __str__(self):
+        return self.woord + '_' + self.dialect_nieuw
+
+    def dialectopgave(self):
+        sWoord = "*"
+        # Are we allowed to show it?
+        if self.toonbaar:
+            sWoord = self.woord
+        return sWoord
+
+    def get_toelichting(self):
+        return self.toelichting
+
+    def get_aflevering(self):
+        return self.aflevering_key
+
+    def get_mijnen(self):
+        return json.loads(self.mijnen)
+
+    def get_row(self, dic_mijnen = None):
+        arRow = []
+        arRow.append(self.lemma_gloss)
+        arRow.append(self.trefwoord_woord)
+        arRow.append(self.woord)
+        arRow.append(self.dialect_nieuw)
+        arRow.append(self.aflevering_naam)
+        arRow.append(self.bronnenlijst)
+        # Do we need to add the mijn?
+        if not dic_mijnen is None:
+            # Get a list of the column indices in which this entry occurs
+            lst_mijn = [ dic_mijnen[x] for x in self.get_mijnen() if x in dic_mijnen]
+            for k,v in dic_mijnen.items():
+                if v in lst_mijn:
+                    arRow.append(1)
+                else:
+                    arRow.append("")
+        return arRow
+
+    def get_tsv(self):
+        return self.lemma_gloss + '\t' + self.trefwoord_woord + '\t' + self.woord + '\t' + self.dialect_nieuw + '\t' + self.aflevering_naam
+
+    def from_entry(entry, lMijn):
+        """Make an (unsaved) copy of [entry], whose mijnen have the names [lMijn]"""
+
+        afl = entry.aflevering
+        coordinate = entry.dialect.coordinate
+        return EntryView(
+            entry=entry, lemma_id=entry.lemma_id, descr_id=entry.descr_id, dialect_id=entry.dialect_id,
+            trefwoord_id=entry.trefwoord_id, aflevering_id=entry.aflevering_id,
+            woord=entry.woord, toelichting=entry.toelichting, kloeketoelichting=entry.kloeketoelichting,
+            lemma_gloss=entry.lemma.gloss, trefwoord_woord=entry.trefwoord.woord,
+            dialect_stad=entry.dialect.stad, dialect_nieuw=entry.dialect.nieuw,
+            bronnenlijst=entry.descr.bronnenlijst, mijnen=json.dumps(lMijn),
+            aflevering_key=entry.get_aflevering(), aflevering_summary=afl.get_summary(),
+            aflevering_pdf=afl.get_pdf(), aflevering_naam=afl.naam, toonbaar=afl.toonbaar,
+            point="" if coordinate == None else coordinate.point,
+            lemma_key=entry.lemma.gloss.lower(), trefwoord_key=entry.trefwoord.woord.lower(),
+            woord_key=entry.woord.lower(), toelichting_key=entry.toelichting.lower(),
+            stad_key=entry.dialect.stad.lower())
+
+    def refresh(aflevering = None, oProgress = None):
+        """Re-create the copies of the entries of [aflevering], or of all entries if it is None
+
+        The copies are replaced batch by batch, each batch in one transaction,
+        so that the listings stay complete while this runs.
+        Returns the number of copies that have been made, or -1 on error.
+        """
+
+        oErr = ErrHandle()
+        iCount = 0
+        try:
+            qsEntry = Entry.objects.all()
+            qsView = EntryView.objects.all()
+            if aflevering != None:
+                qsEntry = qsEntry.filter(aflevering=aflevering)
+                qsView = qsView.filter(aflevering=aflevering)
+
+            # The names of the mijnen per entry
+            dicMijn = {}
+            for oLink in EntryMijn.objects.filter(entry__in=qsEntry).order_by('mijn__naam').values('entry_id', 'mijn__naam'):
+                dicMijn.setdefault(oLink['entry_id'], []).append(oLink['mijn__naam'])
+
+            if oProgress != None: oProgress.phase("Copying entries", qsEntry.count())
+            # The details of the afleveringen come from [Aflevering.get_info]
+            qsEntry = qsEntry.select_related('lemma', 'descr', 'dialect__coordinate', 'trefwoord', 'aflevering')
+            lView = []
+            for entry in qsEntry.order_by('id').iterator():
+                lView.append(EntryView.from_entry(entry, dicMijn.get(entry.id, [])))
+                if len(lView) >= EntryView.batch_size:
+                    EntryView.replace(lView)
+                    iCount += len(lView)
+                    if oProgress != None: oProgress.add(len(lView))
+                    lView = []
+            if len(lView) > 0:
+                EntryView.replace(lView)
+                iCount += len(lView)
+                if oProgress != None: oProgress.add(len(lView))
+
+            # Remove the copies of entries that no longer belong here
+            if oProgress != None: oProgress.phase("Removing old listing", bReset=True)
+            with transaction.atomic():
+                qsView.exclude(entry__in=qsEntry.values('id')).delete()
+        except:
+            msg = oErr.get_error_message()
+            oErr.DoError("EntryView/refresh")
+            iCount = -1
+        return iCount
+
+    def replace(lView):
+        """Save the copies in [lView] in place of the existing copies of their entries"""
+
+        with transaction.atomic():
+            EntryView.objects.filter(entry_id__in=[x.entry_id for x in lView]).delete()
+            EntryView.objects.bulk_create(lView)
+
+    def install(sender=None, using="default", **kwargs):
+        """Fill the listing once, when it is still empty while there are entries"""
+
+        try:
+            bEmpty = not EntryView.objects.using(using).exists() and Entry.objects.using(using).exists()
+        except DatabaseError:
+            # E.g. after migrating back to before the table existed
+            return
+        if bEmpty:
+            EntryView.refresh()
+
 
 # ============================= Fixture Database Classes ===========================
 class FixSkip:
@@ -1287,20 +2187,35 @@ class FixSkip:
 
 
 class FixOut:
-    """Fixture output"""
+    """Fixture output
+
+    The fixture is written through a buffered writer. The format can be:
+        indent  - the default JSON with indent=2
+        compact - compact JSON with one object per line
+        gzip    - like 'compact', but gzipped (written to [output_file].gz)
+
+    When closing, a manifest is written next to the fixture (see [get_manifest_name]).
+    It holds the PK range per model, so that the PKs can be recovered without reading the fixture.
+    """
 
     bFirst = True      # Indicates that the first output string has been written
     fl_out = None      # Output file
+    buffer_size = 1024 * 1024
 
-    def __init__(self, output_file):
-        # Clear the output file, replacing it with a list starter
-        self.fl_out = io.open(output_file, "w", encoding='utf-8')
-        self.fl_out.write("[")
-        self.fl_out.close()
+    def __init__(self, output_file, sFormat = "indent"):
         # Make sure we keep the output file name
         self.output_file = output_file
-        # Open the file for appending
-        self.fl_out = io.open(output_file, "a", encoding='utf-8')
+        self.format = sFormat
+        # Keep track of the PK ranges of all models
+        self.manifest = {}
+        self.pk_last = -1
+        self.count = 0
+        # Open the file for writing, replacing it with a list starter
+        if sFormat == "gzip":
+            self.fl_out = gzip.open(output_file + ".gz", "wt", encoding='utf-8')
+        else:
+            self.fl_out = io.open(output_file, "w", encoding='utf-8', buffering=self.buffer_size)
+        self.fl_out.write("[")
 
     def append(self, sModel, iPk, **oFields):
         # Possibly add comma
@@ -1309,20 +2224,93 @@ class FixOut:
         oEntry = {"model": sModel, 
                   "pk": iPk, "fields": oFields}
         # Add the object         
-        self.fl_out.writelines(json.dumps(oEntry, indent=2))
+        if self.format == "indent":
+            self.fl_out.write(json.dumps(oEntry, indent=2))
+        else:
+            self.fl_out.write("\n" + json.dumps(oEntry, separators=(',', ':')))
+        # Keep track of the PK range for this model
+        oRange = self.manifest.get(sModel)
+        if oRange == None:
+            self.manifest[sModel] = {'first': iPk, 'last': iPk, 'count': 1}
+        else:
+            if iPk < oRange['first']: oRange['first'] = iPk
+            if iPk > oRange['last']: oRange['last'] = iPk
+            oRange['count'] += 1
+        self.pk_last = iPk
+        self.count += 1
 
     def do_comma(self):
         # Is this the first output?
         if self.bFirst:
             self.bFirst = False
         else:
-            self.fl_out.writelines(",")
+            self.fl_out.write(",")
 
     def close(self):
         # Append the final [
-        self.fl_out.writelines("]")
+        if self.format != "indent":
+            self.fl_out.write("\n")
+        self.fl_out.write("]")
         # Close the output file
         self.fl_out.close()
+        # Write the manifest
+        FixOut.write_manifest(self.output_file, self.format, self.count, self.pk_last, self.manifest)
+
+    def get_manifest_name(output_file):
+        """The manifest of 'fixture-d1-a2.json' is 'fixture-d1-a2.manifest'"""
+        return os.path.splitext(output_file)[0] + ".manifest"
+
+    def write_manifest(output_file, sFormat, iCount, iPkLast, oModels):
+        oManifest = {'fixture': os.path.basename(output_file),
+                     'format': sFormat,
+                     'created': "{:%d/%b/%Y %H:%M:%S}".format(datetime.now()),
+                     'count': iCount,
+                     'last': iPkLast,
+                     'models': oModels}
+        with io.open(FixOut.get_manifest_name(output_file), "w", encoding='utf-8') as fl_man:
+            fl_man.write(json.dumps(oManifest, indent=2))
+
+    def read_manifest(output_file):
+        """Get the manifest of [output_file]
+
+        If there is no manifest, but there is a fixture, then the fixture is read once
+        and the manifest is made from it.
+        """
+
+        oManifest = None
+        oErr = ErrHandle()
+        try:
+            manifest_file = FixOut.get_manifest_name(output_file)
+            if os.path.isfile(manifest_file):
+                with io.open(manifest_file, "r", encoding='utf-8') as fl_man:
+                    oManifest = json.load(fl_man)
+            elif os.path.isfile(output_file) or os.path.isfile(output_file + ".gz"):
+                oErr.Status("Reading from file {}".format(output_file))
+                # Read the file as a JSON object
+                if os.path.isfile(output_file):
+                    sFormat = "indent"
+                    fl_out = io.open(output_file, "r", encoding='utf-8')
+                else:
+                    sFormat = "gzip"
+                    fl_out = gzip.open(output_file + ".gz", "rt", encoding='utf-8')
+                with fl_out:
+                    lFix = json.load(fl_out)
+                oModels = {}
+                for oItem in lFix:
+                    iPk = oItem['pk']
+                    oRange = oModels.setdefault(oItem['model'], {'first': iPk, 'last': iPk, 'count': 0})
+                    if iPk < oRange['first']: oRange['first'] = iPk
+                    if iPk > oRange['last']: oRange['last'] = iPk
+                    oRange['count'] += 1
+                iPkLast = lFix[-1]['pk'] if len(lFix) > 0 else -1
+                # Make sure we do not need to read this fixture again
+                FixOut.write_manifest(output_file, sFormat, len(lFix), iPkLast, oModels)
+                oManifest = json.load(io.open(manifest_file, "r", encoding='utf-8'))
+        except:
+            msg = oErr.get_error_message()
+            oErr.DoError("FixOut/read_manifest")
+            oManifest = None
+        return oManifest
 
     def findItem(self, arItem, **oFields):
         try:
@@ -1332,18 +2320,7 @@ class FixOut:
             # Make sure numeric values are 
             # Check all the items given: do it reversed, because then we have the best chance of getting something
             for it in reversed(arItem):
-                # Assume we are okay
-                bFound = True
-                # Look through all the (k,v) pairs of [oFields]
-                for (k,v) in oFields.items():
-                    try:
-                        if k in oFields and getattr(it, k) != v:
-                            bFound = False
-                            break
-                    except:
-                        # No need to stop here
-                        a = 1
-                if bFound:
+                if fElement.matches(it, oFields):
                     return getattr(it, 'pk')
     
             # getting here means we haven't found it
@@ -1358,7 +2335,8 @@ class FixOut:
             iPkItem = -1
             # Look for this item in the list that we have
             if bSearch:
-                iPkItem = self.findItem(oCls.lstItem, **oFields)
+                # Use the index of the registry instead of walking [lstItem]
+                iPkItem = oCls.find_pk(**oFields)
             if iPkItem < 0:
                 # it is not in the list: add it
                 if 'pk' in oFields:
@@ -1369,7 +2347,7 @@ class FixOut:
 
                 iPkItem += 1
                 newItem = fElement(iPkItem, **oFields)
-                oCls.lstItem.append(newItem)
+                oCls.add_item(newItem)
                 # Add the item to the output
                 self.append(sModel, iPkItem, **oFields)
 
@@ -1386,114 +2364,220 @@ class fElement:
             setattr(self, k, v)
         self.pk = iPk
 
+    def matches(it, oFields):
+        """Check if element [it] has the values in [oFields]
+
+        Note: a field that [it] does not have, does not count as a mismatch
+        """
 
-class fLemma:
+        # Look through all the (k,v) pairs of [oFields]
+        for (k,v) in oFields.items():
+            try:
+                if getattr(it, k) != v:
+                    return False
+            except:
+                # No need to stop here
+                pass
+        return True
+
+
+class fRegistry:
+    """Registry of items that are (or will be) part of a fixture
+
+    Next to the list [lstItem] of known items, a dictionary [dicItem] is kept.
+    It is keyed on the values of the [keyfields], and it points to the positions
+    of the items with that key in [lstItem]. Looking for an item then only needs
+    to consider the (very few) items in one bucket instead of the whole list.
+
+    Note: each derived class must define its own [lstItem], [dicItem] and [lstLoose]
+    """
+
+    keyfields = []  # Names of the fields that make up the natural key
+    pk = 0          # Initialise PK
+    lstItem = []    # Array of known items
+    dicItem = {}    # Index: key values -> list of positions in [lstItem]
+    lstLoose = []   # Positions of items that lack one or more of the [keyfields]
+
+    def get_key(self, oFields):
+        """Get the key for [oFields], or None if it cannot be made"""
+
+        try:
+            key = tuple(oFields[k] for k in self.keyfields)
+            # Make sure the key can be used in the dictionary
+            hash(key)
+        except:
+            key = None
+        return key
+
+    def add_item(self, item):
+        """Add [item] to the list of known items and to the index"""
+
+        idx = len(self.lstItem)
+        self.lstItem.append(item)
+        key = self.get_key(item.__dict__)
+        if key == None:
+            self.lstLoose.append(idx)
+        else:
+            self.dicItem.setdefault(key, []).append(idx)
+
+    def find_pk(self, **oFields):
+        """Find the PK of the last added item matching [oFields], or return -1"""
+
+        try:
+            # Sanity check
+            if len(self.lstItem) == 0:
+                return -1
+            key = self.get_key(oFields)
+            if key == None:
+                # Cannot use the index: consider all items
+                lstIdx = range(len(self.lstItem))
+            elif len(self.lstLoose) == 0:
+                lstIdx = self.dicItem.get(key, [])
+            else:
+                lstIdx = sorted(self.dicItem.get(key, []) + self.lstLoose)
+            # Check the candidates reversed, just like [FixOut.findItem] does
+            for idx in reversed(lstIdx):
+                it = self.lstItem[idx]
+                if fElement.matches(it, oFields):
+                    return it.pk
+
+            # getting here means we haven't found it
+            return -1
+        except:
+            errHandle.DoError("fRegistry/find_pk", True)
+
+
+class fLemma(fRegistry):
     """Lemma information to fixture"""
 
+    keyfields = ['gloss']
     pk = 0         # Initialise PK
     lstItem = []   # Array of known lemma's
+    dicItem = {}
+    lstLoose = []
 
     def load(self, qs):
         if qs:
             for item in qs:
                 # Add this item to the list we have
-                self.lstItem.append(fElement(item.pk, gloss=item.gloss))
+                self.add_item(fElement(item.pk, gloss=item.gloss))
                 self.pk = item.pk
 
 
-class fDescr:
+class fDescr(fRegistry):
     """Description information to fixture"""
 
+    keyfields = ['bronnenlijst', 'toelichting', 'boek']
     pk = 0         # Initialise PK
     lstItem = []   # Array of known lemma's
+    dicItem = {}
+    lstLoose = []
 
     def load(self, qs):
         if qs:
             for item in qs:
                 # Add this item to the list we have
-                self.lstItem.append(fElement(item.pk, 
+                self.add_item(fElement(item.pk, 
                                              bronnenlijst=item.bronnenlijst, 
                                              toelichting=item.toelichting, 
                                              boek=item.boek))
                 self.pk = item.pk
 
 
-class fLemmaDescr:
+class fLemmaDescr(fRegistry):
     """Connection between lemma and description information to fixture"""
 
+    keyfields = ['lemma', 'description']
     pk = 0         # Initialise PK
     lstItem = []   # Array of known lemma's
+    dicItem = {}
+    lstLoose = []
 
     def load(self, qs):
         if qs:
             for item in qs:
                 # Add this item to the list we have
-                self.lstItem.append(fElement(item.pk, lemma=item.lemma, description=item.description))
+                self.add_item(fElement(item.pk, lemma=item.lemma, description=item.description))
                 self.pk = item.pk
 
 
-class fEntryMijn:
+class fEntryMijn(fRegistry):
     """Connection between entry and mijn information to fixture"""
 
+    keyfields = ['entry', 'mijn']
     pk = 0         # Initialise PK
     lstItem = []   # Array of known items
+    dicItem = {}
+    lstLoose = []
 
     def load(self, qs):
         if qs:
             for item in qs:
                 # Add this item to the list we have
-                self.lstItem.append(fElement(item.pk, entry=item.entry, mijn=item.mijn))
+                self.add_item(fElement(item.pk, entry=item.entry, mijn=item.mijn))
                 self.pk = item.pk
 
 
-class fDialect:
+class fDialect(fRegistry):
     """Dialect information to fixture"""
 
+    keyfields = ['stad', 'nieuw']
     pk = 0         # Initialise PK
     lstItem = []   # Array of known dialects
+    dicItem = {}
+    lstLoose = []
 
     def load(self, qs):
         if qs:
             for item in qs:
                 # Add this item to the list we have
                 added = fElement(item.pk, stad=item.stad, nieuw=item.nieuw)
-                self.lstItem.append(added)
+                self.add_item(added)
                 self.pk = item.pk
 
 
-class fTrefwoord:
+class fTrefwoord(fRegistry):
     """Trefwoord information to fixture"""
 
+    keyfields = ['woord']
     pk = 0         # Initialise PK
     lstItem = []   # Array of known items
+    dicItem = {}
+    lstLoose = []
 
     def load(self, qs):
         if qs:
             for item in qs:
                 # Add this item to the list we have
-                self.lstItem.append(fElement(item.pk, woord=item.woord))
+                self.add_item(fElement(item.pk, woord=item.woord))
                 self.pk = item.pk
 
 
-class fMijn:
+class fMijn(fRegistry):
     """Mijn information to fixture"""
 
+    keyfields = ['naam']
     pk = 0         # Initialise PK
     lstItem = []   # Array of known items
+    dicItem = {}
+    lstLoose = []
 
     def load(self, qs):
         if qs:
             for item in qs:
                 # Add this item to the list we have
-                self.lstItem.append(fElement(item.pk, naam=item.naam))
+                self.add_item(fElement(item.pk, naam=item.naam))
                 self.pk = item.pk
 
 
-class fAflevering:
+class fAflevering(fRegistry):
     """Aflevering information to fixture"""
 
+    keyfields = ['deel', 'aflnum']
     pk = 0         # Initialise PK
     lstItem = []   # Array of known dialects
+    dicItem = {}
+    lstLoose = []
 
     def load(self, qs):
         try:
@@ -1510,30 +2594,301 @@ class fAflevering:
                             added = fElement(item.pk, deel=item.deel, aflnum=item.aflnum)
                         except:
                             a = 1
-                    self.lstItem.append(added)
+                    self.add_item(added)
                     self.pk = item.pk
         except:
             errHandle.DoError("fAflevering", True)
 
 
-class fEntry:
+class fEntry(fRegistry):
     """Entry information to fixture"""
 
+    keyfields = ['woord']
     pk = 0         # Initialise PK
     lstItem = []   # Array of known dialects
+    dicItem = {}
+    lstLoose = []
 
     def load(self, qs):
         if qs:
             for item in qs:
                 # Add this item to the list we have
-                self.lstItem.append(fElement(item.pk, woord=item.woord, 
+                self.add_item(fElement(item.pk, woord=item.woord, 
                                       toelichting=item.toelichting, 
                                       lemma=item.lemma, 
                                       dialect=item.dialect, 
                                       trefwoord=item.trefwoord, 
                                       aflevering=item.aflevering))
                 self.pk = item.pk
-    
+
+
+class BulkImport:
+    """Database import using in-memory key caches and batched bulk_create
+
+    The natural keys of the existing Lemma, Description, LemmaDescr, Dialect,
+    Trefwoord and Mijn objects are loaded once. New rows are resolved against
+    these in-memory maps, new objects get their PK assigned here, and they are
+    written with [bulk_create] in chunks, each chunk within one transaction.
+
+    The matching follows [Lemma.get_instance], [Description.get_instance],
+    [Dialect.get_item], [Trefwoord.get_item] and [Mijn.get_item]. Where these
+    use [__iexact], the keys are folded with [fold_ascii], since SQLite only
+    folds the case of ASCII letters; lemma's and trefwoorden are lowercased
+    with Python's lower() before they are stored and compared, as there.
+    """
+
+    chunk_size = 5000       # Number of entries per transaction
+    batch_size = 500        # Maximum number of objects per bulk_create call
+
+    def __init__(self, oTime = None):
+        # Keep track of the time used
+        self.oTime = oTime
+        # The in-memory key maps
+        self.dic_lemma = {}
+        self.dic_descr = {}
+        self.set_lemmadescr = set()
+        self.dic_dialect = {}
+        self.dic_trefwoord = {}
+        self.dic_trefwoord_any = {}
+        self.dic_mijn = {}
+        # The last PK in use for each model
+        self.dic_pk = {}
+        # The objects that still need to be written, in the order in which they are to be written
+        self.pending = {'lemma': [], 'descr': [], 'lemmadescr': [], 'dialect': [],
+                        'trefwoord': [], 'mijn': [], 'entry': [], 'entrymijn': []}
+        self.entries = 0
+        # Load what is in the database already
+        self.load()
+
+    def load(self):
+        """Load the natural keys of all existing objects"""
+
+        oErr = ErrHandle()
+        try:
+            # Note: the first (lowest id) object is the one that [filter().first()] returns
+            for id, gloss in Lemma.objects.order_by('id').values_list('id', 'gloss'):
+                self.dic_lemma.setdefault(gloss, id)
+            for id, bronnenlijst, boek, toelichting in Description.objects.order_by('id').values_list(
+                    'id', 'bronnenlijst', 'boek', 'toelichting'):
+                self.dic_descr.setdefault(self.descr_key(bronnenlijst, boek, toelichting), id)
+            for lemma_id, description_id in LemmaDescr.objects.values_list('lemma_id', 'description_id'):
+                self.set_lemmadescr.add((lemma_id, description_id))
+            for id, stad, nieuw in Dialect.objects.order_by('id').values_list('id', 'stad', 'nieuw'):
+                self.dic_dialect.setdefault((fold_ascii(stad), fold_ascii(nieuw)), id)
+            for id, woord, toelichting in Trefwoord.objects.order_by('id').values_list('id', 'woord', 'toelichting'):
+                self.dic_trefwoord_any.setdefault(woord, id)
+                self.dic_trefwoord.setdefault((woord, fold_ascii(toelichting)), id)
+            for id, naam in Mijn.objects.order_by('id').values_list('id', 'naam'):
+                self.dic_mijn.setdefault(fold_ascii(naam), id)
+
+            # Determine the highest PK for all models we may add to
+            for sKey, cls in [('lemma', Lemma), ('descr', Description), ('lemmadescr', LemmaDescr),
+                              ('dialect', Dialect), ('trefwoord', Trefwoord), ('mijn', Mijn),
+                              ('entry', Entry), ('entrymijn', EntryMijn)]:
+                iMax = cls.objects.aggregate(models.Max('id'))['id__max']
+                self.dic_pk[sKey] = 0 if iMax == None else iMax
+        except:
+            errHandle.DoError("BulkImport/load", True)
+
+    def descr_key(self, bronnenlijst, boek, toelichting):
+        # Description matching is case-insensitive (for ASCII letters, as in SQLite)
+        return (fold_ascii(bronnenlijst), None if boek == None else fold_ascii(boek), fold_ascii(toelichting))
+
+    def next_pk(self, sKey):
+        self.dic_pk[sKey] += 1
+        return self.dic_pk[sKey]
+
+    def get_lemma(self, gloss):
+        # Make sure it is lower case
+        gloss = gloss.lower()
+        iPk = self.dic_lemma.get(gloss)
+        if iPk == None:
+            iPk = self.next_pk('lemma')
+            self.pending['lemma'].append(Lemma(id=iPk, gloss=gloss))
+            self.dic_lemma[gloss] = iPk
+        return iPk
+
+    def get_descr(self, bronnenlijst, toelichting, boek):
+        key = self.descr_key(bronnenlijst, boek, toelichting)
+        iPk = self.dic_descr.get(key)
+        if iPk == None:
+            iPk = self.next_pk('descr')
+            self.pending['descr'].append(Description(id=iPk, bronnenlijst=bronnenlijst, boek=boek, toelichting=toelichting))
+            self.dic_descr[key] = iPk
+        return iPk
+
+    def get_lemmadescr(self, iPkLemma, iPkDescr):
+        key = (iPkLemma, iPkDescr)
+        if not key in self.set_lemmadescr:
+            self.pending['lemmadescr'].append(LemmaDescr(id=self.next_pk('lemmadescr'), lemma_id=iPkLemma, description_id=iPkDescr))
+            self.set_lemmadescr.add(key)
+        # There is no need for the actual PK
+        return 0
+
+    def get_dialect(self, stad, nieuw):
+        key = (fold_ascii(stad), fold_ascii(nieuw))
+        iPk = self.dic_dialect.get(key)
+        if iPk == None:
+            iPk = self.next_pk('dialect')
+            self.pending['dialect'].append(Dialect(id=iPk, stad=stad, nieuw=nieuw, code='-'))
+            self.dic_dialect[key] = iPk
+        return iPk
+
+    def get_trefwoord(self, woord, toelichting = None):
+        # Make sure it is lower case
+        woord = woord.lower()
+        if toelichting == None or toelichting == "":
+            iPk = self.dic_trefwoord_any.get(woord)
+            toelichting = ""
+        else:
+            iPk = self.dic_trefwoord.get((woord, fold_ascii(toelichting)))
+        if iPk == None:
+            iPk = self.next_pk('trefwoord')
+            self.pending['trefwoord'].append(Trefwoord(id=iPk, woord=woord, toelichting=toelichting))
+            self.dic_trefwoord_any.setdefault(woord, iPk)
+            self.dic_trefwoord.setdefault((woord, fold_ascii(toelichting)), iPk)
+        return iPk
+
+    def get_mijn(self, naam):
+        key = fold_ascii(naam)
+        iPk = self.dic_mijn.get(key)
+        if iPk == None:
+            iPk = self.next_pk('mijn')
+            self.pending['mijn'].append(Mijn(id=iPk, naam=naam))
+            self.dic_mijn[key] = iPk
+        return iPk
+
+    def add_entry(self, iPk, woord, toelichting, kloeketoelichting, lemma, descr, dialect, trefwoord, aflevering):
+        """Add an entry with a PK that has been determined by the caller"""
+
+        self.pending['entry'].append(Entry(id=iPk, woord=woord, toelichting=toelichting,
+                                           kloeketoelichting=kloeketoelichting, lemma_id=lemma,
+                                           descr_id=descr, dialect_id=dialect, trefwoord_id=trefwoord,
+                                           aflevering_id=aflevering))
+        # Keep track of the highest PK for Entry
+        if iPk > self.dic_pk['entry']:
+            self.dic_pk['entry'] = iPk
+        self.entries += 1
+
+    def add_entrymijn(self, iPkEntry, iPkMijn):
+        self.pending['entrymijn'].append(EntryMijn(id=self.next_pk('entrymijn'), entry_id=iPkEntry, mijn_id=iPkMijn))
+
+    def line_done(self):
+        """Flush the pending objects when a chunk has been completed"""
+
+        if len(self.pending['entry']) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Write all pending objects to the database within one transaction"""
+
+        if self.oTime != None: iStart = get_now_time()
+        with transaction.atomic():
+            for sKey, cls in [('lemma', Lemma), ('descr', Description), ('lemmadescr', LemmaDescr),
+                              ('dialect', Dialect), ('trefwoord', Trefwoord), ('mijn', Mijn),
+                              ('entry', Entry), ('entrymijn', EntryMijn)]:
+                lst_obj = self.pending[sKey]
+                if len(lst_obj) > 0:
+                    cls.objects.bulk_create(lst_obj, batch_size=self.batch_size)
+                    self.pending[sKey] = []
+        if self.oTime != None: self.oTime['save'] += get_now_time() - iStart
+
+
+class DeltaImport(BulkImport):
+    """Re-import one aflevering by only changing the entries that differ from what is in the database
+
+    The entries of a file are collected first. Each entry is identified by its normalized
+    contents: (woord, toelichting, kloeketoelichting, lemma, descr, dialect, trefwoord, mijnen).
+    In [flush] these are compared with the Entry rows of the aflevering:
+      - rows that occur in both are left alone
+      - changed rows re-use the id of a row that is no longer there (bulk_update)
+      - any other new rows are inserted, and any other old rows are deleted
+    """
+
+    entry_fields = ['woord', 'toelichting', 'kloeketoelichting', 'lemma_id', 'descr_id', 'dialect_id', 'trefwoord_id']
+
+    def start(self, iPkAflevering):
+        """Start collecting the entries for the aflevering with id [iPkAflevering]"""
+
+        self.aflevering = iPkAflevering
+        self.lst_entry = []     # (provisional pk, contents) of the new entries
+        self.dic_mijn_of = {}   # provisional pk to the list of mijn ids
+        self.counts = {'kept': 0, 'updated': 0, 'inserted': 0, 'deleted': 0}
+
+    def add_entry(self, iPk, woord, toelichting, kloeketoelichting, lemma, descr, dialect, trefwoord, aflevering):
+        """Collect an entry: the [iPk] is only used to link mines to it"""
+
+        self.lst_entry.append((iPk, (woord, toelichting, kloeketoelichting, lemma, descr, dialect, trefwoord)))
+        self.entries += 1
+
+    def add_entrymijn(self, iPkEntry, iPkMijn):
+        self.dic_mijn_of.setdefault(iPkEntry, []).append(iPkMijn)
+
+    def line_done(self):
+        # Nothing can be written before the whole file has been read
+        pass
+
+    def flush(self):
+        """Compare the collected entries with those in the database, and only write the differences"""
+
+        if self.oTime != None: iStart = get_now_time()
+        # Get the current entries of this aflevering, indexed by their contents
+        dic_mijn_old = {}
+        for entry_id, mijn_id in EntryMijn.objects.filter(entry__aflevering_id=self.aflevering).values_list('entry_id', 'mijn_id'):
+            dic_mijn_old.setdefault(entry_id, []).append(mijn_id)
+        dic_old = {}
+        for oValues in Entry.objects.filter(aflevering_id=self.aflevering).order_by('id').values_list('id', *self.entry_fields):
+            id = oValues[0]
+            key = oValues[1:] + (tuple(sorted(dic_mijn_old.get(id, []))), )
+            dic_old.setdefault(key, []).append(id)
+
+        # Walk the new entries: keep those that are already there
+        lst_new = []
+        for iPk, oValues in self.lst_entry:
+            lMijn = self.dic_mijn_of.get(iPk, [])
+            key = oValues + (tuple(sorted(lMijn)), )
+            lst_id = dic_old.get(key)
+            if lst_id:
+                lst_id.pop(0)
+                self.counts['kept'] += 1
+            else:
+                lst_new.append((oValues, lMijn))
+        lst_gone = sorted([id for lst_id in dic_old.values() for id in lst_id])
+
+        # Changed entries take over the ids of entries that are gone
+        lst_update = []
+        lst_renew = []
+        for id, (oValues, lMijn) in zip(lst_gone, lst_new):
+            lst_update.append(Entry(id=id, aflevering_id=self.aflevering, **dict(zip(self.entry_fields, oValues))))
+            lst_renew.append(id)
+            for iPkMijn in lMijn:
+                self.pending['entrymijn'].append(EntryMijn(id=self.next_pk('entrymijn'), entry_id=id, mijn_id=iPkMijn))
+        # Any other new entries are inserted
+        for oValues, lMijn in lst_new[len(lst_update):]:
+            id = self.next_pk('entry')
+            self.pending['entry'].append(Entry(id=id, aflevering_id=self.aflevering, **dict(zip(self.entry_fields, oValues))))
+            for iPkMijn in lMijn:
+                self.pending['entrymijn'].append(EntryMijn(id=self.next_pk('entrymijn'), entry_id=id, mijn_id=iPkMijn))
+        # Any other old entries are deleted
+        lst_delete = lst_gone[len(lst_update):]
+
+        with transaction.atomic():
+            # The mines of changed entries are renewed
+            for i in range(0, len(lst_renew), self.batch_size):
+                EntryMijn.objects.filter(entry_id__in=lst_renew[i:i+self.batch_size]).delete()
+            for i in range(0, len(lst_delete), self.batch_size):
+                Entry.objects.filter(id__in=lst_delete[i:i+self.batch_size]).delete()
+            # New lemma's, descriptions etc. must be there before the entries are changed
+            BulkImport.flush(self)
+            if len(lst_update) > 0:
+                Entry.objects.bulk_update(lst_update, self.entry_fields, batch_size=self.batch_size)
+        self.counts['updated'] = len(lst_update)
+        self.counts['inserted'] = len(lst_new) - len(lst_update)
+        self.counts['deleted'] = len(lst_delete)
+        self.lst_entry = []
+        self.dic_mijn_of = {}
+        if self.oTime != None: self.oTime['save'] += get_now_time() - iStart
+
 
 # -----------------------------------------------------------------------------------------------------
 # Name :    csv_to_fixture
@@ -1542,8 +2897,17 @@ class fEntry:
 #  1/dec/2016   ERK Created
 #  8/aug/2018   ERK Copied adaptation from the e-WBD version
 # -----------------------------------------------------------------------------------------------------
-def csv_to_fixture(csv_file, iDeel, iSectie, iAflevering, iStatus, bUseDbase=False, bUseOld=False):
-    """Process a CSV with entry definitions"""
+def csv_to_fixture(csv_file, iDeel, iSectie, iAflevering, iStatus, bUseDbase=False, bUseOld=False, bBulk=False, sFixFormat="indent", iWorkers=None, bDelta=False):
+    """Process a CSV with entry definitions
+
+    With [bUseDbase] and [bBulk] both set, everything (including Entry and EntryMijn)
+    is written to the database using [BulkImport] instead of one object at a time.
+    The format of the fixture output is [sFixFormat]: 'indent', 'compact' or 'gzip' (see [FixOut]).
+    When all files are treated, they are parsed by [iWorkers] processes (default: one per CPU; 1 = no workers).
+    Assigning the PKs remains a job of this process, so the outcome is the same as without workers.
+    With [bDelta] files are treated even when they have been processed before: only the entries
+    that differ from the ones of the aflevering in the database are changed (see [DeltaImport]).
+    """
 
     oBack = {}      # What we return
     sVersie = ""    # The version we are using--this depends on the column names
@@ -1559,16 +2923,36 @@ def csv_to_fixture(csv_file, iDeel, iSectie, iAflevering, iStatus, bUseDbase=Fal
         sBaseName = sBaseName + "-a" + str(a)
         return sBaseName
 
+    def get_domijnen(d, a):
+        # The use of 'mijnen' depends on the dictionary we are working for (wld, wbd, wgd)
+        if sDict == "wld" or sDict == "wgd":
+            # The WLD uses mijnen in 2/5
+            return (d == 2 and a == 5)   # Treat 'Mijn' for wbd-II-5
+        else:
+            # The WBD doesn't have any mijnen
+            return False
+
     try:
+        # A delta import works directly on the database
+        if bDelta:
+            bUseDbase = True
+            bBulk = True
+
         # Retrieve the correct instance of the status object
         oStatus = Status.objects.filter(id=iStatus).first()
         oStatus.status = "preparing"
-        if bUseDbase:
+        if bDelta:
+            oStatus.method = "delta"
+        elif bUseDbase and bBulk:
+            oStatus.method = "bulk"
+        elif bUseDbase:
             oStatus.method = "db"
         else:
             oStatus.method = "lst"
         # Save the status to the database
         oStatus.save()
+        # All further progress goes through the progress reporter
+        oProgress = Progress(oStatus)
 
         oBack['result'] = False
 
@@ -1616,6 +3000,7 @@ def csv_to_fixture(csv_file, iDeel, iSectie, iAflevering, iStatus, bUseDbase=Fal
 
         # Prepare the entry object
         oEntry = fEntry()
+        oBulk = None
 
         # Create instances of the Lemma, Dialect and other classes
         if not bUseDbase:
@@ -1636,22 +3021,22 @@ def csv_to_fixture(csv_file, iDeel, iSectie, iAflevering, iStatus, bUseDbase=Fal
                 # Indicate we are loading existing stuff
 
                 # Start loading...
-                oStatus.set_status("loading lemma's")
+                oProgress.phase("loading lemma's")
                 oLemma.load(Lemma.objects.all())
 
-                oStatus.set_status("loading keywords")
+                oProgress.phase("loading keywords")
                 oTrefwoord.load(Trefwoord.objects.all())
 
                 iSize = LemmaDescr.objects.all().count()
-                oStatus.set_status("loading {} lemma-descriptions ".format(iSize))
+                oProgress.phase("loading {} lemma-descriptions ".format(iSize))
                 oLemmaDescr.load(LemmaDescr.objects.all())
 
-                oStatus.set_status("loading descriptions")
+                oProgress.phase("loading descriptions")
                 oDescr.load(Description.objects.all())
                 # It should *not* be necessary to load all existing ENTRY objects
                 #    since we assume that any object to be added is UNIQUE
                 # oEntry.load(Entry.objects.all())
-                oStatus.set_status("loading mines")
+                oProgress.phase("loading mines")
                 oEntryMijn.load(EntryMijn.objects.all())
 
         if bUseOld:
@@ -1661,6 +3046,14 @@ def csv_to_fixture(csv_file, iDeel, iSectie, iAflevering, iStatus, bUseDbase=Fal
             else:
                 iPkEntry = Entry.objects.latest('id').id
 
+        if bUseDbase and bBulk:
+            # Load the natural keys of everything that is already in the database
+            oProgress.phase("loading keys")
+            oBulk = DeltaImport() if bDelta else BulkImport()
+            # The PKs for new Entry objects must not be in use yet
+            if oBulk.dic_pk['entry'] > iPkEntry:
+                iPkEntry = oBulk.dic_pk['entry']
+
         # First check the presence of all the 'promised' files
         lMsg = []
         for oInfo in lstInfo:
@@ -1677,14 +3070,11 @@ def csv_to_fixture(csv_file, iDeel, iSectie, iAflevering, iStatus, bUseDbase=Fal
                 oErr.Status("Checking the PK of {}/{}/{}".format(iDeel, iSectie, iAflevering))
                 sBaseName = get_basename(iDeel, iSectie, iAflevering)
                 output_file = os.path.join(MEDIA_ROOT ,sBaseName + ".json")
-                if os.path.isfile(output_file):
-                    oErr.Status("Reading from file {}".format(output_file))
-                    # Read the file as a JSON object
-                    fl_out = io.open(output_file, "r", encoding='utf-8')   
-                    lFix = json.load(fl_out)                 
+                # The manifest of the fixture holds the PK ranges
+                oManifest = FixOut.read_manifest(output_file)
+                if oManifest != None and 'dictionary.entry' in oManifest['models']:
                     # Find the highest (=last) 
-                    size = len(lFix)
-                    pk_last = lFix[size-1]['pk']
+                    pk_last = oManifest['models']['dictionary.entry']['last']
                     if pk_last > iPkEntry:
                         oErr.Status("Found last_pk to be {}".format(pk_last))
                         iPkEntry = pk_last + 1
@@ -1700,6 +3090,26 @@ def csv_to_fixture(csv_file, iDeel, iSectie, iAflevering, iStatus, bUseDbase=Fal
 
         # Initialization of 'last' items
         descr_this = None
+
+        def do_this_item(oInfo):
+            sProcessed = ""
+            if oInfo.processed != None:
+                sProcessed = oInfo.processed
+            return ((sProcessed == "" or bDelta) and (oInfo.deel>0 or oInfo.sectie>0 or oInfo.aflnum>0))
+
+        # When doing everything, let worker processes read and check the CSV files beforehand
+        oParsed = None
+        if bDoEverything and iWorkers != 1:
+            lstJob = []
+            for oInfo in lstInfo:
+                # NOTE: the results are handed out in order, so use exactly the same selection as the loop below
+                if do_this_item(oInfo):
+                    iDeel = int(oInfo.deel) if str(oInfo.deel).isnumeric() else oInfo.deel
+                    iAflevering = int(oInfo.aflnum) if str(oInfo.aflnum).isnumeric() else oInfo.aflnum
+                    lstJob.append((oInfo.csv_file.path, get_domijnen(iDeel, iAflevering)))
+            if len(lstJob) > 1:
+                oProgress.phase("parsing {} files".format(len(lstJob)))
+                oParsed = csv_parse_parallel(lstJob, iWorkers)
         
         # Process all the objects in [lstInfo]
         for oInfo in lstInfo:
@@ -1708,12 +3118,9 @@ def csv_to_fixture(csv_file, iDeel, iSectie, iAflevering, iStatus, bUseDbase=Fal
             iDeel = oInfo.deel
             iSectie = oInfo.sectie
             iAflevering = oInfo.aflnum
-            sProcessed = ""
-            if oInfo.processed != None:
-                sProcessed = oInfo.processed
 
             # Determine whether we will process this item or not
-            bDoThisItem = (sProcessed == "" and (iDeel>0 or iSectie>0 or iAflevering>0))
+            bDoThisItem = do_this_item(oInfo)
 
             if bDoThisItem:
                 # Make sure 'NONE' sectie is turned into an empty string
@@ -1723,7 +3130,7 @@ def csv_to_fixture(csv_file, iDeel, iSectie, iAflevering, iStatus, bUseDbase=Fal
                 iSkipped = 0        # Number skipped
 
                 sWorking = "working {}/{}/{}".format(iDeel, iSectie, iAflevering)
-                oStatus.set_status(sWorking)
+                oProgress.phase(sWorking, bReset=True)
                 oErr.Status(sWorking)
 
                 # Create an output file writer
@@ -1731,7 +3138,10 @@ def csv_to_fixture(csv_file, iDeel, iSectie, iAflevering, iStatus, bUseDbase=Fal
                 sBaseName = get_basename(iDeel, iSectie, iAflevering)
                 output_file = os.path.join(MEDIA_ROOT ,sBaseName + ".json")
                 skip_file = os.path.join(MEDIA_ROOT, sBaseName + ".skip")
-                oFix = FixOut(output_file)
+                # Bulk and delta imports write to the database: leave the fixture (and its manifest) alone
+                oFix = None
+                if oBulk == None:
+                    oFix = FixOut(output_file, sFixFormat)
                 oSkip = FixSkip(skip_file)
 
                 # get a Aflevering number
@@ -1745,27 +3155,16 @@ def csv_to_fixture(csv_file, iDeel, iSectie, iAflevering, iStatus, bUseDbase=Fal
                     lstQ.append(Q(sectie=iSectie))
                 oAfl = Aflevering.objects.filter(*lstQ).first()
                 iPkAflevering = oAfl.pk
+                if bDelta:
+                    oBulk.start(iPkAflevering)
 
-                # Open source file to read line-by-line
-                f = codecs.open(csv_file, "r", encoding='utf-8-sig')
-                bEnd = False
-                bFirst = True
-                bFirstOut = False
-
-                sVersie = ""
                 sLastLemma = ""     # For speeding up processing
                 sLastLemmaDescr = ""
                 sLastTw = ""
                 sLastTwToel = ""
 
-                # The use of 'mijnen' depends on the dictionary we are working for (wld, wbd, wgd)
                 lMijnen = []
-                if sDict == "wld" or sDict == "wgd":
-                    # The WLD uses mijnen in 2/5
-                    bDoMijnen = (iDeel == 2 and iAflevering == 5)   # Treat 'Mijn' for wbd-II-5
-                else:
-                    # The WBD doesn't have any mijnen
-                    bDoMijnen = False
+                bDoMijnen = get_domijnen(iDeel, iAflevering)
 
                 # Time measurements: keep track of time used in different parts
                 oTime = {}
@@ -1779,159 +3178,172 @@ def csv_to_fixture(csv_file, iDeel, iSectie, iAflevering, iStatus, bUseDbase=Fal
                 oTime['search_Dt'] = 0  # Time spent in searching (dialect)
                 oTime['search_LD'] = 0  # Time spent in searching (lemmadescription)
                 oTime['search_M'] = 0   # Time spent in searching (mijn)
+                if oBulk != None:
+                    oBulk.oTime = oTime
+
+                oProgress.oTime = oTime
+
+                # Get the lines of the CSV file: either already parsed by a worker or read line-by-line
+                f = None
+                if oParsed == None:
+                    f = codecs.open(csv_file, "r", encoding='utf-8-sig')
+                    lstLine = csv_to_lines(f, bDoMijnen)
+                else:
+                    lstLine = next(oParsed)
+                    # Now we know how many lines (apart from the header) there are
+                    oProgress.iTotal = len(lstLine) - 1
 
                 # Iterate through the lines of the CSV file
-                while (not bEnd):
+                iStarttime = get_now_time()
+                for strLine, sVersie, iValid, oLine in lstLine:
+                    oTime['read'] += get_now_time() - iStarttime
                     # Show where we are
                     iCounter +=1
                     if iCounter % 1000 == 0:
                         errHandle.Status("Processing: " + str(iCounter))
-                    # Read one line
-                    iStarttime = get_now_time()
-                    strLine = f.readline()
-                    if (strLine == ""):
-                        bEnd = True
-                        break
-                    strLine = str(strLine)
-                    strLine = strLine.strip(" \n\r")
-                    oTime['read'] += get_now_time() - iStarttime
-                    # Only process substantial lines
-                    if (strLine != ""):
-                        # Split the line into parts
-                        arPart = strLine.split('\t')
-                        # Sanity check (Note: '7' is arbitrarily)
-                        if len(arPart) < 7:
-                            # Line is too short, so cannot be taken into consideration
-                            iValid = 0
-                        else:
-                            # Convert the array of values to a structure
-                            oLine = partToLine(sVersie, arPart, bDoMijnen)
-                            # Check if this line contains 'valid' data:
-                            iValid = isLineOkay(oLine)
-                        # IF this is the first line or an empty line, then skip
-                        if bFirst:
-                            # Get the version from cell 0, line 0
-                            sVersie = arPart[1]     # Assuming that the first field is [recordId]
-                            # Check if the line starts correctly
-                            if sVersie != 'Lemmanummer' and sVersie != "lemma.name":
-                                # The first line does not start correctly -- return false
-                                oErr.DoError("csv_to_fixture: cannot process version [{}]".format(sVersie))
-                                return oBack
-                            # Indicate that the first item has been had
-                            bFirst = False
-                        elif iValid == 0:
-                            # Assuming this 'part' is entering an ENTRY
-
-                            # Make sure we got TREFWOORD correctly
-                            sTrefWoord = oLine['trefwoord_name']
-
-                            if bDoMijnen and 'mijn_list' in oLine:
-                                lMijnen = oLine['mijn_list']
-
-
-                            if bUseDbase:
-                                # Try to do all of this within one actual transation
-                                iStarttime = get_now_time()
-                                with transaction.atomic():
-                                    # Find out which lemma this is
-                                    sLemma = oLine['lemma_name']
-                                    if sLemma != sLastLemma:
-                                        lemma_this = Lemma.get_instance({'gloss': sLemma}, oTime)
-                                        sLastLemma = sLemma
-
-                                    # Find out which lemma-description this is
-                                    descr_this = Description.get_instance({'bronnenlijst': oLine['lemma_bronnenlijst'],
-                                                                     'toelichting': oLine['lemma_toelichting'], 
-                                                                     'boek': oLine['lemma_boek']}, descr_this, oTime)
-
-                                    # We do need the PKs of the lemma and the description
-                                    iPkLemma = lemma_this.pk
-                                    iPkDescr = descr_this.pk
-
-                                    # Add the [iPkDescr] to the LemmaDescr--but only if it is not already there
-                                    iPkLemmaDescr = LemmaDescr.get_item({'lemma': lemma_this,
-                                                                         'description': descr_this}, oTime)
-
-                                    # Find out which dialect this is
-                                    if oLine['dialect_kloeke'] != None and oLine['dialect_kloeke'] != "":
-                                        iPkDialect = Dialect.get_item({'stad': oLine['dialect_stad'], 
-                                                                        'nieuw': oLine['dialect_nieuw'],
-                                                                        'code': oLine['dialect_kloeke']}, oTime)
-                                        # Note: removed 'dialect_toelichting' in accordance with issue #22 of WLD
-                                    else:
-                                        iPkDialect = Dialect.get_item({'stad': oLine['dialect_stad'], 
-                                                                        'nieuw': oLine['dialect_nieuw']}, oTime)
-
-                                    # Find out which trefwoord this is
-                                    sTwToel = oLine['trefwoord_toelichting']
-                                    if sTwToel == None or sTwToel == "":
-                                        if sLastTwToel != "" or sLastTw != sTrefWoord:
-                                            iPkTrefwoord = Trefwoord.get_item({'woord': sTrefWoord}, oTime)
-                                            sLastTw = sTrefWoord
-                                            sLastTwToel = ""
-                                    else:
-                                        if sLastTw != sTrefWoord or sLastTwToel != sTwToel:
-                                            iPkTrefwoord = Trefwoord.get_item({'woord': sTrefWoord,
-                                                                           'toelichting': sTwToel}, oTime)
-                                            sLastTw = sTrefWoord
-                                            sLastTwToel = sTwToel
-                                oTime['db'] += get_now_time() - iStarttime
+                    # IF this is the first line, then only check the version
+                    if iValid == None:
+                        # Check if the line starts correctly
+                        if sVersie != 'Lemmanummer' and sVersie != "lemma.name":
+                            # The first line does not start correctly -- return false
+                            oErr.DoError("csv_to_fixture: cannot process version [{}]".format(sVersie))
+                            return oBack
+                    elif iValid == 0:
+                        # Assuming this 'part' is entering an ENTRY
 
-                            else:
-                                # Get a lemma number from this
-                                iStarttime = get_now_time()
-                                # NOTE: assume 2 = toelichting 
-                                iPkLemma = oFix.get_pk(oLemma, "dictionary.lemma", True,
-                                                       gloss=oLine['lemma_name'])
-
-                                # Get a description number
-                                iPkDescr = oFix.get_pk(oDescr, "dictionary.description", True,
-                                                       bronnenlijst=oLine['lemma_bronnenlijst'], 
-                                                       toelichting=oLine['lemma_toelichting'], 
-                                                       boek=oLine['lemma_boek'])
-
-                                # Add the Lemma-Description connection
-                                iPkLemmaDescr = oFix.get_pk(oLemmaDescr, "dictionary.lemmadescr", True,
-                                                            lemma=iPkLemma,
-                                                            description=iPkDescr)
-
-
-                                # get a dialect number
-                                if oLine['dialect_kloeke'] != None:
-                                    iPkDialect = oFix.get_pk(oDialect, "dictionary.dialect", True,
-                                                             stad=oLine['dialect_stad'], 
-                                                             nieuw=oLine['dialect_nieuw'],
-                                                             code=oLine['dialect_kloeke'])
+                        # Make sure we got TREFWOORD correctly
+                        sTrefWoord = oLine['trefwoord_name']
+
+                        if bDoMijnen and 'mijn_list' in oLine:
+                            lMijnen = oLine['mijn_list']
+
+
+                        if oBulk != None:
+                            # Resolve everything against the in-memory key maps
+                            iStarttime = get_now_time()
+                            iPkLemma = oBulk.get_lemma(oLine['lemma_name'])
+                            iPkDescr = oBulk.get_descr(oLine['lemma_bronnenlijst'], 
+                                                       oLine['lemma_toelichting'], 
+                                                       oLine['lemma_boek'])
+                            iPkLemmaDescr = oBulk.get_lemmadescr(iPkLemma, iPkDescr)
+                            iPkDialect = oBulk.get_dialect(oLine['dialect_stad'], oLine['dialect_nieuw'])
+                            iPkTrefwoord = oBulk.get_trefwoord(sTrefWoord, oLine['trefwoord_toelichting'])
+                            oTime['db'] += get_now_time() - iStarttime
+
+                        elif bUseDbase:
+                            # Try to do all of this within one actual transation
+                            iStarttime = get_now_time()
+                            with transaction.atomic():
+                                # Find out which lemma this is
+                                sLemma = oLine['lemma_name']
+                                if sLemma != sLastLemma:
+                                    lemma_this = Lemma.get_instance({'gloss': sLemma}, oTime)
+                                    sLastLemma = sLemma
+
+                                # Find out which lemma-description this is
+                                descr_this = Description.get_instance({'bronnenlijst': oLine['lemma_bronnenlijst'],
+                                                                 'toelichting': oLine['lemma_toelichting'], 
+                                                                 'boek': oLine['lemma_boek']}, descr_this, oTime)
+
+                                # We do need the PKs of the lemma and the description
+                                iPkLemma = lemma_this.pk
+                                iPkDescr = descr_this.pk
+
+                                # Add the [iPkDescr] to the LemmaDescr--but only if it is not already there
+                                iPkLemmaDescr = LemmaDescr.get_item({'lemma': lemma_this,
+                                                                     'description': descr_this}, oTime)
+
+                                # Find out which dialect this is
+                                if oLine['dialect_kloeke'] != None and oLine['dialect_kloeke'] != "":
+                                    iPkDialect = Dialect.get_item({'stad': oLine['dialect_stad'], 
+                                                                    'nieuw': oLine['dialect_nieuw'],
+                                                                    'code': oLine['dialect_kloeke']}, oTime)
                                     # Note: removed 'dialect_toelichting' in accordance with issue #22 of WLD
                                 else:
-                                    iPkDialect = oFix.get_pk(oDialect, "dictionary.dialect", True,
-                                                             stad=oLine['dialect_stad'], 
-                                                             nieuw=oLine['dialect_nieuw'])
+                                    iPkDialect = Dialect.get_item({'stad': oLine['dialect_stad'], 
+                                                                    'nieuw': oLine['dialect_nieuw']}, oTime)
 
-                                # get a trefwoord number
+                                # Find out which trefwoord this is
                                 sTwToel = oLine['trefwoord_toelichting']
                                 if sTwToel == None or sTwToel == "":
-                                    iPkTrefwoord = oFix.get_pk(oTrefwoord, "dictionary.trefwoord", True,
-                                                               woord=sTrefWoord)
+                                    if sLastTwToel != "" or sLastTw != sTrefWoord:
+                                        iPkTrefwoord = Trefwoord.get_item({'woord': sTrefWoord}, oTime)
+                                        sLastTw = sTrefWoord
+                                        sLastTwToel = ""
                                 else:
-                                    iPkTrefwoord = oFix.get_pk(oTrefwoord, "dictionary.trefwoord", True,
-                                                               woord=sTrefWoord,
-                                                               toelichting=sTwToel)
-                                # Keep track of the time
-                                oTime['db'] += get_now_time() - iStarttime
-                            # Check validity
-                            if iPkDescr < 0 or iPkLemma < 0 or iPkLemmaDescr < 0 or iPkDialect < 0 or iPkTrefwoord < 0:
-                                # Something has gone wrong: we cannot continue
-                                oStatus.set_status("error")
-                                errHandle.DoError("csv_to_fixture has a negative index", True)
-                                return oBack
-
-                            # Process the ENTRY
-                            sDialectWoord = oLine['dialectopgave_name']
-                            # Make sure that I use my OWN continuous [pk] for Entry
-                            iPkEntry += 1
-                            # Do *NOT* use the Entry PK that is returned 
+                                    if sLastTw != sTrefWoord or sLastTwToel != sTwToel:
+                                        iPkTrefwoord = Trefwoord.get_item({'woord': sTrefWoord,
+                                                                       'toelichting': sTwToel}, oTime)
+                                        sLastTw = sTrefWoord
+                                        sLastTwToel = sTwToel
+                            oTime['db'] += get_now_time() - iStarttime
+
+                        else:
+                            # Get a lemma number from this
                             iStarttime = get_now_time()
+                            # NOTE: assume 2 = toelichting 
+                            iPkLemma = oFix.get_pk(oLemma, "dictionary.lemma", True,
+                                                   gloss=oLine['lemma_name'])
+
+                            # Get a description number
+                            iPkDescr = oFix.get_pk(oDescr, "dictionary.description", True,
+                                                   bronnenlijst=oLine['lemma_bronnenlijst'], 
+                                                   toelichting=oLine['lemma_toelichting'], 
+                                                   boek=oLine['lemma_boek'])
+
+                            # Add the Lemma-Description connection
+                            iPkLemmaDescr = oFix.get_pk(oLemmaDescr, "dictionary.lemmadescr", True,
+                                                        lemma=iPkLemma,
+                                                        description=iPkDescr)
+
+
+                            # get a dialect number
+                            if oLine['dialect_kloeke'] != None:
+                                iPkDialect = oFix.get_pk(oDialect, "dictionary.dialect", True,
+                                                         stad=oLine['dialect_stad'], 
+                                                         nieuw=oLine['dialect_nieuw'],
+                                                         code=oLine['dialect_kloeke'])
+                                # Note: removed 'dialect_toelichting' in accordance with issue #22 of WLD
+                            else:
+                                iPkDialect = oFix.get_pk(oDialect, "dictionary.dialect", True,
+                                                         stad=oLine['dialect_stad'], 
+                                                         nieuw=oLine['dialect_nieuw'])
+
+                            # get a trefwoord number
+                            sTwToel = oLine['trefwoord_toelichting']
+                            if sTwToel == None or sTwToel == "":
+                                iPkTrefwoord = oFix.get_pk(oTrefwoord, "dictionary.trefwoord", True,
+                                                           woord=sTrefWoord)
+                            else:
+                                iPkTrefwoord = oFix.get_pk(oTrefwoord, "dictionary.trefwoord", True,
+                                                           woord=sTrefWoord,
+                                                           toelichting=sTwToel)
+                            # Keep track of the time
+                            oTime['db'] += get_now_time() - iStarttime
+                        # Check validity
+                        if iPkDescr < 0 or iPkLemma < 0 or iPkLemmaDescr < 0 or iPkDialect < 0 or iPkTrefwoord < 0:
+                            # Something has gone wrong: we cannot continue
+                            oStatus.set_status("error")
+                            errHandle.DoError("csv_to_fixture has a negative index", True)
+                            return oBack
+
+                        # Process the ENTRY
+                        sDialectWoord = oLine['dialectopgave_name']
+                        # Make sure that I use my OWN continuous [pk] for Entry
+                        iPkEntry += 1
+                        # Do *NOT* use the Entry PK that is returned 
+                        iStarttime = get_now_time()
+                        if oBulk != None:
+                            oBulk.add_entry(iPkEntry, 
+                                            woord=sDialectWoord,
+                                            toelichting=oLine['dialectopgave_toelichting'],
+                                            kloeketoelichting=oLine['dialectopgave_kloeketoelichting'],
+                                            lemma=iPkLemma,
+                                            descr=iPkDescr,
+                                            dialect=iPkDialect,
+                                            trefwoord=iPkTrefwoord,
+                                            aflevering=iPkAflevering)
+                        else:
                             iDummy = oFix.get_pk(oEntry, "dictionary.entry", False,
                                                    pk=iPkEntry,
                                                    woord=sDialectWoord,
@@ -1942,55 +3354,72 @@ def csv_to_fixture(csv_file, iDeel, iSectie, iAflevering, iStatus, bUseDbase=Fal
                                                    dialect=iPkDialect,
                                                    trefwoord=iPkTrefwoord,
                                                    aflevering=iPkAflevering)
-                            oTime['entry'] += get_now_time() - iStarttime
-
-                            if bDoMijnen:
-                                if bUseDbase and bUsdDbaseMijnen:
-                                    # Walk all the mijnen for this entry
-                                    for sMijn in lMijnen:
-                                        # Get the PK for this mijn
-                                        iPkMijn = Mijn.get_item({'naam': sMijn}, oTime)
-                                        # Process the PK for EntryMijn
-                                        iPkEntryMijn = EntryMijn.get_item({'entry': iPkEntry,
-                                                                           'mijn': iPkMijn}, True)
+                        oTime['entry'] += get_now_time() - iStarttime
+
+                        if bDoMijnen:
+                            if oBulk != None:
+                                # Walk all the mijnen for this entry
+                                for sMijn in lMijnen:
+                                    oBulk.add_entrymijn(iPkEntry, oBulk.get_mijn(sMijn))
+
+                            elif bUseDbase and bUsdDbaseMijnen:
+                                # Walk all the mijnen for this entry
+                                for sMijn in lMijnen:
+                                    # Get the PK for this mijn
+                                    iPkMijn = Mijn.get_item({'naam': sMijn}, oTime)
+                                    # Process the PK for EntryMijn
+                                    iPkEntryMijn = EntryMijn.get_item({'entry': iPkEntry,
+                                                                       'mijn': iPkMijn}, True)
 
-                                else:
-                                    # Walk all the mijnen for this entry
-                                    for sMijn in lMijnen:
-                                        # Get the PK for this mijn
-                                        iPkMijn = oFix.get_pk(oMijn, "dictionary.mijn", True,
-                                                              naam=sMijn)
-                                        # Process the PK for EntryMijn
-                                        iPkEntryMijn = oFix.get_pk(oEntryMijn, "dictionary.entrymijn", False,
-                                                                   pk=iPkEntryMijn,
-                                                                   entry=iPkEntry,
-                                                                   mijn=iPkMijn)
-                            iRead += 1
-                        else:
-                            # This line is being skipped
-                            oSkip.append(strLine)
-                            iSkipped += 1
-                            sIdx = 'line-' + str(iValid)
-                            if not sIdx in oBack:
-                                oBack[sIdx] = 0
-                            oBack[sIdx] +=1
-                    # Keep track of progress
-                    oStatus.skipped = iSkipped
-                    oStatus.read = iRead
-                    oStatus.status = "{} (read={:.1f}, db={:.1f}, entry={:.1f}, search (L={:.1f}, T={:.1f}, Ds={:.1f}, LD={:.1f}, Dt={:.1f}, M={:.1f}), save={:.1f})".format(
-                        sWorking, oTime['read'], oTime['db'], oTime['entry'],
-                        oTime['search_L'], oTime['search_T'], oTime['search_Ds'], oTime['search_LD'], oTime['search_Dt'], oTime['search_M'], oTime['save'])
-                    oStatus.save()
+                            else:
+                                # Walk all the mijnen for this entry
+                                for sMijn in lMijnen:
+                                    # Get the PK for this mijn
+                                    iPkMijn = oFix.get_pk(oMijn, "dictionary.mijn", True,
+                                                          naam=sMijn)
+                                    # Process the PK for EntryMijn
+                                    iPkEntryMijn = oFix.get_pk(oEntryMijn, "dictionary.entrymijn", False,
+                                                               pk=iPkEntryMijn,
+                                                               entry=iPkEntry,
+                                                               mijn=iPkMijn)
+                        iRead += 1
+                        # Possibly write a chunk of objects to the database
+                        if oBulk != None:
+                            oBulk.line_done()
+                    else:
+                        # This line is being skipped
+                        oSkip.append(strLine)
+                        iSkipped += 1
+                        sIdx = 'line-' + str(iValid)
+                        if not sIdx in oBack:
+                            oBack[sIdx] = 0
+                        oBack[sIdx] +=1
+                    # Keep track of progress (the reporter decides when to write it to the database)
+                    oProgress.update(iRead, iSkipped)
+                    iStarttime = get_now_time()
 
+                # Make sure the final numbers are there
+                oProgress.save(True)
 
                 # CLose the input file
-                f.close()
+                if f != None:
+                    f.close()
+
+                # Write what is left of the objects to the database
+                if oBulk != None:
+                    if bDelta: oProgress.phase("{}: comparing with the database".format(sWorking))
+                    oBulk.flush()
+                    if bDelta:
+                        sMsg = "{}: kept={kept}, updated={updated}, inserted={inserted}, deleted={deleted}".format(sWorking, **oBulk.counts)
+                        oErr.Status(sMsg)
+                        oBack[sWorking] = oBulk.counts
 
                 # Close the skip file
                 oSkip.close()
 
                 # Finish the JSON array that contains the fixtures
-                oFix.close()
+                if oFix != None:
+                    oFix.close()
 
                 # Note the results for this info object
                 oInfo.read = iRead
@@ -2003,7 +3432,7 @@ def csv_to_fixture(csv_file, iDeel, iSectie, iAflevering, iStatus, bUseDbase=Fal
         oBack['skipped'] = iSkipped
         oBack['read'] = iRead
         # oCsvImport['status'] = 'done'
-        oStatus.set_status("done")
+        oProgress.finish("done")
         return oBack
     except:
         # oCsvImport['status'] = 'error'
@@ -2029,13 +3458,14 @@ def do_repair_lemma(oRepair):
     iStart = 0
     iLen = qs.count()
     iRepair = 0
+    oProgress = Progress(oRepair)
+    oProgress.phase("Working on lemma's", iLen)
     for oLem in qs:
         # Note progress
         iStart += 1
         bChange = False
         # Show where we are
-        oRepair.status = "Working on {} (of {})".format(iStart,iLen)
-        oRepair.save()
+        oProgress.update(iStart, sStatus="Working on {} (of {})".format(iStart,iLen))
         # Remove spaces from lemma
         sGloss = oLem.gloss.strip()
         if sGloss != oLem.gloss:
@@ -2057,72 +3487,89 @@ def do_repair_lemma(oRepair):
         if bChange:
             # save the changes
             oLem.save()
-            oRepair.status = "Saved changes in {} (of {})".format(iStart,iLen)
-            oRepair.save()
+            oProgress.update(sStatus="Saved changes in {} (of {})".format(iStart,iLen))
 
     # Return positively
+    oProgress.finish("Lemma repair has finished ({} changes)".format(iRepair))
     return True
 
 def do_repair_clean(oRepair):
     """Clean the database from Entry, Lemma, Trefwoord contents"""
 
     oErr = ErrHandle()
+    oProgress = Progress(oRepair)
     try:
         # Show we are starting
-        oRepair.set_status("Starting up Cleaning of Lemma/Trefwoord/Entry")
+        oProgress.phase("Starting up Cleaning of Lemma/Trefwoord/Entry")
 
         # (1) clean LemmaDescr
-        oRepair.set_status("Step 1: LemmaDescr...")
+        oProgress.phase("Step 1: LemmaDescr...")
         qs = LemmaDescr.objects.all()
         with transaction.atomic():
             qs.delete()
 
         # (2) clean EntryMijn
-        oRepair.set_status("Step 2: EntryMijn...")
+        oProgress.phase("Step 2: EntryMijn...")
         qs = EntryMijn.objects.all()
         with transaction.atomic():
             qs.delete()
 
         # (3) clean Entry
-        oRepair.set_status("Step 3: Entry...")
+        oProgress.phase("Step 3: Entry...")
         qs = Entry.objects.all()
         with transaction.atomic():
             qs.delete()
 
         # (4) clean Lemma
-        oRepair.set_status("Step 4: Lemma...")
+        oProgress.phase("Step 4: Lemma...")
         qs = Lemma.objects.all()
         with transaction.atomic():
             qs.delete()
 
         # (5) clean LemmaDescr
-        oRepair.set_status("Step 5: Trefwoord...")
+        oProgress.phase("Step 5: Trefwoord...")
         qs = Trefwoord.objects.all()
         with transaction.atomic():
             qs.delete()
 
         # (6) clean Dialect
-        oRepair.set_status("Step 6: Dialect...")
+        oProgress.phase("Step 6: Dialect...")
         qs = Dialect.objects.all()
         with transaction.atomic():
             qs.delete()
 
-        oRepair.set_status("Cleaning has finished")
+        oProgress.finish("Cleaning has finished")
         # Now we are ready
         return True
     except:
         msg = oErr.get_error_message()
-        oRepair.set_status("Error: {}".format(msg))
+        oProgress.finish("Error: {}".format(msg))
         return False
-    
+
+def do_repair_entryview(oRepair):
+    """Re-create the entry listing [EntryView] from scratch"""
+
+    oProgress = Progress(oRepair)
+    oProgress.phase("Starting up rebuilding the entry listing")
+    iCount = EntryView.refresh(None, oProgress)
+    if iCount < 0:
+        oProgress.finish("Error: the entry listing could not be rebuilt")
+        return False
+    oProgress.phase("Sorting the descriptions of the lemma's")
+    if Lemma.refresh_descr() < 0:
+        oProgress.finish("Error: the descriptions of the lemma's could not be sorted")
+        return False
+    oProgress.finish("The entry listing has been rebuilt ({} entries)".format(iCount))
+    return True
+
 def do_repair_entrydescr(oRepair):
     """Repair descriptions and the entries that point to them"""
 
     oErr = ErrHandle()
+    oProgress = Progress(oRepair)
     try:
         # Show we are starting
-        oRepair.status = "Starting up Repair-EntryDescr"
-        oRepair.save()
+        oProgress.phase("Starting up Repair-EntryDescr")
 
         # Get all the entries ordered by description text
         # Note: do not use select_related(). because of the iterator
@@ -2135,6 +3582,7 @@ def do_repair_entrydescr(oRepair):
         descr_del = []
 
         if qs.exists():
+            oProgress.phase("Working on entries", qs.count())
             # Prepare a 'previous' object
             oPrev = None
             entry_prev = None
@@ -2146,9 +3594,7 @@ def do_repair_entrydescr(oRepair):
                 #if entry.id == 1551778:
                 #    iStop = True
                 # show where we are
-                if count % 1000 == 0:
-                    oRepair.status = "Working on entry {}".format(count)
-                    oRepair.save()
+                oProgress.update(count, sStatus="Working on entry {}".format(count))
                 # Get the new description values
                 descr = entry.descr
                 oNew = {'toelichting': descr.toelichting,
@@ -2180,25 +3626,21 @@ def do_repair_entrydescr(oRepair):
                     descr_prev = descr
 
             # Now delete all necessary description objects
-            oRepair.status = "Deleting descr instances: {}...".format(dCount)
-            oRepair.save()
+            oProgress.phase("Deleting descr instances: {}...".format(dCount), dCount, bReset=True)
             # divide over chunks of 100
             n = 100
             for i in range(0, dCount, n):
-                oRepair.status = "Deleting descr instances: {} chunk={}...".format(dCount, i)
-                oRepair.save()
+                oProgress.update(i, sStatus="Deleting descr instances: {} chunk={}...".format(dCount, i))
                 chnk = descr_del[i:i+n]
                 with transaction.atomic():
                     Description.objects.filter(id__in=chnk).delete()
             # Reset the list
             descr_del = []
 
-        oRepair.status = "Everything has finished"
-        oRepair.save()
+        oProgress.finish("Everything has finished")
         # Now we are ready
         return True
     except:
         msg = oErr.get_error_message()
-        oRepair.status = "Error: {}".format(msg)
-        oRepair.save()
+        oProgress.finish("Error: {}".format(msg))
         return False
\ No newline at end of file
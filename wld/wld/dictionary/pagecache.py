@@ -0,0 +1,90 @@
+"""Cache of rendered list pages, keyed by the version of the dictionary data.
+
+The dictionary content only changes through imports, repairs and changes of
+[Aflevering.toonbaar]. Each of these calls [bump_data_version], which makes
+every page and every value cached before it unreachable: the data version
+is part of all keys. Old entries are not removed, but simply expire.
+
+Only anonymous requests for HTML pages are cached: pages of users that are
+logged in contain their name and a CSRF token.
+"""
+
+import hashlib
+import json
+import time
+
+from django.core.cache import cache
+from django.http import HttpResponse
+
+# Cache key of the data version
+VERSION_KEY = "dictionary-data-version"
+# Number of seconds a page or value stays in the cache
+PAGE_TIMEOUT = 24 * 3600
+# GET parameters that do not change a page
+SKIP_PARAMS = ['csrfmiddlewaretoken']
+
+
+def get_data_version():
+    """Get the current data version, starting a new one if the cache has none"""
+
+    iVersion = cache.get(VERSION_KEY)
+    if iVersion == None:
+        # Start from the time, so that a version is never re-used after the cache is cleared
+        cache.add(VERSION_KEY, int(time.time()), None)
+        iVersion = cache.get(VERSION_KEY)
+    return iVersion
+
+def bump_data_version():
+    """Note that the dictionary data has changed"""
+
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        # There was no version yet
+        cache.set(VERSION_KEY, int(time.time()), None)
+
+def get_page_key(sView, request):
+    """Get the cache key of the page [request] asks for, or None if it may not be cached"""
+
+    if request.method != "GET" or request.user.is_authenticated:
+        return None
+    get = request.GET
+    if (get.get('submit_type', '') or "").strip() != "":
+        # Exports are not cached
+        return None
+    lParam = []
+    for sName in sorted(get.keys()):
+        if sName not in SKIP_PARAMS:
+            lValue = [x.strip() for x in get.getlist(sName) if x.strip() != ""]
+            if len(lValue) > 0:
+                lParam.append([sName, lValue])
+    sParams = json.dumps([sView, lParam])
+    return "page-{}-{}".format(get_data_version(), hashlib.md5(sParams.encode("utf-8")).hexdigest())
+
+def get_page(sKey):
+    """Get the cached response for [sKey], or None"""
+
+    oPage = None if sKey == None else cache.get(sKey)
+    if oPage == None:
+        return None
+    return HttpResponse(oPage['content'], content_type=oPage['content_type'])
+
+def set_page(sKey, response):
+    """Store [response] under [sKey], provided it is a complete page"""
+
+    if sKey != None and response.status_code == 200:
+        if hasattr(response, 'render'):
+            response.render()
+        oPage = {'content': response.content, 'content_type': response['Content-Type']}
+        cache.set(sKey, oPage, PAGE_TIMEOUT)
+    return response
+
+def get_versioned(sName, fun):
+    """Get the value [sName] for the current data version, calculating it with [fun] if needed"""
+
+    sKey = "value-{}-{}".format(get_data_version(), sName)
+    oValue = cache.get(sKey)
+    if oValue == None:
+        oValue = fun()
+        cache.set(sKey, oValue, PAGE_TIMEOUT)
+    return oValue
@@ -0,0 +1,85 @@
+"""Pagination of the dictionary list views.
+
+Django's own paginator counts the whole queryset and gets page N with an
+OFFSET, which means scanning all items before that page. The
+[KeysetPaginator] takes the count from a [ListCache] item instead, and
+remembers where each page it has served ends, by item offset so that
+different page sizes do not mix up their pages. A page whose start is
+known is fetched by seeking from that position (keyset pagination):
+
+    WHERE sortkey > 'kat' OR (sortkey = 'kat' AND id > 123) LIMIT 10
+
+The queryset must be annotated with a 'sortkey' and be ordered by
+('sortkey', 'id'). Pages that are jumped to directly fall back to an
+OFFSET once, after which their successor is known too.
+
+The same positions are handed out to clients of the JSON search API as
+cursor tokens (see [encode_cursor] and [decode_cursor]).
+
+"""
+
+import base64
+import binascii
+import json
+
+from django.core.paginator import Paginator
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+
+class KeysetPaginator(Paginator):
+    """Paginator with a cached count that seeks to the pages it knows the start of"""
+
+    def __init__(self, object_list, per_page, oCache, **kwargs):
+        super(KeysetPaginator, self).__init__(object_list, per_page, **kwargs)
+        # The [ListCache] item of this list (may be None)
+        self.cache = oCache
+
+    @cached_property
+    def count(self):
+        if self.cache == None:
+            return super(KeysetPaginator, self).count
+        return self.cache.count
+
+    def page(self, number):
+        """Return the Page object for the 1-based page [number]"""
+
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        lCursor = None
+        if number > 1 and self.cache != None:
+            lCursor = self.cache.get_cursor(bottom)
+        if lCursor == None:
+            lObject = list(self.object_list[bottom:bottom + self.per_page])
+        else:
+            lObject = list(seek(self.object_list, lCursor)[:self.per_page])
+        # Remember where the next page starts
+        if self.cache != None and len(lObject) > 0 and number < self.num_pages:
+            oLast = lObject[-1]
+            self.cache.set_cursor(bottom + len(lObject), [oLast.sortkey, oLast.id])
+        return self._get_page(lObject, number, self)
+
+
+def seek(qs, lCursor):
+    """Get the part of [qs] that follows the item with the [sortkey, id] of [lCursor]"""
+
+    sKey, iId = lCursor
+    return qs.filter(Q(sortkey__gt=sKey) | Q(sortkey=sKey, id__gt=iId))
+
+def encode_cursor(lCursor):
+    """Turn the [sortkey, id] of [lCursor] into a token that can be used in a URL"""
+
+    return base64.urlsafe_b64encode(json.dumps(lCursor).encode("utf-8")).decode("ascii")
+
+def decode_cursor(sToken):
+    """Get the [sortkey, id] of the token [sToken], or None if it is empty or not valid"""
+
+    if sToken == None or sToken == "":
+        return None
+    try:
+        lCursor = json.loads(base64.urlsafe_b64decode(sToken.encode("ascii")).decode("utf-8"))
+    except (ValueError, binascii.Error):
+        return None
+    if not isinstance(lCursor, list) or len(lCursor) != 2 or not isinstance(lCursor[1], int):
+        return None
+    return lCursor
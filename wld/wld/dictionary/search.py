@@ -0,0 +1,273 @@
+"""Searching with the wildcard patterns of the dictionary list views.
+
+A user pattern may contain the wildcards '*', '?', '[..]' and '#'.
+[search_q] first classifies a pattern with [search_plan]:
+
+  exact      kat     LOWER(col) = 'kat'                         (ASCII)
+  prefix     kat*    LOWER(col) >= 'kat' AND LOWER(col) < 'kau' (ASCII)
+  suffix     *kat    col LIKE '%kat'
+  contains   *kat*   col LIKE '%kat%'
+  regex      (other) col REGEXP [adapt_search]
+
+The first two use the expression indexes on lower(col); since the lower()
+of sqlite only folds ASCII, other literals use a LIKE instead. On sqlite a
+regular expression is evaluated in Python for every (joined) row, so the
+text fields that are searched most have an FTS5 trigram side table as
+well. The last three classes use that side table to get the candidate ids,
+and the pattern then only needs to be verified for those candidates.
+
+The side tables are kept up to date by triggers on the source tables, so
+that bulk imports and raw deletes are covered too. They are (re)installed
+by [search_install] after each migration, together with the lower(col)
+indexes.
+
+"""
+
+import re
+import fnmatch
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connection, OperationalError
+from django.db.models import Q, CharField, TextField
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Lower
+
+from wld.utils import ErrHandle
+
+# Anything that is not allowed in a search pattern
+rGarbage = re.compile(r'[^a-zA-Z0-9 -\#\[\]\?\*]')
+# One wildcard within a search pattern: a set '[..]', '*', '?' or '#'
+rWildcard = re.compile(r'\[!?\]?[^\]]*\]?|[\*\?#]')
+# Regular expression characters that make a '#' pattern too complex to take apart
+rRegexMeta = re.compile(r'[\\.+(){}|^$]')
+# A literal that may be preceded and/or followed by a '*'
+rPlain = re.compile(r'^(\*?)([^\*\?\[\]#]+)(\*?)$')
+
+# Allow lookups like 'gloss__lower' that can use the lower(col) indexes
+CharField.register_lookup(Lower)
+TextField.register_lookup(Lower)
+
+# The columns that have an index on their lowercased value, per table
+SEARCH_LOWER = {
+    'dictionary_entry': ['woord'],
+    'dictionary_lemma': ['gloss'],
+    'dictionary_trefwoord': ['woord'],
+    'dictionary_dialect': ['stad', 'nieuw'],
+    'dictionary_mijn': ['naam'],
+    }
+
+# The columns that have a trigram index, per table
+SEARCH_INDEX = {
+    'dictionary_entry': ['woord', 'toelichting'],
+    'dictionary_lemma': ['gloss'],
+    'dictionary_trefwoord': ['woord', 'toelichting'],
+    'dictionary_dialect': ['stad', 'nieuw'],
+    'dictionary_mijn': ['naam', 'locatie', 'toelichting'],
+    }
+# A trigram index can only look for literals of at least this length
+TRIGRAM_LEN = 3
+
+# Cache of the side tables that are actually available
+dicHasIndex = {}
+
+
+def adapt_search(val):
+    # First trim
+    val = strip_garbage(val).strip()
+    # Adapt for the use of '#'
+    if '#' in val:
+        val = r'(^|(.*\b))' + val.replace('#', r'((\b.*)|$)') # + r'((\b.*)|$)'
+    else:
+        val = '^' + fnmatch.translate(val) + '$'
+    # Make sure to get the hyphen literally
+    val = val.replace("-", "\-")
+    return val
+
+def strip_garbage(val):
+    """Remove any garbage characters from the value"""
+
+    val = rGarbage.sub('', val)
+    return val
+
+def get_index_name(sTable):
+    """Get the name of the trigram side table of [sTable]"""
+    return "{}_search".format(sTable)
+
+def has_search_index(sTable):
+    """Check whether the trigram side table of [sTable] exists"""
+
+    if sTable not in dicHasIndex:
+        bFound = False
+        if connection.vendor == "sqlite":
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=%s",
+                               [get_index_name(sTable)])
+                bFound = (cursor.fetchone() != None)
+        dicHasIndex[sTable] = bFound
+    return dicHasIndex[sTable]
+
+def search_literals(val):
+    """Get the literal parts of pattern [val] that any match must contain
+
+    Only parts that are long enough for the trigram index are returned.
+    """
+
+    val = strip_garbage(val).strip()
+    bBoundary = ('#' in val)
+    if bBoundary and rRegexMeta.search(val):
+        return []
+    lPart = []
+    iStart = 0
+    for oMatch in rWildcard.finditer(val):
+        sPart = val[iStart:oMatch.start()]
+        # Within a '#' pattern the '*' and '?' are regex quantifiers of the preceding character
+        if bBoundary and oMatch.group(0) in "*?":
+            sPart = sPart[:-1]
+        lPart.append(sPart)
+        iStart = oMatch.end()
+    lPart.append(val[iStart:])
+    return [x for x in lPart if len(x) >= TRIGRAM_LEN]
+
+def search_plan(val):
+    """Classify the user pattern [val]
+
+    Returns a tuple (sClass, sLiteral), where [sClass] is one of 'exact',
+    'prefix', 'suffix', 'contains' or 'regex'. The literal is only
+    meaningful for the first four classes. It is taken as it is: only a
+    regular expression needs to have its garbage stripped.
+    """
+
+    val = val.strip()
+    oMatch = rPlain.match(val)
+    if oMatch == None:
+        return ("regex", val)
+    sLiteral = oMatch.group(2)
+    bStart = (oMatch.group(1) == "")
+    bEnd = (oMatch.group(3) == "")
+    if bStart and bEnd:
+        sClass = "exact"
+    elif bStart:
+        sClass = "prefix"
+    elif bEnd:
+        sClass = "suffix"
+    else:
+        sClass = "contains"
+    return (sClass, sLiteral)
+
+def search_q(model, path, val):
+    """Get a Q-expression that matches [path] of [model] against the user pattern [val]
+
+    The [path] may pass through relations (e.g. 'entry__dialect__stad').
+    """
+
+    sClass, sLiteral = search_plan(val)
+    sLower = sLiteral.lower()
+    # The lower() of the database only folds ASCII
+    bAscii = all(ord(x) < 128 for x in sLiteral)
+    lLiteral = [sLiteral] if len(sLiteral) >= TRIGRAM_LEN else []
+    if sClass == "exact":
+        if bAscii:
+            return Q(**{"{}__lower".format(path): sLower})
+        query = Q(**{"{}__iexact".format(path): sLiteral})
+    elif sClass == "prefix":
+        if bAscii:
+            # Everything starting with [sLower] sorts before the prefix with its last character raised
+            sUpper = sLower[:-1] + chr(ord(sLower[-1]) + 1)
+            return Q(**{"{}__lower__gte".format(path): sLower, "{}__lower__lt".format(path): sUpper})
+        query = Q(**{"{}__istartswith".format(path): sLiteral})
+    elif sClass == "suffix":
+        query = Q(**{"{}__iendswith".format(path): sLiteral})
+    elif sClass == "contains":
+        query = Q(**{"{}__icontains".format(path): sLiteral})
+    else:
+        query = Q(**{"{}__iregex".format(path): adapt_search(val)})
+        lLiteral = search_literals(val)
+    return search_candidates(model, path, lLiteral, query)
+
+def search_candidates(model, path, lLiteral, query):
+    """Restrict [query] to the rows whose [path] contains all of [lLiteral]
+
+    This only happens if the column [path] ends in has a trigram index.
+    """
+
+    if len(lLiteral) > 0:
+        # Find the model and the column this path ends in
+        lPath = path.split("__")
+        target = model
+        try:
+            for sName in lPath[:-1]:
+                target = target._meta.get_field(sName).related_model
+        except FieldDoesNotExist:
+            # Leave it to the query itself
+            return query
+        sTable = target._meta.db_table
+        sColumn = lPath[-1]
+        if sColumn in SEARCH_INDEX.get(sTable, []) and has_search_index(sTable):
+            sIndex = get_index_name(sTable)
+            sMatch = " AND ".join(['{} : "{}"'.format(sColumn, x.replace('"', '""')) for x in lLiteral])
+            sSql = "SELECT rowid FROM {} WHERE {} MATCH %s".format(sIndex, sIndex)
+            sPathId = "__".join(lPath[:-1] + ["id__in"])
+            query = Q(**{sPathId: RawSQL(sSql, (sMatch,))}) & query
+    return query
+
+def search_install(sender=None, using="default", **kwargs):
+    """Make sure the lower(col) indexes and the trigram side tables are in place
+
+    This is called after each migration: rebuilding a table on sqlite
+    (e.g. when adding a field) drops its expression indexes and triggers,
+    so these are checked and, where needed, re-created together with the
+    side table contents.
+    """
+
+    from django.db import connections
+
+    oErr = ErrHandle()
+    try:
+        conn = connections[using]
+        if conn.vendor != "sqlite":
+            return
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger')")
+            lExists = [x[0] for x in cursor.fetchall()]
+            # The indexes on the lowercased columns
+            for sTable, lColumn in SEARCH_LOWER.items():
+                if sTable in lExists:
+                    for sColumn in lColumn:
+                        cursor.execute("CREATE INDEX IF NOT EXISTS {0}_{1}_lower ON {0}(lower({1}))".format(sTable, sColumn))
+            # The trigram side tables
+            for sTable, lColumn in SEARCH_INDEX.items():
+                sIndex = get_index_name(sTable)
+                # Skip tables that do not exist (yet) and indexes that are complete
+                if sTable not in lExists:
+                    continue
+                if sIndex in lExists and all("{}_{}".format(sIndex, x) in lExists for x in ["ai", "ad", "au"]):
+                    continue
+                sCols = ", ".join(lColumn)
+                sNew = ", ".join(["new.{}".format(x) for x in lColumn])
+                sOld = ", ".join(["old.{}".format(x) for x in lColumn])
+                sInsert = "INSERT INTO {0}(rowid, {1}) VALUES (new.id, {2});".format(sIndex, sCols, sNew)
+                sDelete = "INSERT INTO {0}({0}, rowid, {1}) VALUES ('delete', old.id, {2});".format(sIndex, sCols, sOld)
+                lSql = [
+                    "DROP TABLE IF EXISTS {}".format(sIndex),
+                    "CREATE VIRTUAL TABLE {} USING fts5({}, content='{}', content_rowid='id', tokenize='trigram')".format(
+                        sIndex, sCols, sTable),
+                    "DROP TRIGGER IF EXISTS {}_ai".format(sIndex),
+                    "DROP TRIGGER IF EXISTS {}_ad".format(sIndex),
+                    "DROP TRIGGER IF EXISTS {}_au".format(sIndex),
+                    "CREATE TRIGGER {}_ai AFTER INSERT ON {} BEGIN {} END".format(sIndex, sTable, sInsert),
+                    "CREATE TRIGGER {}_ad AFTER DELETE ON {} BEGIN {} END".format(sIndex, sTable, sDelete),
+                    "CREATE TRIGGER {}_au AFTER UPDATE OF {} ON {} BEGIN {} {} END".format(
+                        sIndex, sCols, sTable, sDelete, sInsert),
+                    "INSERT INTO {0}({0}) VALUES ('rebuild')".format(sIndex)
+                    ]
+                for sSql in lSql:
+                    cursor.execute(sSql)
+                oErr.Status("search_install: created {}".format(sIndex))
+        dicHasIndex.clear()
+    except OperationalError:
+        # This sqlite version has no FTS5 or no trigram tokenizer: searching uses the regex only
+        msg = oErr.get_error_message()
+        oErr.Status("search_install: no trigram index available ({})".format(msg))
+    except:
+        msg = oErr.get_error_message()
+        oErr.DoError("search_install")
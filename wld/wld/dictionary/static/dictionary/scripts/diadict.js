@@ -294,7 +294,7 @@ function repair_start(sRepairType) {
   var oJson = { 'status': 'started' };
   oRepairTimer = setTimeout(function () { repair_progress(sRepairType, oJson); }, 3000);
 
-  // Make sure that at the end: we stop
+  // The repair is queued: [repair_progress] keeps track until it is done
   var oData = { 'type': sRepairType };
   sUrl = $("#repair_start_" + sRepairType).attr('repair-start');
   $.ajax({
@@ -302,7 +302,12 @@ function repair_start(sRepairType) {
     "dataType": "json",
     "data": oData,
     "cache": false,
-    "success": function () { repair_stop(); }
+    "success": function (json) {
+      if (json.status !== "queued") {
+        window.clearTimeout(oRepairTimer);
+        $("#repair_progress_" + sRepairType).html(json.status);
+      }
+    }
   });
 }
 
@@ -335,6 +340,11 @@ function repair_handle(sRepairType, json) {
     default:
       // Default action is to show the status
       $("#repair_progress_" + sRepairType).html(json.status);
+      // Stop when the worker has finished the job
+      if (json.busy === false) {
+        repair_stop(sRepairType);
+        return;
+      }
       oRepairTimer = setTimeout(function (json) { repair_progress(sRepairType); }, 1000);
       break;
   }
@@ -348,7 +358,7 @@ function repair_stop(sRepairType) {
   window.clearInterval(oRepairTimer);
 }
 
-function import_start(bUseDbase) {
+function import_start(bUseDbase, bBulk, bDelta) {
   var sUrl = "";
 
   // Clear previous errors
@@ -370,6 +380,7 @@ function import_start(bUseDbase) {
       $("#info_progress").html(sMsg);
       $("#info_button").addClass("hidden");
       $("#info_button2").addClass("hidden");
+      $("#info_button4").addClass("hidden");
       return;
     } else {
       $("#info_progress").html("Please wait...");
@@ -381,15 +392,23 @@ function import_start(bUseDbase) {
     var oData = {
       'deel': sDeel, 'sectie': sSectie,
       'aflnum': sAflnum, 'filename': sCsvFile,
-      'usedbase': bUseDbase
+      'usedbase': bUseDbase,
+      'bulk': (bBulk === true),
+      'delta': (bDelta === true)
     };
 
+    // The import is queued: [progress_request] keeps track until it is done
     $.ajax({
       "url": sUrl,
       "dataType": "json",
       "data": oData,
       "cache": false,
-      "success": function () { progress_stop(); }
+      "success": function (json) {
+        if (json.status !== "queued") {
+          window.clearTimeout(oProgressTimer);
+          $("#info_progress").html(json.status);
+        }
+      }
     });
   } catch (ex) {
     errMsg("import_start", ex);
@@ -10,8 +10,8 @@ from django.urls import reverse
 from django.template import RequestContext, loader
 from django.template.loader import render_to_string
 from django.db import connection
-from django.db.models import Q
-from django.db.models.functions import Lower
+from django.db.models import Q, F
+from django.db.models.functions import Lower, Coalesce
 from django.http import JsonResponse
 from datetime import datetime
 from xml.dom import minidom
@@ -37,7 +37,11 @@ from wld.dictionary.forms import *
 from wld.mapview.views import MapView
 #from wld.dictionary.adminviews import order_queryset_by_sort_order
 from wld.settings import APP_PREFIX, WSGI_FILE
-from wld.dictionary.conversion import rd_to_wgs, wgs_to_rd
+from wld.dictionary.conversion import rd_to_wgs, wgs_to_rd, rd_to_wgs_batch
+from wld.dictionary.search import adapt_search, strip_garbage, search_q
+from wld.dictionary.paging import KeysetPaginator
+from wld.dictionary.grouping import get_item_list
+from wld.dictionary.pagecache import get_page_key, get_page, set_page, get_versioned, bump_data_version
 
 # ============== Global variables =============================
 paginateSize = 10
@@ -47,7 +51,6 @@ paginateEntries = 100
 paginateValues = (100, 50, 20, 10, 5, 2, 1, )
 paginateMax = 100
 outputColumns = ['begrip', 'trefwoord', 'dialectopgave', 'Kloekecode', 'aflevering', 'bronnenlijst']
-rGarbage = re.compile(r'[^a-zA-Z0-9 -\#\[\]\?\*]')
 
 THIS_DICTIONARY = "e-WLD"
 
@@ -104,64 +107,6 @@ def order_queryset_by_sort_order(get, qs, sOrder = 'gloss'):
     # return the ordered list
     return ordered
 
-def get_item_list(lVar, lFun, qs):
-    """Turn the queryset [qs] into a list of Items that have first and last information"""
-
-    lItem = []
-    oErr = ErrHandle()
-    try:
-        # Initialize the variables whose changes are important
-        oVariable = {}
-        for i, key in enumerate(lVar):
-            oVariable[key] = "" # {'name': key, 'fun': lFun[i]}
-        iLast = len(qs)-1
-        # Iterate over the entries looking for first, last etc
-        for i, entry in enumerate(qs):
-            bIsLastEntry = (i==iLast)
-            oItem = {'entry': entry}
-            for k in lVar:
-                oItem[k] = {'first':False, 'last':False}
-            bIsDict = isinstance(entry, dict)
-            bVarIsLast = False
-            # Check for changes in all the variables
-            for j, k in enumerate(lVar):
-                fun = lFun[j]
-                if callable(fun):
-                    sValue = fun(entry)
-                else:
-                    for idx, val in enumerate(fun):
-                        if idx==0:
-                            if bIsDict:
-                                sValue = entry[val]
-                            else:
-                                sValue = getattr(entry, val)
-                        else:
-                            if bIsDict:
-                                sValue = sValue[val]
-                            else:
-                                sValue = getattr(sValue, val)
-                # Check for changes in the value of the variable 
-                # if sValue != oVariable[k]:
-                if sValue != oVariable[k] or bVarIsLast or (i>0 and lItem[i-1][k]['last']):
-                    # Check if the previous one's [last] must be changed
-                    if oVariable[k] != "": lItem[i-1][k]['last'] = True
-                    # Adapt the current one's [first] property
-                    oItem[k]['first']= True
-                    # Adapt the variable
-                    oVariable[k] = sValue      
-                    # Indicate that the next ones should be regarded as 'last'
-                    bVarIsLast = True      
-                # Check if this is the last
-                if bIsLastEntry: oItem[k]['last'] = True
-            # Add this object to the list of items
-            lItem.append(oItem)
-    except:
-        oErr.DoError("get_item_list error")
-        lItem = []
-
-    # Return the list we have made
-    return lItem
-
 def home(request):
     """Renders the home page."""
     assert isinstance(request, HttpRequest)
@@ -220,24 +165,6 @@ def do_repair(request):
         }
     )
 
-def adapt_search(val):
-    # First trim
-    val = strip_garbage(val).strip()    
-    # Adapt for the use of '#'
-    if '#' in val:
-        val = r'(^|(.*\b))' + val.replace('#', r'((\b.*)|$)') # + r'((\b.*)|$)'
-    else:
-        val = '^' + fnmatch.translate(val) + '$'
-    # Make sure to get the hyphen literally  
-    val = val.replace("-", "\-")
-    return val
-
-def strip_garbage(val):
-    """Remove any garbage characters from the value"""
-
-    val = rGarbage.sub('', val)
-    return val
-
 def export_csv(qs, sFileName):
     # Create the HttpResponse object with the appropriate CSV header.
     response = HttpResponse(content_type='text/csv')
@@ -351,7 +278,7 @@ def export_html(qs, sFileName):
     arOut.append("<tbody>")
     # Walk the contents
     for obj in qs:
-        sRow = "<tr><td>"+obj.lemma.gloss+"</td><td>"+obj.trefwoord.woord+"</td><td>"+obj.woord+"</td><td>"+obj.dialect.nieuw+"</td><td>"+obj.aflevering.naam+"</td><tr>"
+        sRow = "<tr><td>"+obj.lemma_gloss+"</td><td>"+obj.trefwoord_woord+"</td><td>"+obj.woord+"</td><td>"+obj.dialect_nieuw+"</td><td>"+obj.aflevering_naam+"</td><tr>"
         arOut.append(sRow)
     content = "\n".join(arOut)
     # Create the HttpResponse object with the appropriate header.
@@ -361,29 +288,26 @@ def export_html(qs, sFileName):
     return response
 
 def do_repair_start(request):
-    """Start up the repair action"""
+    """Start up the repair action: this only puts it in the job queue"""
     sRepairType = request.GET.get('repairtype', '')
 
     # Formulate a response
-    data = {'status': 'done'}
+    data = {'status': 'queued'}
 
-    # Remove any previous repair objects of this type
-    Repair.objects.filter(repairtype=sRepairType).delete()
+    # Remove any previous repair objects of this type (unless one is still busy)
+    qs = Repair.objects.filter(repairtype=sRepairType)
+    for oRepair in qs:
+        if Job.is_pending("repair", "repair", oRepair.id):
+            data['status'] = "error: repair {} is already busy".format(sRepairType)
+            return JsonResponse(data)
+    qs.delete()
     # Retrieve the Repair object with the correct type
     oRepair = Repair(repairtype=sRepairType)
+    oRepair.status = "queued"
     oRepair.save()
-    if sRepairType == "lemma":
-        bResult = do_repair_lemma(oRepair)
-        if not bResult:
-            data.status = "error"
-    elif sRepairType == "entrydescr":
-        bResult = do_repair_entrydescr(oRepair)
-        if not bResult:
-            data.status = "error"
-    elif sRepairType == "clean":
-        bResult = do_repair_clean(oRepair)
-        if not bResult:
-            data.status = "error"
+    # Let the worker do the actual repair
+    oJob = Job.enqueue("repair", {'repair': oRepair.id})
+    data['job'] = oJob.id
 
     # Return this response
     return JsonResponse(data)
@@ -402,6 +326,10 @@ def do_repair_progress(request):
         if qs != None and len(qs) > 0:
             oRepair = qs[0]
             data['status'] = oRepair.status
+            # Rows/sec, ETA and time per phase
+            data['progress'] = Progress.get_snapshot(oRepair)
+            # Is the job still going on?
+            data['busy'] = Job.is_pending("repair", "repair", oRepair.id)
     except:
         data['status'] = 'skipping a beat (repair_progress)'
 
@@ -427,6 +355,17 @@ def import_csv_start(request):
             else:
                 bUseDbase = False
 
+        # Bulk mode: only possible in combination with the database
+        bBulk = (request.GET.get('bulk', "") == "true")
+
+        # Delta mode: only change what differs from the database (also for files processed before)
+        bDelta = (request.GET.get('delta', "") == "true")
+
+        # The format of the fixture output
+        sFixFormat = request.GET.get('fixformat', "indent")
+        if not sFixFormat in ["indent", "compact", "gzip"]:
+            sFixFormat = "indent"
+
         # Get the id of the Info object
         if iSectie==None or iSectie == "":
             info = Info.objects.filter(deel=iDeel, aflnum=iAflnum).first()
@@ -437,24 +376,28 @@ def import_csv_start(request):
             data['status'] = 'error: no Info object found'
             return JsonResponse(data)
 
+        # An import that is waiting or running for this info may not be disturbed
+        if Job.is_pending("import", "info", info.id):
+            data['status'] = 'error: this file is already being imported'
+            return JsonResponse(data)
+
         # Remove any previous status objects for this info
         Status.objects.filter(info=info).delete()
 
         # Create a new import-status object
         oStatus = Status(info=info)
 
-        # Note that we are starting
-        oStatus.set_status("starting")
+        # Note that we are waiting for the worker
+        oStatus.set_status("queued")
         iStatus = oStatus.id
-        # oCsvImport['status'] = "starting"
-
-        # Call the process
-        oResult = csv_to_fixture(sFile, iDeel, iSectie, iAflnum, iStatus, bUseDbase = bUseDbase, bUseOld = True)
-        if oResult == None or oResult['result'] == False:
-            data['status'] = 'error'
 
-        # WSince we are done: explicitly set the status so
-        oStatus.set_status("done")
+        # Let the worker call the process: csv_to_fixture()
+        oJob = Job.enqueue("import", {'info': info.id, 'status': iStatus, 'filename': sFile,
+                                      'deel': iDeel, 'sectie': iSectie, 'aflnum': iAflnum,
+                                      'usedbase': bUseDbase, 'bulk': bBulk, 'fixformat': sFixFormat,
+                                      'delta': bDelta})
+        data['status'] = 'queued'
+        data['job'] = oJob.id
     except Exception as ex:
         oErr.DoError("import_csv_start error")
         data['status'] = "error"
@@ -491,6 +434,8 @@ def import_csv_progress(request):
             data['skipped'] = oStatus.skipped
             data['method'] = oStatus.method
             data['status'] = oStatus.status
+            # Rows/sec, ETA and time per phase
+            data['progress'] = Progress.get_snapshot(oStatus)
             # Checking...
             if data['status'] == "idle":
                 data['msg'] = "Idle status in import_csv_progress"
@@ -520,20 +465,36 @@ def import_kloeke_info():
         with open(file, "r", encoding="utf-8") as fd:
             lKloekeInfo = json.load(fd)
 
+        # The existing coordinates and dialects per kloeke code, folded the way [__iexact] does
+        #   (the first one is the one that [filter().first()] would give)
+        dicCoordinate = {}
+        for obj in Coordinate.objects.order_by('id'):
+            dicCoordinate.setdefault(fold_ascii(obj.kloeke), obj)
+        dicDialect = {}
+        for dialect in Dialect.objects.order_by('id'):
+            dicDialect.setdefault(fold_ascii(dialect.nieuw), dialect)
+
+        # Convert the coordinates of all new kloeke codes at once
+        lNew = [oInfo for oInfo in lKloekeInfo if fold_ascii(oInfo[1]) not in dicCoordinate]
+        lPhi, lLam = rd_to_wgs_batch([x[3] for x in lNew], [x[4] for x in lNew])
+        dicPoint = {}
+        for idx, oInfo in enumerate(lNew):
+            dicPoint.setdefault(fold_ascii(oInfo[1]), '{}, {}'.format(lPhi[idx], lLam[idx]))
+
         with transaction.atomic():
             for oInfo in lKloekeInfo:
                 # Each item contains 5 elements: id, kloeke, place, x, y
                 kloeke = oInfo[1]
-                obj = Coordinate.objects.filter(kloeke__iexact=kloeke).first()
+                sKey = fold_ascii(kloeke)
+                obj = dicCoordinate.get(sKey)
                 if obj == None:
                     place = oInfo[2]
-                    point_lst = rd_to_wgs(oInfo[3], oInfo[4])
-                    point = '{}, {}'.format(point_lst[0], point_lst[1])
-                    obj = Coordinate.objects.create(kloeke=kloeke, place=place, point=point)
+                    obj = Coordinate.objects.create(kloeke=kloeke, place=place, point=dicPoint[sKey])
+                    dicCoordinate[sKey] = obj
                 # Check if the link from [Dialect] has already been made
-                dialect = Dialect.objects.filter(nieuw__iexact=kloeke).first()
+                dialect = dicDialect.get(sKey)
                 if dialect != None:
-                    if dialect.coordinate == None:
+                    if dialect.coordinate_id == None:
                         dialect.coordinate = obj
                         dialect.save()
 
@@ -660,12 +621,14 @@ class TrefwoordListView(ListView):
     # paginate_by = paginateEntries
     paginate_by = paginateSize
     entrycount = 0
+    listcache = None    # The [ListCache] item of the current list
     bUseMijnen = True   # Limburg uses mijnen, Brabant not
     bWbdApproach = True # Filter using the WBD approach (this also applies for the revised WLD)
     qEntry = None
     qs = None
     bDoTime = False      # Measure time
     strict = True      # Use strict filtering
+    bCount = True      # Count the list when its count is not cached yet (the search API does not)
 
     def get_qs(self):
         if self.qEntry == None:
@@ -675,11 +638,21 @@ class TrefwoordListView(ListView):
                 # Get the PKs of Entry related to Trefwoord
                 qs = self.get_queryset()
             # Get the Entry queryset related to this
-            qs = Entry.objects.filter(trefwoord__pk__in=qs).select_related()
+            qs = EntryView.objects.filter(trefwoord__pk__in=qs.order_by().values('id'))
         else:
             qs = self.qEntry
         return qs
 
+    def get(self, request, *args, **kwargs):
+        """Serve the page from the page cache if it is there"""
+
+        sKey = get_page_key("trefwoord", request)
+        response = get_page(sKey)
+        if response == None:
+            response = super(TrefwoordListView, self).get(request, *args, **kwargs)
+            set_page(sKey, response)
+        return response
+
     def render_to_response(self, context, **response_kwargs):
         """Check if a CSV response is needed or not"""
 
@@ -785,8 +758,8 @@ class TrefwoordListView(ListView):
             context['app_prefix'] = APP_PREFIX
 
             # Set the afleveringen and mijnen that are available
-            context['afleveringen'] = [afl for afl in Aflevering.objects.all()]
-            context['mijnen'] = [mijn for mijn in Mijn.objects.all().order_by('naam')]
+            context['afleveringen'] = get_versioned("afleveringen", lambda: list(Aflevering.objects.select_related('deel')))
+            context['mijnen'] = get_versioned("mijnen", lambda: list(Mijn.objects.all().order_by('naam')))
 
             # Set the title of the application
             context['title'] = "{} trefwoorden".format(THIS_DICTIONARY)
@@ -828,7 +801,7 @@ class TrefwoordListView(ListView):
         html = []
         # Initialize the variables whose changes are important
         lVars = ["trefwoord_woord", "lemma_gloss", "toelichting", "dialectopgave", "dialect_stad"]
-        lFuns = [["trefwoord", "woord"], ["lemma", "gloss"], Entry.get_toelichting, Entry.dialectopgave, ["dialect", "stad"]]
+        lFuns = [["trefwoord_woord"], ["lemma_gloss"], EntryView.get_toelichting, EntryView.dialectopgave, ["dialect_stad"]]
         # Get a list of items containing 'first' and 'last' information
         lItem = get_item_list(lVars, lFuns, qs)
         # REturn this list
@@ -844,10 +817,10 @@ class TrefwoordListView(ListView):
         for entry in qs:
             qsd.append(entry)
         # Now sort the resulting set
-        qsd = sorted(qsd, key=lambda el: el.trefwoord.woord + " " + el.get_aflevering())
+        qsd = sorted(qsd, key=lambda el: el.trefwoord_woord + " " + el.get_aflevering())
         # Prepare for processing
         lVarsD = ["trefw", "afl"]
-        lFunsD = [["trefwoord", "woord"], Entry.get_aflevering]
+        lFunsD = [["trefwoord_woord"], EntryView.get_aflevering]
         # Create a list of the items
         lAfl = get_item_list(lVarsD, lFunsD, qsd)
         # Return the result
@@ -858,12 +831,17 @@ class TrefwoordListView(ListView):
         Paginate by specified value in querystring, or use default class property value.
         """
         return self.request.GET.get('paginate_by', self.paginate_by)
+
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        """Use the cached count and the page cursors of this list"""
+        return KeysetPaginator(queryset, per_page, self.listcache, orphans=orphans,
+                               allow_empty_first_page=allow_empty_first_page, **kwargs)
         
     def get_entryset(self, page_obj):
         lstQ = []
         bHasSearch = False
         bHasFilter = False
-        qse = Entry.objects.none()
+        qse = EntryView.objects.none()
         oErr = ErrHandle()
 
         try:
@@ -882,48 +860,44 @@ class TrefwoordListView(ListView):
 
                 # Check for aflevering being publishable
                 if self.strict:
-                    lstQ.append(Q(aflevering__toonbaar=True))
+                    lstQ.append(Q(toonbaar=True))
                 else:
                     lstQ.append(Q(entry__aflevering__toonbaar=True))
 
                 # Check for dialectwoord
                 if 'dialectwoord' in get and get['dialectwoord'] != '':
-                    val = adapt_search(get['dialectwoord'])
                     # Adapt Entry filter
                     if self.strict:
-                        lstQ.append(Q(woord__iregex=val))
+                        lstQ.append(search_q(EntryView, 'woord', get['dialectwoord']))
                     else:
-                        lstQ.append(Q(entry__woord__iregex=val))
+                        lstQ.append(search_q(EntryView, 'entry__woord', get['dialectwoord']))
                     bHasFilter = True
 
                 # Check for lemma
                 if 'lemma' in get and get['lemma'] != '':
-                    val = adapt_search(get['lemma'])
                     # Adapt Entry filter
                     if self.strict:
-                        lstQ.append(Q(lemma__gloss__iregex=val))
+                        lstQ.append(search_q(EntryView, 'lemma_gloss', get['lemma']))
                     else:
-                        lstQ.append(Q(entry__lemma__gloss__iregex=val))
+                        lstQ.append(search_q(EntryView, 'entry__lemma__gloss', get['lemma']))
                     bHasFilter = True
 
                 # Check for dialect city
                 if 'dialectCity' in get and get['dialectCity'] != '':
-                    val = adapt_search(get['dialectCity'])
                     # Adapt Entry filter
                     if self.strict:
-                        lstQ.append(Q(dialect__stad__iregex=val))
+                        lstQ.append(search_q(EntryView, 'dialect_stad', get['dialectCity']))
                     else:
-                        lstQ.append(Q(entry__dialect__stad__iregex=val))
+                        lstQ.append(search_q(EntryView, 'entry__dialect__stad', get['dialectCity']))
                     bHasFilter = True
 
                 # Check for dialect code (Kloeke)
                 if 'dialectCode' in get and get['dialectCode'] != '':
-                    val = adapt_search(get['dialectCode'])
                     # Adapt Entry filter
                     if self.strict:
-                        lstQ.append(Q(dialect__nieuw__iregex=val))
+                        lstQ.append(search_q(EntryView, 'dialect_nieuw', get['dialectCode']))
                     else:
-                        lstQ.append(Q(entry__dialect__nieuw__iregex=val))
+                        lstQ.append(search_q(EntryView, 'entry__dialect__nieuw', get['dialectCode']))
                     bHasFilter = True
 
                 # Check for aflevering
@@ -947,19 +921,19 @@ class TrefwoordListView(ListView):
                         iVal = int(val)
                         if iVal>0:
                             if self.strict:
-                                lstQ.append(Q(mijnlijst__id=iVal))
+                                lstQ.append(Q(entry__id__in=EntryMijn.objects.filter(mijn__id=iVal).values('entry_id')))
                             else:
                                 lstQ.append(Q(entry__mijnlijst__id=iVal))
                             bHasFilter = True
 
                 # Order: "trefwoord_woord", "lemma_gloss", "dialectopgave", "dialect_stad"
                 # Make sure we apply the filter
-                qse = Entry.objects.filter(*lstQ).distinct().select_related().order_by(
-                    Lower('trefwoord__woord'), 
-                    'lemma__gloss',  
-                    Lower('toelichting'),
-                    Lower('woord'), 
-                    Lower('dialect__stad'))
+                qse = EntryView.objects.filter(*lstQ).order_by(
+                    'trefwoord_key', 
+                    'lemma_gloss',  
+                    'toelichting_key',
+                    'woord_key', 
+                    'stad_key')
         except:
             msg = oErr.get_error_message()
             oErr.DoError("TrefwoordListView/get_queryset")
@@ -989,12 +963,7 @@ class TrefwoordListView(ListView):
             # Fine-tuning: search string is the LEMMA
             if 'search' in get and get['search'] != '':
                 val = strip_garbage( get['search'])
-                if '*' in val or '[' in val or '?' in val or '#' in val:
-                    val = adapt_search(val)
-                    lstQ.append(Q(woord__iregex=val) )
-                else:
-                    # Strive for equality, but disregard case
-                    lstQ.append(Q(woord__iexact=val))
+                lstQ.append(search_q(Trefwoord, 'woord', val))
                 #val = adapt_search(get['search'])
                 ## Use the 'woord' attribute of Trefwoord
                 #lstQ.append(Q(woord__iregex=val) )
@@ -1006,37 +975,32 @@ class TrefwoordListView(ListView):
 
             # Check for 'toelichting'
             if 'toelichting' in get and get['toelichting'] != '':
-                val = adapt_search(get['toelichting'])
                 # Try to get to the 'toelichting'
-                lstQ.append(Q(toelichting__iregex=val))
+                lstQ.append(search_q(Trefwoord, 'toelichting', get['toelichting']))
                 bHasSearch = True
 
             # Check for dialectwoord
             if 'dialectwoord' in get and get['dialectwoord'] != '':
-                val = adapt_search(get['dialectwoord'])
                 # Adapt Entry filter
-                lstQ.append(Q(entry__woord__iregex=val))
+                lstQ.append(search_q(Trefwoord, 'entry__woord', get['dialectwoord']))
                 bHasFilter = True
 
             # Check for lemma
             if 'lemma' in get and get['lemma'] != '':
-                val = adapt_search(get['lemma'])
                 # Adapt Entry filter
-                lstQ.append(Q(entry__lemma__gloss__iregex=val))
+                lstQ.append(search_q(Trefwoord, 'entry__lemma__gloss', get['lemma']))
                 bHasFilter = True
 
             # Check for dialect city
             if 'dialectCity' in get and get['dialectCity'] != '':
-                val = adapt_search(get['dialectCity'])
                 # Adapt Entry filter
-                lstQ.append(Q(entry__dialect__stad__iregex=val))
+                lstQ.append(search_q(Trefwoord, 'entry__dialect__stad', get['dialectCity']))
                 bHasFilter = True
 
             # Check for dialect code (Kloeke)
             if 'dialectCode' in get and get['dialectCode'] != '':
-                val = adapt_search(get['dialectCode'])
                 # Adapt Entry filter
-                lstQ.append(Q(entry__dialect__nieuw__iregex=val))
+                lstQ.append(search_q(Trefwoord, 'entry__dialect__nieuw', get['dialectCode']))
                 bHasFilter = True
 
             # Check for aflevering
@@ -1065,11 +1029,9 @@ class TrefwoordListView(ListView):
             # Debugging: mesaure time
             if self.bDoTime: iStart = get_now_time()
 
-            # Figure out which trefwoorden to exclude
-            trefwoord_exclude = Trefwoord.objects.filter(toonbaar=0)
-
-            # Create a QSE
-            qse = Trefwoord.objects.exclude(id__in=trefwoord_exclude).filter(*lstQ).select_related().order_by(Lower('woord')).distinct()
+            # Hidden trefwoorden are left out by their own [toonbaar] field, which needs no subquery
+            qse = Trefwoord.objects.exclude(toonbaar=0).filter(*lstQ).select_related().annotate(
+                sortkey=Lower('woord')).order_by('sortkey', 'id').distinct()
 
             # Debugging: time
             if self.bDoTime: 
@@ -1078,9 +1040,9 @@ class TrefwoordListView(ListView):
 
             # Note the number of ITEMS we have
             #   (The nature of these items depends on the approach taken)
-            # self.entrycount = qse.count()
-            # Using 'len' is faster since [qse] is being actually used again
-            self.entrycount = len(qse)
+            # The count is cached per filter, so that [qse] need not be loaded as a whole
+            self.listcache = ListCache.get_item("trefwoord", get, qse, self.bCount)
+            self.entrycount = None if self.listcache == None else self.listcache.count
 
             # Debugging: time
             if self.bDoTime: 
@@ -1105,6 +1067,7 @@ class LemmaListView(ListView):
     # paginate_by = paginateEntries
     paginate_by = paginateSize
     entrycount = 0
+    listcache = None    # The [ListCache] item of the current list
     bUseMijnen = True       # Limburg uses mijnen, Brabant not
     bWbdApproach = True     # Filter using the WBD approach
     bOrderWrdToel = False   # Use the word order 'dialectopgave-toelichting' if True
@@ -1112,6 +1075,7 @@ class LemmaListView(ListView):
     qEntry = None
     qs = None
     strict = True      # Use strict filtering ALWAYS
+    bCount = True      # Count the list when its count is not cached yet (the search API does not)
 
     def get_qs(self):
         """Get the Entry elements that are selected"""
@@ -1123,11 +1087,21 @@ class LemmaListView(ListView):
                 # Get the Lemma PKs
                 qs = self.get_queryset()
             # Get the Entry queryset related to this
-            qs = Entry.objects.filter(lemma__pk__in=qs).select_related()
+            qs = EntryView.objects.filter(lemma__pk__in=qs.order_by().values('id'))
         else:
             qs = self.qEntry
         return qs
 
+    def get(self, request, *args, **kwargs):
+        """Serve the page from the page cache if it is there"""
+
+        sKey = get_page_key("lemma", request)
+        response = get_page(sKey)
+        if response == None:
+            response = super(LemmaListView, self).get(request, *args, **kwargs)
+            set_page(sKey, response)
+        return response
+
     def render_to_response(self, context, **response_kwargs):
         """Check if a CSV response is needed or not"""
 
@@ -1279,8 +1253,8 @@ class LemmaListView(ListView):
             context['title'] = "{} begrippen".format(THIS_DICTIONARY)
 
             # Set the afleveringen that are available
-            context['afleveringen'] = [afl for afl in Aflevering.objects.all()]
-            context['mijnen'] = [mijn for mijn in Mijn.objects.all().order_by('naam')]
+            context['afleveringen'] = get_versioned("afleveringen", lambda: list(Aflevering.objects.select_related('deel')))
+            context['mijnen'] = get_versioned("mijnen", lambda: list(Mijn.objects.all().order_by('naam')))
 
             # Pass on the word-order boolean
             context['order_word_toel'] = self.bOrderWrdToel
@@ -1308,6 +1282,9 @@ class LemmaListView(ListView):
                     # Reset the time
                     iStart = get_now_time()
 
+                # The sorted descriptions of all lemma's on this page come with one query
+                dicDescr = Lemma.get_descrlists([item.id for item in context['page_obj'].object_list])
+
                 # Add the sorted-dialect information to lEntry
                 for idx, item in enumerate(lEntry):
                     # Start or Finish dialect information
@@ -1318,14 +1295,14 @@ class LemmaListView(ListView):
                     # All: add this entry
                     qsa.append(lAflev[idx])
                     # If not already present: add description
-                    iDescrId = item['entry'].descr.id
+                    iDescrId = item['entry'].descr_id
                     if iDescrId not in lemma_descr_list:
                         lemma_descr_list.append(iDescrId)
                     if item['lemma_gloss']['last']:
                         # COpy the list of Entry elements sorted by Lemma/Aflevering here
                         lEntry[idx]['alist'] = qsa
                         # OLD: lEntry[idx]['dlist'] = self.get_qdescr(item['entry'])
-                        lEntry[idx]['dlist'] = self.get_qdescrlist(lemma_descr_list)
+                        lEntry[idx]['dlist'] = self.get_qdescrlist(lemma_descr_list, dicDescr.get(item['entry'].lemma_id))
                     else:
                         lEntry[idx]['alist'] = None
                         lEntry[idx]['dlist'] = None
@@ -1354,10 +1331,10 @@ class LemmaListView(ListView):
         # Initialize the variables whose changes are important
         if self.bOrderWrdToel:
             lVars = ["lemma_gloss", "trefwoord_woord", "dialectopgave", "toelichting", "dialect_stad"]
-            lFuns = [["lemma", "gloss"], ["trefwoord", "woord"], Entry.dialectopgave, Entry.get_toelichting, ["dialect", "stad"]]
+            lFuns = [["lemma_gloss"], ["trefwoord_woord"], EntryView.dialectopgave, EntryView.get_toelichting, ["dialect_stad"]]
         else:
             lVars = ["lemma_gloss", "trefwoord_woord", "toelichting", "dialectopgave", "dialect_stad"]
-            lFuns = [["lemma", "gloss"], ["trefwoord", "woord"], Entry.get_toelichting, Entry.dialectopgave, ["dialect", "stad"]]
+            lFuns = [["lemma_gloss"], ["trefwoord_woord"], EntryView.get_toelichting, EntryView.dialectopgave, ["dialect_stad"]]
         # Get a list of items containing 'first' and 'last' information
         lItem = get_item_list(lVars, lFuns, qs)
         # REturn this list
@@ -1376,21 +1353,19 @@ class LemmaListView(ListView):
             id_list = [item.id for item in qs]
 
             # Create the correctly sorted queryset
-            qsd = Entry.objects.filter(Q(id__in=id_list)).select_related().order_by(
-                'lemma__gloss', 
-                'aflevering__deel__nummer', 
-                'aflevering__sectie', 
-                'aflevering__aflnum')
+            qsd = EntryView.objects.filter(Q(id__in=id_list)).order_by(
+                'lemma_gloss', 
+                'aflevering_key')
         else:
             # qsd = copy.copy(qs)
             # Force evaluation
             qsd = list(qs)
             # Now sort the resulting set
-            qsd = sorted(qsd, key=lambda el: (el.lemma.gloss, el.get_aflevering()) )
+            qsd = sorted(qsd, key=lambda el: (el.lemma_gloss, el.get_aflevering()) )
 
         # Prepare for processing
         lVarsD = ["lem", "afl"]
-        lFunsD = [["lemma", "gloss"], Entry.get_aflevering]
+        lFunsD = [["lemma_gloss"], EntryView.get_aflevering]
         # Create a list of the items
         lAfl = get_item_list(lVarsD, lFunsD, qsd)
         # Return the result
@@ -1412,11 +1387,19 @@ class LemmaListView(ListView):
         # Return the result
         return lDescr            
       
-    def get_qdescrlist(self, descr_id_list):
-        """Sort the paginated QS by Lemma/lmdescr.toelichting into a list"""
+    def get_qdescrlist(self, descr_id_list, lDescrList = None):
+        """Sort the paginated QS by Lemma/lmdescr.toelichting into a list
 
-        # Make a query that gets the indicated id's
-        qsd = Description.objects.filter(Q(id__in=descr_id_list)).order_by(Lower('toelichting'), Lower('bronnenlijst'))
+        [lDescrList] is the precomputed [Lemma.descrlist] of the lemma: it is already sorted,
+        and only needs to be reduced to the descriptions in [descr_id_list].
+        """
+
+        if lDescrList == None:
+            # Make a query that gets the indicated id's
+            qsd = Description.objects.filter(Q(id__in=descr_id_list)).order_by(Lower('toelichting'), Lower('bronnenlijst'))
+        else:
+            setId = set(descr_id_list)
+            qsd = [{'id': x[0], 'toelichting': x[1], 'bronnenlijst': x[2]} for x in lDescrList if x[0] in setId]
         # Prepare for processing
         lVarsD = ["descr", "bronnen"]
         lFunsD = [["toelichting"], ["bronnenlijst"]]
@@ -1430,12 +1413,17 @@ class LemmaListView(ListView):
         Paginate by specified value in querystring, or use default class property value.
         """
         return self.request.GET.get('paginate_by', self.paginate_by)
+
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        """Use the cached count and the page cursors of this list"""
+        return KeysetPaginator(queryset, per_page, self.listcache, orphans=orphans,
+                               allow_empty_first_page=allow_empty_first_page, **kwargs)
         
     def get_entryset(self, page_obj):
         lstQ = []
         bHasSearch = False
         bHasFilter = False
-        qse = Entry.objects.none()
+        qse = EntryView.objects.none()
         oErr = ErrHandle()
 
         try:
@@ -1456,29 +1444,26 @@ class LemmaListView(ListView):
 
             # Check for dialect city
             if 'dialectCity' in get and get['dialectCity'] != '':
-                val = adapt_search(get['dialectCity'])
                 if self.strict:
-                    lstQ.append(Q(dialect__stad__iregex=val))
+                    lstQ.append(search_q(EntryView, 'dialect_stad', get['dialectCity']))
                 else:
-                    lstQ.append(Q(entry__dialect__stad__iregex=val))
+                    lstQ.append(search_q(EntryView, 'entry__dialect__stad', get['dialectCity']))
                 bHasFilter = True
 
             # Check for dialect code (Kloeke)
             if 'dialectCode' in get and get['dialectCode'] != '':
-                val = adapt_search(get['dialectCode'])
                 if self.strict:
-                    lstQ.append(Q(dialect__nieuw__iregex=val))
+                    lstQ.append(search_q(EntryView, 'dialect_nieuw', get['dialectCode']))
                 else:
-                    lstQ.append(Q(entry__dialect__nieuw__iregex=val))
+                    lstQ.append(search_q(EntryView, 'entry__dialect__nieuw', get['dialectCode']))
                 bHasFilter = True
 
             # Check for dialect word, which is a direct member of Entry
             if 'woord' in get and get['woord'] != '':
-                val = adapt_search(get['woord'])
                 if self.strict:
-                    lstQ.append(Q(woord__iregex=val))
+                    lstQ.append(search_q(EntryView, 'woord', get['woord']))
                 else:
-                    lstQ.append(Q(entry__woord__iregex=val))
+                    lstQ.append(search_q(EntryView, 'entry__woord', get['woord']))
                 bHasFilter = True
 
             # Check for aflevering
@@ -1502,14 +1487,14 @@ class LemmaListView(ListView):
                     iVal = int(val)
                     if iVal>0:
                         if self.strict:
-                            lstQ.append(Q(mijnlijst__id=iVal))
+                            lstQ.append(Q(entry__id__in=EntryMijn.objects.filter(mijn__id=iVal).values('entry_id')))
                         else:
                             lstQ.append(Q(entry__mijnlijst__id=iVal))
                         bHasFilter = True
 
             # Make sure we filter on aflevering.toonbaar
             if self.strict:
-                lstQ.append(Q(aflevering__toonbaar=True))
+                lstQ.append(Q(toonbaar=True))
             else:
                 lstQ.append(Q(entry__aflevering__toonbaar=True))
 
@@ -1519,19 +1504,19 @@ class LemmaListView(ListView):
             # Order: "lemma_gloss", "trefwoord_woord", "dialectopgave", "dialect_stad"
             if self.bDoTime: iStart = get_now_time()
             if self.bOrderWrdToel:
-                qse = Entry.objects.filter(*lstQ).distinct().select_related().order_by(
-                    Lower('lemma__gloss'),  
-                    Lower('trefwoord__woord'), 
-                    Lower('woord'), 
-                    Lower('toelichting'), 
-                    Lower('dialect__stad'))
+                qse = EntryView.objects.filter(*lstQ).order_by(
+                    'lemma_key',  
+                    'trefwoord_key', 
+                    'woord_key', 
+                    'toelichting_key', 
+                    'stad_key')
             else:
-                qse = Entry.objects.filter(*lstQ).distinct().select_related().order_by(
-                    Lower('lemma__gloss'),  
-                    Lower('trefwoord__woord'), 
-                    Lower('toelichting'), 
-                    Lower('woord'), 
-                    Lower('dialect__stad'))
+                qse = EntryView.objects.filter(*lstQ).order_by(
+                    'lemma_key',  
+                    'trefwoord_key', 
+                    'toelichting_key', 
+                    'woord_key', 
+                    'stad_key')
             if self.bDoTime: print("LemmaListView get_entryset part 3: {:.1f}".format(get_now_time() - iStart))
 
         except:
@@ -1564,12 +1549,7 @@ class LemmaListView(ListView):
             # Fine-tuning: search string is the LEMMA
             if 'search' in get and get['search'] != '':
                 val = strip_garbage(get['search'])
-                if '*' in val or '[' in val or '?' in val or '#' in val:
-                    val = adapt_search(val)
-                    lstQ.append(Q(gloss__iregex=val) )
-                else:
-                    # Strive for equality, but disregard case
-                    lstQ.append(Q(gloss__iexact=val))
+                lstQ.append(search_q(Lemma, 'gloss', val))
                 bHasSearch = True
 
                 ## check for possible exact numbers having been given
@@ -1579,30 +1559,18 @@ class LemmaListView(ListView):
             # Check for dialect city
             if 'dialectCity' in get and get['dialectCity'] != '':
                 val = get['dialectCity']
-                if '*' in val or '[' in val or '?' in val or '#' in val:
-                    # val = adapt_search(get['dialectCity'])
-                    val = adapt_search(val)
-                    lstQ.append(Q(entry__dialect__stad__iregex=val))
-                else:
-                    # Strive for equality, but disregard case
-                    lstQ.append(Q(entry__dialect__stad__iexact=val))
+                lstQ.append(search_q(Lemma, 'entry__dialect__stad', val))
                 bHasFilter = True
 
             # Check for dialect code (Kloeke)
             if 'dialectCode' in get and get['dialectCode'] != '':
                 val = get['dialectCode']
-                if '*' in val or '[' in val or '?' in val or '#' in val:
-                    val = adapt_search(val)
-                    lstQ.append(Q(entry__dialect__nieuw__iregex=val))
-                else:
-                    # Strive for equality, but disregard case
-                    lstQ.append(Q(entry__dialect__nieuw__iexact=val))
+                lstQ.append(search_q(Lemma, 'entry__dialect__nieuw', val))
                 bHasFilter = True
 
             # Check for dialect word, which is a direct member of Entry
             if 'woord' in get and get['woord'] != '':
-                val = adapt_search(get['woord'])
-                lstQ.append(Q(entry__woord__iregex=val))
+                lstQ.append(search_q(Lemma, 'entry__woord', get['woord']))
                 bHasFilter = True
 
             # Check for aflevering
@@ -1625,10 +1593,9 @@ class LemmaListView(ListView):
                         lstQ.append(Q(entry__mijnlijst__id=iVal))
                         bHasFilter = True
 
-            # Method #8 -- use the lemma.toonbaar property
-            lemma_hide = Lemma.objects.filter(toonbaar=0)
-
-            qse = Lemma.objects.exclude(id__in=lemma_hide).filter(*lstQ).select_related().order_by('gloss').distinct()
+            # Hidden lemma's are left out by their own [toonbaar] field, which needs no subquery
+            qse = Lemma.objects.exclude(toonbaar=0).filter(*lstQ).select_related().defer('descrlist').annotate(
+                sortkey=F('gloss')).order_by('sortkey', 'id').distinct()
 
             # Time measurement
             if self.bDoTime:
@@ -1637,9 +1604,9 @@ class LemmaListView(ListView):
 
             # Note the number of ITEMS we have
             #   (The nature of these items depends on the approach taken)
-            # self.entrycount = qse.count()
-            # Note: while taking more time here, it saves time later
-            self.entrycount = len(qse)
+            # The count is cached per filter, so that [qse] need not be loaded as a whole
+            self.listcache = ListCache.get_item("lemma", get, qse, self.bCount)
+            self.entrycount = None if self.listcache == None else self.listcache.count
 
             # Time measurement
             if self.bDoTime:
@@ -1662,6 +1629,10 @@ class LemmaMapView(MapView):
     frmSearch = LemmaSearchForm
     order_by = ["trefwoord"]
     labelfield = "gloss"
+    geo_fields = ["trefwoord", "woord", "kloeke", "stad"]
+    popup_type = "lemma"
+    bbox_lat = "dialect__coordinate__latitude"
+    bbox_lng = "dialect__coordinate__longitude"
 
     def initialize(self):
         super(LemmaMapView, self).initialize()
@@ -1691,8 +1662,16 @@ class LemmaMineMapView(MapView):
     model = Lemma
     modEntry = Entry
     frmSearch = LemmaSearchForm
-    order_by = ["trefwoord"]
+    # Grouped query: ordering on [trefwoord] (its id) would add it to the GROUP BY
+    order_by = ["trefwoord__woord"]
     labelfield = "gloss"
+    geo_fields = ["trefwoord", "woord", "place", "count"]
+    popup_type = "mine"
+    bbox_lat = "mijnlijst__latitude"
+    bbox_lng = "mijnlijst__longitude"
+    # One marker per word and mine, or per word and dialect location for entries without a mine
+    group_by = ["trefwoord", "woord", "mijn", "point", "place"]
+    group_expr = {"point": Coalesce('mijnlijst__point', 'dialect__coordinate__point')}
 
     def initialize(self):
         super(LemmaMineMapView, self).initialize()
@@ -1707,21 +1686,19 @@ class LemmaMineMapView(MapView):
         self.add_entry('trefwoord', 'str', 'trefwoord__woord')
         self.add_entry('point', 'str', 'mijnlijst__point')
         self.add_entry('place', 'str', 'mijnlijst__naam')
-        self.add_entry('alt_point', 'str', 'dialect__coordinate__point')
-        self.add_entry('alt_place', 'str', 'dialect__coordinate__place')
 
-    def get_count(self, oEntry, qs):
-        oErr = ErrHandle()
-        iCount = 1
-        try:
-            iCount = qs.filter(woord=oEntry['woord'], mijnlijst__id=oEntry['mijn']).count()
-            # Double check point
-            if oEntry['point'] is None:
-                oEntry['point'] = oEntry['alt_point']
-        except:
-            msg = oErr.get_error_message()
-            oErr.DoError("LemmaMineMapView/get_count")
-        return iCount
+    def get_latlng_expr(self):
+        # Entries are shown at their mine, or at their dialect location if they have no mine
+        return Coalesce('mijnlijst__latitude', 'dialect__coordinate__latitude'), \
+               Coalesce('mijnlijst__longitude', 'dialect__coordinate__longitude')
+
+    def get_bbox_q(self, lBox):
+        """Entries are shown at their mine, or at their dialect location if they have no mine"""
+
+        west, south, east, north = lBox
+        return Q(mijnlijst__latitude__range=(south, north), mijnlijst__longitude__range=(west, east)) | \
+               Q(mijnlijst__isnull=True, dialect__coordinate__latitude__range=(south, north),
+                 dialect__coordinate__longitude__range=(west, east))
 
     def get_popup(self, entry):
         """Create a popup from the 'key' values defined in [initialize()]"""
@@ -1732,7 +1709,7 @@ class LemmaMineMapView(MapView):
 
             pop_up = '<p class="h6">{}</p>'.format(entry['woord'])
             pop_up += '<hr style="border: 1px solid green" />'
-            sMijn = "" if entry['place'] == "" else "mijn {} - ".format(entry['place'])
+            sMijn = "" if entry['place'] in ["", None] else "mijn {} - ".format(entry['place'])
             sCount = "<b>{}</b>: ".format( entry.get("count", 1))
             pop_up += '<p style="font-size: smaller;"><span style="color: purple;">{}</span> {}</p>'.format(
                 sCount, sMijn)
@@ -1750,6 +1727,7 @@ class LocationListView(ListView):
     # paginate_by = paginateEntries # paginateSize
     paginate_by = paginateLocations    # Default pagination number SPECIFICALLY for dialects (1)
     entrycount = 0      # Number of items in queryset (whether Entry or Dialect!!)
+    listcache = None    # The [ListCache] item of the current list
     bUseMijnen = True   # Limburg uses mijnen, Brabant not, Gelderland neither
     bWbdApproach = True # Filter using the WBD approach
     bNewOrder = True    # Use the new order (see issue #22 of the RU-wld)
@@ -1757,6 +1735,7 @@ class LocationListView(ListView):
     qAll = None         # Ordered queryset of ALL
     qs = None           # Current queryset (for speeding up)
     strict = True       # Use strict filtering ALWAYS
+    bCount = True       # Count the list when its count is not cached yet (the search API does not)
     bDoTime = False      # Use timing to determine what goes fastest
 
     def get_qs(self):
@@ -1769,10 +1748,8 @@ class LocationListView(ListView):
             else:
                 # Calculate the  PKs
                 qs = self.get_queryset()
-            # Get the Entry elements that refer to the set of dialects
-            if not self.strict:
-                # Convert the [Dialect] elements in qs to [Entry] elements
-                qs = Entry.objects.filter(dialect__pk__in=qs).select_related()
+            # Convert the [Dialect] elements in qs to the [EntryView] elements that refer to them
+            qs = EntryView.objects.filter(dialect__pk__in=qs.order_by().values('id'))
         else:
             qs = self.qEntry
         return qs
@@ -1851,9 +1828,9 @@ class LocationListView(ListView):
                 iStart = get_now_time()
 
             # Set the afleveringen that are available
-            context['afleveringen'] = [afl for afl in Aflevering.objects.all()]
+            context['afleveringen'] = get_versioned("afleveringen", lambda: list(Aflevering.objects.select_related('deel')))
 
-            context['mijnen'] = [mijn for mijn in Mijn.objects.all().order_by('naam')]
+            context['mijnen'] = get_versioned("mijnen", lambda: list(Mijn.objects.all().order_by('naam')))
 
             if 'paginate_by' in initial:
                 context['paginateSize'] = int(initial['paginate_by'])
@@ -1957,7 +1934,7 @@ class LocationListView(ListView):
         html = []
         # Initialize the variables whose changes are important
         lVars = ["dialect_stad", "lemma_gloss", "trefwoord_woord","toelichting", "dialectopgave"]
-        lFuns = [["dialect", "stad"], ["lemma", "gloss"], ["trefwoord", "woord"], Entry.get_toelichting, Entry.dialectopgave]
+        lFuns = [["dialect_stad"], ["lemma_gloss"], ["trefwoord_woord"], EntryView.get_toelichting, EntryView.dialectopgave]
         # Get a list of items containing 'first' and 'last' information
         lItem = get_item_list(lVars, lFuns, qs)
         # REturn this list
@@ -1970,11 +1947,11 @@ class LocationListView(ListView):
         qs = context['object_list']
         qsd = list(qs)
         # Now sort the resulting set
-        qsd = sorted(qsd, key=lambda el: el.dialect.stad + " " + el.get_aflevering())
+        qsd = sorted(qsd, key=lambda el: el.dialect_stad + " " + el.get_aflevering())
 
         # Prepare for dialect processing
         lVarsD = ["stad", "afl"]
-        lFunsD = [["dialect", "stad"], Entry.get_aflevering]
+        lFunsD = [["dialect_stad"], EntryView.get_aflevering]
         # Create a list of Dialect items
         lDialect = get_item_list(lVarsD, lFunsD, qsd)
         # Return the result
@@ -1985,6 +1962,11 @@ class LocationListView(ListView):
         Paginate by specified value in querystring, or use default class property value.
         """
         return self.request.GET.get('paginate_by', self.paginate_by)
+
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        """Use the cached count and the page cursors of this list"""
+        return KeysetPaginator(queryset, per_page, self.listcache, orphans=orphans,
+                               allow_empty_first_page=allow_empty_first_page, **kwargs)
         
     def get_entryset(self, page_obj):
         lstQ = []
@@ -2001,7 +1983,7 @@ class LocationListView(ListView):
             lstQ.append(Q(dialect__id__in=dialect_list))
 
             # Make sure we filter on aflevering.toonbaar
-            lstQ.append(Q(aflevering__toonbaar=True))
+            lstQ.append(Q(toonbaar=True))
 
             # Time measurement
             if self.bDoTime:
@@ -2028,22 +2010,22 @@ class LocationListView(ListView):
                 if val.isdigit():
                     iVal = int(val)
                     if iVal>0:
-                        lstQ.append(Q(mijnlijst__id=iVal) )
+                        lstQ.append(Q(entry__id__in=EntryMijn.objects.filter(mijn__id=iVal).values('entry_id')) )
                         bHasFilter = True
 
             bUseLower = True
             if bUseLower:
-                qse = Entry.objects.filter(*lstQ).distinct().select_related().order_by(
-                    Lower('dialect__stad'),
-                    'lemma__gloss',  
-                    Lower('trefwoord__woord'), 
-                    Lower('toelichting'), 
-                    Lower('woord'))
+                qse = EntryView.objects.filter(*lstQ).order_by(
+                    'stad_key',
+                    'lemma_gloss',  
+                    'trefwoord_key', 
+                    'toelichting_key', 
+                    'woord_key')
             else:
-                qse = Entry.objects.filter(*lstQ).distinct().select_related().order_by(
-                    'dialect__stad',
-                    'lemma__gloss',  
-                    'trefwoord__woord', 
+                qse = EntryView.objects.filter(*lstQ).order_by(
+                    'dialect_stad',
+                    'lemma_gloss',  
+                    'trefwoord_woord', 
                     'toelichting', 
                     'woord')
 
@@ -2092,8 +2074,8 @@ class LocationListView(ListView):
             # Fine-tuning: search string is the STAD
             if 'search' in get and get['search'] != '':
                 val = strip_garbage( get['search'])
+                lstQ.append(search_q(Dialect, 'stad', val))
                 val = adapt_search(val)
-                lstQ.append(Q(stad__iregex=val) )
                 bHasSearch = True
 
                 # check for possible exact numbers having been given
@@ -2103,8 +2085,7 @@ class LocationListView(ListView):
 
             # Check for dialect code (Kloeke)
             if 'nieuw' in get and get['nieuw'] != '':
-                val = adapt_search(get['nieuw'])
-                lstQ.append(Q(nieuw__iregex=val) )
+                lstQ.append(search_q(Dialect, 'nieuw', get['nieuw']))
                 bHasSearch = True
 
             # Check for aflevering
@@ -2132,20 +2113,18 @@ class LocationListView(ListView):
                 print("LocationListView get_queryset point 'a': {:.1f}".format( get_now_time() - iStart))
                 iStart = get_now_time()
 
-            # Get a list of Dialects that should be excluded
-            dialect_hide = Dialect.objects.filter(toonbaar=0)
-
-            # Use the E-WBD approach: be efficient here
-            qs = Dialect.objects.exclude(id__in=dialect_hide).filter(*lstQ).distinct().select_related().order_by(Lower('stad'))
+            # Hidden dialects are left out by their own [toonbaar] field, which needs no subquery
+            qs = Dialect.objects.exclude(toonbaar=0).filter(*lstQ).distinct().select_related().annotate(
+                sortkey=Lower('stad')).order_by('sortkey', 'id')
 
             # Time measurement
             if self.bDoTime:
                 print("LocationListView get_queryset point 'c': {:.1f}".format( get_now_time() - iStart))
                 iStart = get_now_time()
 
-            # self.entrycount = qs.count()
-            # Using 'len' is faster since [qse] is being actually used again
-            self.entrycount = len(qs)
+            # The count is cached per filter, so that [qs] need not be loaded as a whole
+            self.listcache = ListCache.get_item("location", get, qs, self.bCount)
+            self.entrycount = None if self.listcache == None else self.listcache.count
 
             # Time measurement
             if self.bDoTime:
@@ -2167,6 +2146,7 @@ class DialectListView(ListView):
     paginate_by = 10
     template_name = 'dictionary/dialect_list.html'
     entrycount = 0
+    listcache = None    # The [ListCache] item of the current list
     bDoTime = False
     bImportKloekeInfo = False
 
@@ -2184,6 +2164,8 @@ class DialectListView(ListView):
                 import_kloeke_cumul()
                 # Another one-time call
                 import_kloeke_info()
+                # The coordinates of the maps have changed
+                bump_data_version()
 
             # Try to do repair
             if count_dialect > 0:
@@ -2211,6 +2193,9 @@ class DialectListView(ListView):
                             dialect.save()
                 count_after = Dialect.objects.filter(coordinate__isnull=True).count()
                 count_gain = count_dialect - count_after
+                if count_gain > 0:
+                    # Dialects have been put on the maps
+                    bump_data_version()
                 if self.bDoTime:
                     oErr.Status("Count before: {}, after: {}".format(count_dialect, count_after))
 
@@ -2249,6 +2234,11 @@ class DialectListView(ListView):
         Paginate by specified value in querystring, or use default class property value.
         """
         return self.request.GET.get('paginate_by', self.paginate_by)
+
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        """Use the cached count and the page cursors of this list"""
+        return KeysetPaginator(queryset, per_page, self.listcache, orphans=orphans,
+                               allow_empty_first_page=allow_empty_first_page, **kwargs)
         
     def get_queryset(self):
         oErr = ErrHandle()
@@ -2269,8 +2259,8 @@ class DialectListView(ListView):
             # Fine-tuning: search string is the LEMMA
             if 'search' in get and get['search'] != '':
                 val = strip_garbage( get['search'])
+                query = search_q(Dialect, 'stad', val)
                 val = adapt_search(val)
-                query = Q(stad__iregex=val) 
 
                 # check for possible exact numbers having been given
                 if re.match('^\d+$', val):
@@ -2281,14 +2271,13 @@ class DialectListView(ListView):
 
             # Check for dialect code (Kloeke)
             if 'nieuw' in get and get['nieuw'] != '':
-                val = adapt_search(get['nieuw'])
-                query = Q(nieuw__iregex=val)
+                query = search_q(Dialect, 'nieuw', get['nieuw'])
             
                 # Apply the filter
                 lstQ.append(query)
 
             # Calculate the final qs
-            qs = Dialect.objects.exclude(toonbaar=0).filter(*lstQ).order_by('stad').distinct()
+            qs = Dialect.objects.exclude(toonbaar=0).filter(*lstQ).annotate(sortkey=F('stad')).order_by('sortkey', 'id').distinct()
 
             # Time measurement
             if self.bDoTime:
@@ -2296,8 +2285,9 @@ class DialectListView(ListView):
                 print("DialectListView query: {}".format(qs.query))
                 iStart = get_now_time()
 
-            # Determine the length
-            self.entrycount = len(qs)
+            # Determine the length (cached per filter)
+            self.listcache = ListCache.get_item("dialect", get, qs)
+            self.entrycount = self.listcache.count
 
             # Time measurement
             if self.bDoTime:
@@ -2319,6 +2309,10 @@ class DialectMapView(MapView):
     order_by = ["coordinate__province", "stad"]
     use_object = False
     label = "Dialectplaatsen"
+    geo_fields = ["trefwoord", "stad", "kloeke", "count"]
+    popup_type = "dialect"
+    bbox_lat = "coordinate__latitude"
+    bbox_lng = "coordinate__longitude"
 
     def initialize(self):
         super(DialectMapView, self).initialize()
@@ -2571,9 +2565,9 @@ class MijnListView(ListView):
             # Fine-tuning: search string is the LEMMA
             if 'search' in get and get['search'] != '':
                 val = strip_garbage( get['search'])
-                val = adapt_search(val)
                 # The main search is on the NAME of the mine
-                query = Q(naam__iregex=val) 
+                query = search_q(Mijn, 'naam', val)
+                val = adapt_search(val)
 
                 # check for possible exact numbers having been given
                 if re.match('^\d+$', val):
@@ -2584,16 +2578,14 @@ class MijnListView(ListView):
 
             # Check for toelichting
             if 'toelichting' in get and get['toelichting'] != '':
-                val = adapt_search(get['toelichting'])
                 # query = Q(nieuw__istartswith=val)
-                query = Q(toelichting__iregex=val)
+                query = search_q(Mijn, 'toelichting', get['toelichting'])
                 qs = qs.filter(query)
 
             # Check for locatie
             if 'locatie' in get and get['locatie'] != '':
-                val = adapt_search(get['locatie'])
                 # query = Q(nieuw__istartswith=val)
-                query = Q(locatie__iregex=val)
+                query = search_q(Mijn, 'locatie', get['locatie'])
                 qs = qs.filter(query)
 
             # Make sure we only have distinct values
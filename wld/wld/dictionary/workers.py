@@ -0,0 +1,25 @@
+"""Worker processes for importing CSV files in parallel.
+
+The functions here are handed to a process pool by [csv_parse_parallel].
+They do not import the models at module level, since a freshly started
+worker process first needs to set up Django.
+
+"""
+
+
+def init_worker():
+    """Make sure Django has been set up within this worker process"""
+
+    import django
+    from django.apps import apps
+
+    if not apps.ready:
+        django.setup()
+
+
+def parse_csv_file(csv_file, bDoMijnen):
+    """Read, convert and check all lines of one CSV file"""
+
+    from wld.dictionary.models import csv_parse_file
+
+    return csv_parse_file(csv_file, bDoMijnen)
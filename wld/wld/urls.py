@@ -15,6 +15,7 @@ from wld.settings import APP_PREFIX
 
 # Imports for the app 'dictionary'
 import wld.dictionary.forms
+import wld.dictionary.listapi
 from wld.dictionary.views import *
 from wld.dictionary.adminviews import EntryListView, InfoListView
 
@@ -56,6 +57,8 @@ urlpatterns = [
     url(r'^location/search/$', LocationListView.as_view(), name='locationsearch'),
     url(r'^mines', MijnListView.as_view(), name='mines'),
     url(r'^mine/search/$', MijnListView.as_view(), name='minesearch'),
+    url(r'^api/search/(?P<kind>lemma|trefwoord|location)/$', wld.dictionary.listapi.search_api, name='api_search'),
+    url(r'^api/count/(?P<kind>lemma|trefwoord|location)/$', wld.dictionary.listapi.count_api, name='api_count'),
     url(r'^list/$', permission_required('dictionary.search_gloss')(EntryListView.as_view()), name='admin_entry_list'), 
     url(r'^dictionary/search/$', permission_required('dictionary.search_gloss')(EntryListView.as_view())),
     url(r'^entry/(?P<pk>\d+)', DictionaryDetailView.as_view(), name='output'),
@@ -174,3 +174,12 @@ class BlockedIpMiddleware(object):
         else:
             port = request.META['SERVER_PORT']
         return str(port)
+
+
+# Lowercase only A-Z: this is what [__iexact] does in SQLite
+ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+def fold_ascii(sValue):
+    """Fold the case of [sValue] the way SQLite's case-insensitive matching does"""
+
+    return sValue.translate(ASCII_LOWER)